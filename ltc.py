@@ -11,7 +11,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
-import pickle
+from zvt_zero_store import load_zero_store
+from zvt_pair_correlation import pair_correlation, PAIR_U_MAX, PAIR_NEIGHBOURS
+from zvt_spacing import spacing_statistics, GUE_SPACING_VARIANCE
 import os
 from datetime import datetime
 from scipy import stats
@@ -40,6 +42,53 @@ MATHEMATICAL_CONSTANTS = {
     'ln2': np.log(2),
 }
 
+# Resolução das curvas: com consultas por searchsorted o custo por ponto é O(log N)
+WEYL_POINTS = 5000        # Alturas T da curva N(T) entre 10 e 10^6
+ASYMPTOTIC_WINDOWS = 200  # Janelas logarítmicas da densidade entre 10 e 10^6
+
+
+class ZeroRanges:
+    """Consultas de faixa sobre os gammas ordenados (searchsorted + visões, sem máscaras)
+
+    closed indica quais extremos entram na faixa: 'both', 'left', 'right' ou 'neither'.
+    """
+
+    def __init__(self, gammas):
+        gammas = np.asarray(gammas)
+        if len(gammas) > 1 and np.any(gammas[1:] < gammas[:-1]):
+            gammas = np.sort(gammas)  # Só copia se o store não estiver em ordem
+        self.gammas = gammas
+
+    def __len__(self):
+        return len(self.gammas)
+
+    def count_at_most(self, T):
+        """N(T) = #{γ ≤ T}, vetorizado em T"""
+        return np.searchsorted(self.gammas, T, side='right')
+
+    def bounds(self, low, high, closed='both'):
+        """Índices [início, fim) dos zeros na faixa; low/high podem ser arrays"""
+        start = np.searchsorted(self.gammas, low, side='left' if closed in ('both', 'left') else 'right')
+        stop = np.searchsorted(self.gammas, high, side='right' if closed in ('both', 'right') else 'left')
+        return start, np.maximum(start, stop)
+
+    def count(self, low, high, closed='both'):
+        """Número de zeros na faixa, vetorizado"""
+        start, stop = self.bounds(low, high, closed)
+        return stop - start
+
+    def window(self, low, high, closed='both'):
+        """Visão (sem cópia) dos zeros na faixa"""
+        start, stop = self.bounds(low, high, closed)
+        return self.gammas[start:stop]
+
+    def histogram(self, edges):
+        """Contagens por bin como np.histogram: [a, b) e o último bin fechado"""
+        positions = np.searchsorted(self.gammas, edges, side='left')
+        positions[-1] = np.searchsorted(self.gammas, edges[-1], side='right')
+        return np.diff(positions)
+
+
 class ZVTLiteratureValidator:
     def __init__(self, cache_file="zeta_zeros_cache.pkl", results_dir="zvt_constants_results"):
         self.cache_file = cache_file
@@ -47,6 +96,7 @@ class ZVTLiteratureValidator:
         self.literature_dir = os.path.join(results_dir, "literature_comparison")
         self.zeros = None
         self.zeros_array = None  # Array de gammas para análise
+        self.ranges = None  # Consultas de faixa sobre zeros_array
         
         # Resultados da comparação
         self.density_analysis = {}
@@ -68,14 +118,14 @@ class ZVTLiteratureValidator:
         """Carrega zeros da função zeta"""
         print("\n📂 Carregando zeros da função zeta...")
         
-        if os.path.exists(self.cache_file):
-            with open(self.cache_file, 'rb') as f:
-                self.zeros = pickle.load(f)
-            
-            # Extrair apenas os valores gamma (parte imaginária)
-            self.zeros_array = np.array([gamma for n, gamma in self.zeros])
+        # Store colunar mapeado em memória (converte o pickle na primeira vez)
+        self.zeros = load_zero_store(self.cache_file)
+        if self.zeros is not None:
+            # Coluna de gammas (parte imaginária), ordenada e sem cópia
+            self.ranges = ZeroRanges(self.zeros.gammas)
+            self.zeros_array = self.ranges.gammas
             print(f"✅ {len(self.zeros):,} zeros carregados")
-            print(f"📊 Faixa: γ ∈ [{self.zeros_array.min():.1f}, {self.zeros_array.max():.1f}]")
+            print(f"📊 Faixa: γ ∈ [{self.zeros_array[0]:.1f}, {self.zeros_array[-1]:.1f}]")
             return True
         else:
             print("❌ Cache de zeros não encontrado!")
@@ -90,23 +140,16 @@ class ZVTLiteratureValidator:
             return T * np.log(T) / (2 * np.pi) - T / (2 * np.pi)
         
         # Calcular densidade observada vs teórica
-        T_values = np.logspace(1, 6, 50)  # De 10 a 10^6
-        observed_counts = []
-        theoretical_counts = []
-        
-        for T in T_values:
-            # Contar zeros até altura T
-            observed = np.sum(self.zeros_array <= T)
-            theoretical = weyl_function(T)
-            
-            observed_counts.append(observed)
-            theoretical_counts.append(theoretical)
+        T_values = np.logspace(1, 6, WEYL_POINTS)  # De 10 a 10^6
+        # Contar zeros até cada altura T de uma vez (busca binária nos gammas ordenados)
+        observed_counts = self.ranges.count_at_most(T_values)
+        theoretical_counts = weyl_function(T_values)
         
         self.density_analysis = {
             'T_values': T_values,
-            'observed': np.array(observed_counts),
-            'theoretical': np.array(theoretical_counts),
-            'relative_error': np.abs(np.array(observed_counts) - np.array(theoretical_counts)) / np.array(theoretical_counts)
+            'observed': observed_counts,
+            'theoretical': theoretical_counts,
+            'relative_error': np.abs(observed_counts - theoretical_counts) / theoretical_counts
         }
         
         # Verificar se nossa "escala especial" (~10^6) tem propriedades especiais na densidade
@@ -142,8 +185,7 @@ class ZVTLiteratureValidator:
         
         for region_start, region_end in regions:
             # Zeros nesta região
-            region_mask = (self.zeros_array >= region_start) & (self.zeros_array <= region_end)
-            region_zeros = self.zeros_array[region_mask]
+            region_zeros = self.ranges.window(region_start, region_end)
             
             if len(region_zeros) > 10:  # Mínimo para estatísticas
                 region_gaps = np.diff(region_zeros)
@@ -161,11 +203,22 @@ class ZVTLiteratureValidator:
                     'cv': np.std(region_gaps) / np.mean(region_gaps)  # Coeficiente de variação
                 })
         
+        # Distribuição dos gaps desdobrados por janela de altura, numa passada em memória fixa
+        distribution = spacing_statistics(self.zeros_array)
+        
         self.spacing_analysis = {
             'all_gaps': gaps,
-            'region_stats': spacing_stats
+            'region_stats': spacing_stats,
+            'distribution': distribution
         }
         
+        overall = distribution['all']
+        if overall['n_gaps'] > 1:
+            print(f"📊 Gaps desdobrados: média {overall['mean']:.4f}, variância {overall['variance']:.4f} "
+                  f"(GUE: {GUE_SPACING_VARIANCE:.4f})")
+            print(f"   KS vs Gaudin (GUE): {overall['ks']['gaudin'][0]:.5f} | "
+                  f"Wigner: {overall['ks']['wigner'][0]:.5f} | Poisson: {overall['ks']['poisson'][0]:.5f}")
+        
         # Análise específica da nossa região especial
         special_region = [s for s in spacing_stats if '1e+06' in s['region']]
         if special_region:
@@ -177,54 +230,44 @@ class ZVTLiteratureValidator:
             print(f"   Coef. variação: {special['cv']:.3f}")
         
     def analyze_correlations(self):
-        """Analisa correlações entre zeros (Montgomery-style)"""
+        """Analisa correlações entre zeros (correlação de pares de Montgomery)"""
         print("\n🔗 Analisando correlações entre zeros...")
         
-        # Análise de correlação de pares em diferentes escalas
+        # Correlação de pares de todos os zeros e de janelas ao redor de cada escala,
+        # numa única passada sobre os zeros desdobrados
         scales = [1000, 10000, 100000, 1000000]
+        windows = [(scale, scale/2, scale*2) for scale in scales]
+        pair_results = pair_correlation(self.zeros_array, windows)
         
-        correlation_results = []
+        overall = pair_results['all']
+        print(f"📊 Pares até u = {PAIR_U_MAX}: {overall['n_pairs']:,} (todos os {overall['n_zeros']:,} zeros)")
+        print(f"   Desvio RMS de 1 − (sin πu/πu)²: {overall['rms_deviation']:.4f}")
+        print(f"   χ² = {overall['chi2']:.1f} ({overall['dof']} bins), p = {overall['chi2_p_value']:.4f}")
         
-        for scale in scales:
-            # Selecionar região ao redor da escala
-            center_mask = (self.zeros_array >= scale/2) & (self.zeros_array <= scale*2)
-            scale_zeros = self.zeros_array[center_mask]
-            
-            if len(scale_zeros) > 100:
-                # Normalizar zeros para análise de correlação
-                normalized_zeros = scale_zeros / np.mean(scale_zeros)
-                
-                # Calcular função de correlação de pares
-                distances = []
-                for i in range(min(1000, len(normalized_zeros))):  # Amostra para velocidade
-                    for j in range(i+1, min(i+50, len(normalized_zeros))):
-                        distances.append(abs(normalized_zeros[j] - normalized_zeros[i]))
-                
-                # Estatísticas de correlação
-                correlation_results.append({
-                    'scale': scale,
-                    'n_zeros': len(scale_zeros),
-                    'mean_distance': np.mean(distances),
-                    'std_distance': np.std(distances),
-                    'distance_distribution': np.array(distances)
-                })
+        # Escalas com zeros suficientes para estatística
+        correlation_results = []
+        for result in pair_results['windows']:
+            if result['n_zeros'] > 100:
+                result['scale'] = result['label']
+                correlation_results.append(result)
         
-        self.correlation_analysis = correlation_results
+        self.correlation_analysis = {'all': overall, 'scales': correlation_results}
         
         # Verificar se região especial tem correlações diferentes
         special_corr = [c for c in correlation_results if c['scale'] == 1000000]
         if special_corr:
             special = special_corr[0]
             print(f"📊 Correlações na região especial (~10^6):")
-            print(f"   Distância média normalizada: {special['mean_distance']:.4f}")
-            print(f"   Desvio padrão: {special['std_distance']:.4f}")
+            print(f"   Desvio RMS de Montgomery: {special['rms_deviation']:.4f}")
+            print(f"   χ² = {special['chi2']:.1f}, p = {special['chi2_p_value']:.4f}")
     
     def analyze_asymptotic_behavior(self):
         """Analisa comportamento assintótico e propriedades em escala grande"""
         print("\n📈 Analisando comportamento assintótico...")
         
-        # Dividir em décadas logarítmicas
-        log_decades = np.logspace(1, 6, 25)  # 25 pontos de 10 a 10^6
+        # Dividir em janelas logarítmicas
+        log_decades = np.logspace(1, 6, ASYMPTOTIC_WINDOWS + 1)  # De 10 a 10^6
+        starts, stops = self.ranges.bounds(log_decades[:-1], log_decades[1:], closed='left')
         
         asymptotic_stats = []
         
@@ -233,8 +276,7 @@ class ZVTLiteratureValidator:
             decade_end = log_decades[i+1]
             
             # Zeros nesta década
-            decade_mask = (self.zeros_array >= decade_start) & (self.zeros_array < decade_end)
-            decade_zeros = self.zeros_array[decade_mask]
+            decade_zeros = self.zeros_array[starts[i]:stops[i]]
             
             if len(decade_zeros) > 5:
                 # Estatísticas desta década
@@ -273,20 +315,16 @@ class ZVTLiteratureValidator:
         # 1. Teste da "escala energética especial"
         special_region = (800000, 1200000)  # ±20% ao redor de 10^6
         
-        special_mask = (self.zeros_array >= special_region[0]) & (self.zeros_array <= special_region[1])
-        special_zeros = self.zeros_array[special_mask]
+        n_special = self.ranges.count(*special_region)
         
         # Comparar densidade nesta região com regiões adjacentes
-        before_mask = (self.zeros_array >= 400000) & (self.zeros_array < 800000)
-        after_mask = (self.zeros_array > 1200000) & (self.zeros_array <= 2000000)
-        
-        before_zeros = self.zeros_array[before_mask]
-        after_zeros = self.zeros_array[after_mask]
+        n_before = self.ranges.count(400000, 800000, closed='left')
+        n_after = self.ranges.count(1200000, 2000000, closed='right')
         
         # Densidades normalizadas
-        special_density = len(special_zeros) / (special_region[1] - special_region[0])
-        before_density = len(before_zeros) / 400000 if len(before_zeros) > 0 else 0
-        after_density = len(after_zeros) / 800000 if len(after_zeros) > 0 else 0
+        special_density = n_special / (special_region[1] - special_region[0])
+        before_density = n_before / 400000 if n_before > 0 else 0
+        after_density = n_after / 800000 if n_after > 0 else 0
         
         print(f"🎯 Teste da escala especial (~10^6):")
         print(f"   Densidade antes (4e5-8e5): {before_density:.6f}")
@@ -298,8 +336,8 @@ class ZVTLiteratureValidator:
         
         # Dividir em bins pequenos e procurar concentrações
         n_bins = 1000
-        bin_edges = np.linspace(self.zeros_array.min(), self.zeros_array.max(), n_bins+1)
-        hist, _ = np.histogram(self.zeros_array, bins=bin_edges)
+        bin_edges = np.linspace(self.zeros_array[0], self.zeros_array[-1], n_bins+1)
+        hist = self.ranges.histogram(bin_edges)
         
         # Estatísticas de concentração
         concentration_stats = {
@@ -390,7 +428,7 @@ class ZVTLiteratureValidator:
         # 5. Distribuição de zeros (histograma)
         ax5 = plt.subplot(3, 3, 5)
         # Usar escala log para melhor visualização
-        log_zeros = np.log10(self.zeros_array[self.zeros_array > 0])
+        log_zeros = np.log10(self.ranges.window(0, np.inf, closed='right'))
         ax5.hist(log_zeros, bins=50, alpha=0.7, density=True, color='skyblue', edgecolor='black')
         ax5.axvline(6, color='orange', linestyle=':', label='Log₁₀(10⁶)', linewidth=3)
         ax5.set_xlabel('Log₁₀(γ)')
@@ -401,7 +439,7 @@ class ZVTLiteratureValidator:
         
         # 6. Análise de concentração (zoom na região especial)
         ax6 = plt.subplot(3, 3, 6)
-        special_region_zeros = self.zeros_array[(self.zeros_array >= 5e5) & (self.zeros_array <= 1.5e6)]
+        special_region_zeros = self.ranges.window(5e5, 1.5e6)
         if len(special_region_zeros) > 0:
             ax6.hist(special_region_zeros, bins=30, alpha=0.7, color='lightcoral', edgecolor='black')
             ax6.axvline(1e6, color='orange', linestyle=':', label='Escala Especial', linewidth=3)
@@ -414,14 +452,17 @@ class ZVTLiteratureValidator:
         # 7-9. Análises de correlação e gaps
         if self.correlation_analysis:
             ax7 = plt.subplot(3, 3, 7)
-            scales = [c['scale'] for c in self.correlation_analysis]
-            mean_dists = [c['mean_distance'] for c in self.correlation_analysis]
+            overall = self.correlation_analysis['all']
             
-            ax7.semilogx(scales, mean_dists, 'yo-', linewidth=2, markersize=8)
-            ax7.axvline(1e6, color='orange', linestyle=':', label='Escala Especial', linewidth=2)
-            ax7.set_xlabel('Escala')
-            ax7.set_ylabel('Distância Média Normalizada')
-            ax7.set_title('Correlações entre Zeros')
+            ax7.plot(overall['centers'], overall['r2'], 'yo-', linewidth=2, markersize=4, label='Todos os zeros')
+            special_corr = [c for c in self.correlation_analysis['scales'] if c['scale'] == 1000000]
+            if special_corr:
+                ax7.plot(special_corr[0]['centers'], special_corr[0]['r2'], '.', color='orange',
+                         alpha=0.7, label='Escala Especial')
+            ax7.plot(overall['centers'], overall['montgomery'], 'r--', linewidth=2, label='1 − (sin πu/πu)²')
+            ax7.set_xlabel('Distância desdobrada u')
+            ax7.set_ylabel('R₂(u)')
+            ax7.set_title('Correlação de Pares (Montgomery)')
             ax7.legend()
             ax7.grid(True, alpha=0.3)
         
@@ -454,7 +495,7 @@ Lei de Weyl:
 • Erro na escala especial: {self.density_analysis['relative_error'][np.argmin(np.abs(self.density_analysis['T_values'] - 1e6))]:.4f}
 
 Escala Especial (~10⁶):
-• Zeros na região: {len(self.zeros_array[(self.zeros_array >= 8e5) & (self.zeros_array <= 1.2e6)])}
+• Zeros na região: {self.ranges.count(8e5, 1.2e6)}
 • Densidade observada vs esperada
 
 Propriedades Descobertas:
@@ -489,7 +530,7 @@ Propriedades Descobertas:
             f.write("="*80 + "\n\n")
             f.write(f"Data: {datetime.now().isoformat()}\n")
             f.write(f"Zeros analisados: {len(self.zeros):,}\n")
-            f.write(f"Faixa: γ ∈ [{self.zeros_array.min():.1f}, {self.zeros_array.max():.1f}]\n\n")
+            f.write(f"Faixa: γ ∈ [{self.zeros_array[0]:.1f}, {self.zeros_array[-1]:.1f}]\n\n")
             
             f.write("DESCOBERTAS TESTADAS:\n")
             f.write("-" * 50 + "\n")
@@ -547,6 +588,45 @@ Propriedades Descobertas:
                         f.write("   ⚠ Densidade REDUZIDA na região especial\n")
             f.write("\n")
             
+            # Correlação de pares
+            f.write("4. CORRELAÇÃO DE PARES (R₂(u) = 1 − (sin πu/πu)², MONTGOMERY):\n")
+            if self.correlation_analysis:
+                overall = self.correlation_analysis['all']
+                f.write(f"   • Pares com u < {PAIR_U_MAX}: {overall['n_pairs']:,} ({overall['n_zeros']:,} zeros desdobrados)\n")
+                f.write(f"   • Desvio RMS global: {overall['rms_deviation']:.4f}\n")
+                f.write(f"   • χ² global: {overall['chi2']:.1f} ({overall['dof']} bins), p = {overall['chi2_p_value']:.4g}\n")
+                for scale_result in self.correlation_analysis['scales']:
+                    f.write(f"   • Escala {scale_result['scale']:.0e}: {scale_result['n_zeros']:,} zeros, "
+                            f"desvio RMS {scale_result['rms_deviation']:.4f}\n")
+                if overall['truncated_fraction'] > 0:
+                    f.write(f"   ⚠ {overall['truncated_fraction']:.2e} dos pares além de {PAIR_NEIGHBOURS} vizinhos\n")
+                if overall['rms_deviation'] < 0.05:
+                    f.write("   ✓ Correlação de pares CONFORME com Montgomery (GUE)\n")
+                else:
+                    f.write("   ⚠ Correlação de pares DESVIA de Montgomery\n")
+            f.write("\n")
+            
+            # Distribuição de espaçamentos
+            f.write("5. DISTRIBUIÇÃO DE ESPAÇAMENTOS (GUE, GAUDIN):\n")
+            distribution = self.spacing_analysis.get('distribution')
+            if distribution and distribution['all']['n_gaps'] > 1:
+                overall = distribution['all']
+                f.write(f"   • Gaps desdobrados: {overall['n_gaps']:,}, média {overall['mean']:.4f}, "
+                        f"variância {overall['variance']:.4f} (GUE: {GUE_SPACING_VARIANCE:.4f})\n")
+                f.write(f"   • KS Gaudin: {overall['ks']['gaudin'][0]:.5f}, Wigner: {overall['ks']['wigner'][0]:.5f}, "
+                        f"Poisson: {overall['ks']['poisson'][0]:.5f}\n")
+                f.write(f"   • χ² Gaudin: {overall['chi2']:.1f} ({overall['dof']} gl), p = {overall['chi2_p_value']:.4g}\n")
+                f.write("   • Por janela de altura (γ, gaps, variância, KS Gaudin):\n")
+                for window in distribution['windows']:
+                    if window['n_gaps'] > 1:
+                        f.write(f"     {window['low']:.1e}-{window['high']:.1e}: {window['n_gaps']:,}, "
+                                f"{window['variance']:.4f}, {window['ks']['gaudin'][0]:.5f}\n")
+                if overall['ks']['gaudin'][0] < overall['ks']['poisson'][0] / 10:
+                    f.write("   ✓ Espaçamentos seguem a estatística do GUE (repulsão de níveis)\n")
+                else:
+                    f.write("   ⚠ Espaçamentos NÃO seguem a estatística do GUE\n")
+            f.write("\n")
+            
             # Testes específicos das descobertas
             f.write("VALIDAÇÃO DAS DESCOBERTAS ESPECÍFICAS:\n")
             f.write("-" * 50 + "\n")
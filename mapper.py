@@ -11,7 +11,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
-import pickle
+from zvt_zero_store import load_zero_store
+from zvt_kernels import zeros_as_arrays, best_resonances
 import os
 import json
 from datetime import datetime
@@ -91,9 +92,9 @@ class ZVTDataMapper:
         print("📂 Carregando dados...")
         
         # Carregar zeros do cache
-        if os.path.exists(self.cache_file):
-            with open(self.cache_file, 'rb') as f:
-                self.zeros = pickle.load(f)
+        # Store colunar mapeado em memória (converte o pickle na primeira vez)
+        self.zeros = load_zero_store(self.cache_file)
+        if self.zeros is not None:
             print(f"✅ {len(self.zeros):,} zeros carregados do cache")
         else:
             print("❌ Cache não encontrado!")
@@ -109,33 +110,30 @@ class ZVTDataMapper:
         
         resonances_data = []
         
-        # Para cada constante, encontrar sua melhor ressonância
-        for const_name, const_value in FUNDAMENTAL_FORCES.items():
-            best_quality = float('inf')
-            best_resonance = None
+        # Melhor ressonância de todas as constantes em uma única chamada vetorizada
+        indices, gammas = zeros_as_arrays(self.zeros)
+        if len(gammas) > 0:
+            const_values = np.array(list(FUNDAMENTAL_FORCES.values()))
+            best_qualities, best_positions = best_resonances(gammas, const_values)
             
-            # Buscar melhor ressonância para esta constante
-            for n, gamma in self.zeros:
-                mod_val = gamma % const_value
-                min_distance = min(mod_val, const_value - mod_val)
-                
-                if min_distance < best_quality:
-                    best_quality = min_distance
-                    best_resonance = {
-                        'constant': const_name,
-                        'constant_value': const_value,
-                        'zero_index': n,
-                        'gamma': gamma,
-                        'quality': min_distance,
-                        'error_percent': (min_distance / const_value) * 100,
-                        'energy_gev': gamma / 10,
-                        'log_quality': np.log10(min_distance),
-                        'log_constant': np.log10(const_value),
-                        'category': self.get_category(const_name)
-                    }
-            
-            if best_resonance:
-                resonances_data.append(best_resonance)
+            for (const_name, const_value), min_distance, position in zip(
+                    FUNDAMENTAL_FORCES.items(), best_qualities.tolist(), best_positions.tolist()):
+                if position < 0:  # Abaixo do limite de resolução dos zeros: sem ressonância resolvida
+                    print(f"⚠️ {const_name}: abaixo do limite de resolução dos zeros, não resolvida")
+                    continue
+                gamma = float(gammas[position])
+                resonances_data.append({
+                    'constant': const_name,
+                    'constant_value': const_value,
+                    'zero_index': int(indices[position]),
+                    'gamma': gamma,
+                    'quality': min_distance,
+                    'error_percent': (min_distance / const_value) * 100,
+                    'energy_gev': gamma / 10,
+                    'log_quality': np.log10(min_distance),
+                    'log_constant': np.log10(const_value),
+                    'category': self.get_category(const_name)
+                })
         
         self.resonances_df = pd.DataFrame(resonances_data)
         print(f"✅ DataFrame construído com {len(self.resonances_df)} ressonâncias")
@@ -11,8 +11,15 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
-import pickle
+from zvt_zero_store import load_zero_store, shared_zeros
+from zvt_kernels import zeros_as_arrays, best_resonances, resolution_limit
+from zvt_statistics import EmpiricalNull, CONFIDENCE_LEVEL, interval_clear_of
+from zvt_null_model import (monte_carlo_quality_cdf, best_error_p_value, best_quality_p_value,
+                            look_elsewhere, cross_validate)
+from zvt_random import root_seed_sequence, stream_generator, simulation_blocks, locate_simulation, int_option
+from zvt_tail_sampling import tail_p_value, TAIL_STREAM
 import os
+import sys
 from datetime import datetime
 from scipy import stats
 from concurrent.futures import ProcessPoolExecutor, as_completed
@@ -48,6 +55,20 @@ REAL_CONSTANTS = {
     'magnetic_moment_ratio': 3.1524512605
 }
 
+# Simulações em lotes vetorizados
+MC_BATCH_SIZE = 250  # Simulações por tarefa (matriz 250 × 19 constantes, um Generator por bloco)
+MC_TILE = 1 << 20  # Elementos (constantes × zeros) por bloco ≈ 8 MB, dentro do cache L3
+RANDOM_LOG_MIN, RANDOM_LOG_MAX = -50, 4  # Escalas das constantes aleatórias (log-uniforme)
+PERCENTILES = [1, 5, 10, 25, 50, 75, 90, 95, 99]
+P_VALUE_ORIGINS = {'monte_carlo': 'MC', 'importance': 'cauda IS', 'analytic': 'analítico'}  # Coluna Origem do relatório
+
+# Modo adaptativo (--adaptive): rodadas crescentes até o IC de cada p-value sair dos limiares
+SIGNIFICANCE_THRESHOLDS = (0.001, 0.01, 0.05)  # Os mesmos dos rótulos ***/**/*
+ADAPTIVE_FIRST_ROUND = 500  # Simulações da primeira rodada; cada rodada dobra o total
+ADAPTIVE_MAX_SIMULATIONS = 100000
+SUMMARY_KEYS = ('simulation_id', 'best_quality', 'mean_quality', 'best_error_percent', 'mean_error_percent',
+                'n_shortcut', 'evaluated_quality', 'evaluated_error_percent')
+
 # Resultados reais para comparação (da análise anterior)
 REAL_RESULTS = {
     'gravitacional': {'quality': 1.691571e-45, 'error_percent': 0.000028641562},
@@ -62,18 +83,89 @@ REAL_RESULTS = {
     'euler_mascheroni': {'quality': 5.600674e-08, 'error_percent': 0.000009702914}
 }
 
+def significance_label(p_value):
+    """Rótulo ***/**/*/n.s. de um p-value"""
+    if p_value < 0.001:
+        return "***"  # Extremamente significativo
+    elif p_value < 0.01:
+        return "**"   # Muito significativo
+    elif p_value < 0.05:
+        return "*"    # Significativo
+    return "n.s."     # Não significativo
+
+
+def simulation_draws(entropy, block_index, n_simulations, n_constants):
+    """Sorteios de um bloco: constantes log-uniformes e uniformes das estatísticas de ordem
+
+    Tudo é sorteado antes da avaliação, então a linha i depende só de (entropia,
+    bloco, i) e uma simulação pode ser refeita sem avaliar o bloco inteiro.
+    """
+    rng = stream_generator(entropy, block_index)
+    constants = 10.0 ** rng.uniform(RANDOM_LOG_MIN, RANDOM_LOG_MAX, size=(n_simulations, n_constants))
+    uniforms = rng.random((n_simulations, n_constants))
+    return constants, uniforms
+
+
+def best_quality_matrix(gammas, constants, uniforms):
+    """Melhor resíduo dobrado de cada constante da matriz, avaliado sobre os zeros
+
+    Constantes abaixo do limite de resolução dos gammas (resolution_limit: o passo
+    decimal, c < 10⁻⁹ em zero.txt, ou γ_max/2⁵³) não são resolvidas pelos dados:
+    o mínimo é sorteado da estatística de ordem, c·(1 − V^(1/N))/2. Devolve
+    (qualidades, sorteadas).
+    """
+    qualities = np.empty(constants.shape)
+    drawn = constants < resolution_limit(gammas)
+    if drawn.any():
+        qualities[drawn] = constants[drawn] * -np.expm1(np.log(uniforms[drawn]) / len(gammas)) / 2
+    qualities[~drawn] = best_resonances(gammas, constants[~drawn], MC_TILE)[0]
+    return qualities, drawn
+
+
+def simulate_batch(zeros, entropy, block_index, first_id, n_simulations, n_constants):
+    """Lote de simulações Monte Carlo; devolve só os arrays de resumo por simulação
+
+    evaluated_quality/evaluated_error_percent guardam cada constante (simulações ×
+    constantes), com NaN nas sorteadas da estatística de ordem, para a validação
+    cruzada com a nula analítica.
+    """
+    _, gammas = zeros_as_arrays(zeros)
+    constants, uniforms = simulation_draws(entropy, block_index, n_simulations, n_constants)
+    qualities, drawn = best_quality_matrix(gammas, constants, uniforms)
+    errors = qualities / constants * 100
+    return {
+        'simulation_id': np.arange(first_id, first_id + n_simulations),
+        'best_quality': qualities.min(axis=1),
+        'mean_quality': qualities.mean(axis=1),
+        'best_error_percent': errors.min(axis=1),
+        'mean_error_percent': errors.mean(axis=1),
+        'n_shortcut': drawn.sum(axis=1),
+        'evaluated_quality': np.where(drawn, np.nan, qualities),
+        'evaluated_error_percent': np.where(drawn, np.nan, errors)
+    }
+
+
 class ZVTMonteCarloAnalyzer:
-    def __init__(self, cache_file="zeta_zeros_cache.pkl", results_dir="zvt_constants_results"):
+    def __init__(self, cache_file="zeta_zeros_cache.pkl", results_dir="zvt_constants_results", seed=None, adaptive=False, analytic=False):
         self.cache_file = cache_file
         self.results_dir = results_dir
         self.monte_carlo_dir = os.path.join(results_dir, "monte_carlo")
         self.zeros = None
         self.n_simulations = 10000  # Número de simulações Monte Carlo
         self.n_constants = len(REAL_CONSTANTS)
-        
-        # Resultados das simulações
-        self.simulation_results = []
+        self.entropy = root_seed_sequence(seed).entropy  # Gravada no relatório para reprodução
+        self.adaptive = adaptive
+        self.analytic = analytic  # Só a nula analítica (zvt_null_model), sem simulações
+        self.analytic_p_values = {}
+        self.analytic_check = None
+        self.stopping_points = {}  # Constante → (simulações até o veredito, p-value, IC)
+        self.tail_estimates = {}  # (constante, estatística) → p-value de cauda (amostragem por importância ou analítico)
+        
+        # Resultados das simulações (arrays de resumo, um valor por simulação)
+        self.simulation_summary = {}
         self.summary_stats = {}
+        self.null_quality = None  # Distribuições nulas ordenadas (EmpiricalNull)
+        self.null_error = None
         
         os.makedirs(self.monte_carlo_dir, exist_ok=True)
         
@@ -81,194 +173,340 @@ class ZVTMonteCarloAnalyzer:
         print("=" * 60)
         print(f"🎯 Validação estatística através de {self.n_simulations:,} simulações")
         print(f"🔬 Testando {self.n_constants} constantes vs distribuições aleatórias")
+        print(f"🎲 Semente (entropia): {self.entropy}")
+        print("⚠️ Constantes abaixo do limite de resolução dos zeros sorteadas da estatística de ordem")
         
     def load_zeros(self):
         """Carrega zeros da função zeta"""
         print("📂 Carregando zeros da função zeta...")
         
-        if os.path.exists(self.cache_file):
-            with open(self.cache_file, 'rb') as f:
-                self.zeros = pickle.load(f)
+        # Store colunar mapeado em memória (converte o pickle na primeira vez)
+        self.zeros = load_zero_store(self.cache_file)
+        if self.zeros is not None:
             print(f"✅ {len(self.zeros):,} zeros carregados")
             return True
         else:
             print("❌ Cache de zeros não encontrado!")
             return False
     
-    def generate_random_constants(self, n_constants=None):
-        """Gera constantes aleatórias para simulação Monte Carlo"""
-        if n_constants is None:
-            n_constants = self.n_constants
-            
-        # Gerar constantes em diferentes escalas (log-uniform)
-        random_constants = {}
-        
-        for i in range(n_constants):
-            # Escolher escala aleatória entre 1e-50 e 1e4
-            log_min, log_max = -50, 4
-            log_value = np.random.uniform(log_min, log_max)
-            value = 10 ** log_value
-            random_constants[f'random_{i+1}'] = value
-            
-        return random_constants
+    def find_best_resonances(self, zeros, constants_matrix):
+        """Melhores ressonâncias de uma matriz (simulações × constantes) em blocos vetorizados"""
+        constants_matrix = np.asarray(constants_matrix, dtype=np.float64)
+        indices, gammas = zeros_as_arrays(zeros)
+        qualities, positions = best_resonances(gammas, constants_matrix)
+        resolved = positions >= 0  # Constantes abaixo do limite de resolução: qualidade NaN
+        return {
+            'quality': qualities,
+            'error_percent': (qualities / constants_matrix) * 100,
+            'zero_index': np.where(resolved, indices[positions], -1),
+            'gamma': np.where(resolved, gammas[positions], np.nan)
+        }
     
     def find_best_resonance(self, zeros, constant_value):
         """Encontra a melhor ressonância para uma constante específica"""
-        best_quality = float('inf')
-        best_zero = None
-        
-        for n, gamma in zeros:
-            mod_val = gamma % constant_value
-            min_distance = min(mod_val, constant_value - mod_val)
-            
-            if min_distance < best_quality:
-                best_quality = min_distance
-                best_zero = (n, gamma)
-        
-        if best_zero:
-            error_percent = (best_quality / constant_value) * 100
-            return {
-                'quality': best_quality,
-                'error_percent': error_percent,
-                'zero_index': best_zero[0],
-                'gamma': best_zero[1]
-            }
-        return None
-    
-    def simulate_single_run(self, simulation_id):
-        """Executa uma única simulação Monte Carlo"""
-        # Gerar constantes aleatórias
-        random_constants = self.generate_random_constants()
-        
-        # Encontrar melhores ressonâncias para cada constante aleatória
-        results = {}
-        qualities = []
-        error_percentages = []
-        
-        for const_name, const_value in random_constants.items():
-            resonance = self.find_best_resonance(self.zeros, const_value)
-            if resonance:
-                results[const_name] = resonance
-                qualities.append(resonance['quality'])
-                error_percentages.append(resonance['error_percent'])
-        
-        # Calcular estatísticas desta simulação
-        simulation_stats = {
-            'simulation_id': simulation_id,
-            'n_resonances': len(results),
-            'best_quality': min(qualities) if qualities else float('inf'),
-            'mean_quality': np.mean(qualities) if qualities else float('inf'),
-            'best_error_percent': min(error_percentages) if error_percentages else float('inf'),
-            'mean_error_percent': np.mean(error_percentages) if error_percentages else float('inf'),
-            'qualities': qualities,
-            'error_percentages': error_percentages
+        if len(zeros) == 0:
+            return None
+        best = self.find_best_resonances(zeros, [constant_value])
+        return {
+            'quality': float(best['quality'][0]),
+            'error_percent': float(best['error_percent'][0]),
+            'zero_index': int(best['zero_index'][0]),
+            'gamma': float(best['gamma'][0])
         }
-        
-        return simulation_stats
     
     def run_monte_carlo_parallel(self):
-        """Executa simulações Monte Carlo em paralelo"""
+        """Executa simulações Monte Carlo em lotes vetorizados, em paralelo"""
         print(f"\n🚀 Iniciando {self.n_simulations:,} simulações Monte Carlo...")
-        print("⚡ Processamento paralelo ativado")
-        
-        # Usar amostra dos zeros para acelerar (últimos 100k)
-        sample_zeros = self.zeros[-100000:] if len(self.zeros) > 100000 else self.zeros
-        original_zeros = self.zeros
-        self.zeros = sample_zeros
-        
-        print(f"📊 Usando amostra de {len(sample_zeros):,} zeros para simulações")
+        print("⚡ Processamento paralelo em lotes vetorizados ativado")
+        print(f"📊 Usando todos os {len(self.zeros):,} zeros, lotes de {MC_BATCH_SIZE} simulações")
         
-        # Processamento paralelo
+        blocks = simulation_blocks(self.n_simulations, MC_BATCH_SIZE)
         max_workers = min(8, os.cpu_count())  # Limitar para não sobrecarregar
         
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submeter todas as simulações
-            futures = [executor.submit(self.simulate_single_run, i) 
-                      for i in range(self.n_simulations)]
-            
-            # Coletar resultados com progress bar
-            for future in tqdm(as_completed(futures), total=self.n_simulations, 
-                              desc="Simulações Monte Carlo"):
-                try:
-                    result = future.result()
-                    self.simulation_results.append(result)
-                except Exception as e:
-                    print(f"⚠️ Erro na simulação: {e}")
-        
-        # Restaurar zeros originais
-        self.zeros = original_zeros
-        
-        print(f"✅ {len(self.simulation_results):,} simulações completadas")
-        
+        # Zeros mapeados de arquivo: cada lote serializa só (caminho, offset, tamanho)
+        with shared_zeros(self.zeros) as shared, ProcessPoolExecutor(max_workers=max_workers) as executor:
+            parts = self.run_simulation_blocks(executor, shared, blocks)
+        
+        self.simulation_summary = self.merge_simulation_parts(parts)
+        print(f"✅ {len(self.simulation_summary['best_quality']):,} simulações completadas")
+        
+    def run_simulation_blocks(self, executor, shared, blocks):
+        """Executa blocos de simulações no pool e devolve os arrays de resumo de cada um"""
+        # Um stream independente por bloco: simulações nunca se repetem entre workers
+        futures = [executor.submit(simulate_batch, shared, self.entropy, block_index, first_id,
+                                   size, self.n_constants)
+                   for block_index, first_id, size in blocks]
+        parts = []
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Lotes Monte Carlo"):
+            try:
+                parts.append(future.result())
+            except Exception as e:
+                print(f"⚠️ Erro no lote de simulações: {e}")
+        return parts
+    
+    def merge_simulation_parts(self, parts):
+        """Concatena os resumos dos blocos na ordem dos ids, não de conclusão"""
+        parts = sorted(parts, key=lambda part: part['simulation_id'][0])
+        return {key: np.concatenate([part[key] for part in parts]) if parts else np.empty(0)
+                for key in SUMMARY_KEYS}
+    
+    def run_monte_carlo_adaptive(self, max_simulations=ADAPTIVE_MAX_SIMULATIONS):
+        """Simulações em rodadas que param quando o veredito de cada constante está decidido
+
+        Após cada rodada, o p-value de cada constante ainda pendente ganha seu IC de
+        Clopper-Pearson; quando o IC não contém nenhum limiar de SIGNIFICANCE_THRESHOLDS
+        o rótulo de significância não muda mais e a constante sai da lista. As rodadas
+        dobram o total até não restar constante ambígua ou até max_simulations.
+        """
+        print(f"\n🚀 Monte Carlo adaptativo: até {max_simulations:,} simulações em rodadas")
+        print(f"📊 Usando todos os {len(self.zeros):,} zeros, lotes de {MC_BATCH_SIZE} simulações")
+        
+        # Mesmos blocos (e sementes) da execução fixa: ids continuam reprodutíveis
+        blocks = simulation_blocks(max_simulations, MC_BATCH_SIZE)
+        pending = list(REAL_RESULTS)
+        self.stopping_points = {}
+        parts = []
+        next_block = 0
+        target = ADAPTIVE_FIRST_ROUND
+        max_workers = min(8, os.cpu_count())
+        
+        with shared_zeros(self.zeros) as shared, ProcessPoolExecutor(max_workers=max_workers) as executor:
+            while pending and next_block < len(blocks):
+                round_blocks = [block for block in blocks[next_block:] if block[1] < target]
+                next_block += len(round_blocks)
+                parts.extend(self.run_simulation_blocks(executor, shared, round_blocks))
+                
+                summary = self.merge_simulation_parts(parts)
+                null_quality = EmpiricalNull(summary['best_quality'])
+                real_qualities = [REAL_RESULTS[name]['quality'] for name in pending]
+                p_values, lower, upper = null_quality.p_values(real_qualities)
+                settled = interval_clear_of(lower, upper, SIGNIFICANCE_THRESHOLDS)
+                for i in np.flatnonzero(settled):
+                    self.stopping_points[pending[i]] = (len(null_quality), float(p_values[i]),
+                                                        (float(lower[i]), float(upper[i])))
+                pending = [name for i, name in enumerate(pending) if not settled[i]]
+                print(f"🔁 {len(null_quality):,} simulações: {len(self.stopping_points)} decididas, "
+                      f"{len(pending)} ambíguas")
+                target *= 2
+        
+        self.simulation_summary = summary
+        self.n_simulations = len(summary['simulation_id'])
+        if pending:
+            print(f"⚠️ Sem veredito após {self.n_simulations:,} simulações: {', '.join(pending)}")
+        print(f"✅ {self.n_simulations:,} simulações completadas")
+        
+    @property
+    def run_mode(self):
+        """Modo da execução, gravado no relatório para reproduzir simulações"""
+        return 'adaptativo' if self.adaptive else 'fixo'
+    
+    def planned_simulations(self):
+        """Total que define os blocos: o teto no modo adaptativo (rodadas usam os mesmos blocos), senão o fixo"""
+        return ADAPTIVE_MAX_SIMULATIONS if self.adaptive else self.n_simulations
+    
+    def reproduce_command(self, simulation_id='ID'):
+        """Linha de comando que refaz uma simulação desta execução"""
+        flags = " --adaptive" if self.adaptive else ""
+        return (f"python3 montecarlo.py --seed {self.entropy}{flags} "
+                f"--simulations {self.n_simulations} --reproduce {simulation_id}")
+    
+    def reproduce_simulation(self, simulation_id, run_simulations=None):
+        """Refaz uma única simulação a partir de (entropia, id), sem rodar o lote
+
+        run_simulations é o total executado, gravado no relatório (no modo
+        adaptativo, sem ele vale o teto ADAPTIVE_MAX_SIMULATIONS). O tamanho do
+        bloco vem de simulation_blocks sobre o total planejado, como na execução.
+        """
+        planned = self.planned_simulations()
+        n_run = planned if run_simulations is None else min(run_simulations, planned)
+        if not 0 <= simulation_id < n_run:
+            raise ValueError(f"Simulação #{simulation_id} fora da execução ({self.run_mode}: 0 a {n_run - 1})")
+        block_index, row = locate_simulation(simulation_id, MC_BATCH_SIZE)
+        block_size = simulation_blocks(planned, MC_BATCH_SIZE)[block_index][2]
+        constants, uniforms = simulation_draws(self.entropy, block_index, block_size, self.n_constants)
+        _, gammas = zeros_as_arrays(self.zeros)
+        qualities = best_quality_matrix(gammas, constants[row:row + 1], uniforms[row:row + 1])[0][0]
+        return {
+            'simulation_id': int(simulation_id),
+            'constants': constants[row],
+            'quality': qualities,
+            'error_percent': qualities / constants[row] * 100
+        }
+    
     def analyze_simulation_results(self):
         """Analisa resultados das simulações Monte Carlo"""
         print("\n📊 Analisando resultados das simulações...")
         
-        # Extrair estatísticas
-        best_qualities = [r['best_quality'] for r in self.simulation_results if np.isfinite(r['best_quality'])]
-        best_errors = [r['best_error_percent'] for r in self.simulation_results if np.isfinite(r['best_error_percent'])]
-        mean_qualities = [r['mean_quality'] for r in self.simulation_results if np.isfinite(r['mean_quality'])]
+        # Distribuições nulas ordenadas uma vez: p-values e percentis por busca binária
+        summary = self.simulation_summary
+        self.null_quality = EmpiricalNull(summary['best_quality'])
+        self.null_error = EmpiricalNull(summary['best_error_percent'])
+        mean_qualities = summary['mean_quality'][np.isfinite(summary['mean_quality'])]
         
         self.summary_stats = {
-            'n_valid_simulations': len(best_qualities),
-            'best_quality_distribution': best_qualities,
-            'best_error_distribution': best_errors,
+            'n_valid_simulations': len(self.null_quality),
+            'best_quality_distribution': self.null_quality.sorted,
+            'best_error_distribution': self.null_error.sorted,
             'mean_quality_distribution': mean_qualities,
-            'percentiles_quality': {
-                p: np.percentile(best_qualities, p) for p in [1, 5, 10, 25, 50, 75, 90, 95, 99]
-            },
-            'percentiles_error': {
-                p: np.percentile(best_errors, p) for p in [1, 5, 10, 25, 50, 75, 90, 95, 99]
-            }
+            'n_shortcut_constants': int(summary['n_shortcut'].sum()),
+            'percentiles_quality': dict(zip(PERCENTILES, self.null_quality.percentiles(PERCENTILES))),
+            'percentiles_error': dict(zip(PERCENTILES, self.null_error.percentiles(PERCENTILES)))
         }
         
-        print(f"📈 Estatísticas calculadas para {len(best_qualities):,} simulações válidas")
+        print(f"📈 Estatísticas calculadas para {len(self.null_quality):,} simulações válidas")
+        print(f"⚠️ {self.summary_stats['n_shortcut_constants']:,} constantes sorteadas da estatística de ordem")
         
-    def calculate_p_values(self):
-        """Calcula p-values para nossos resultados reais"""
+    def calculate_p_values(self, real_results=None):
+        """Calcula p-values para nossos resultados reais (ou para novos resultados)"""
         print("\n🧪 Calculando p-values para validação estatística...")
+        if real_results is None:
+            real_results = REAL_RESULTS
+        
+        # Todas as constantes de uma vez contra as distribuições ordenadas
+        names = list(real_results)
+        real_qualities = np.array([real_results[name]['quality'] for name in names])
+        real_errors = np.array([real_results[name]['error_percent'] for name in names])
+        quality_p, quality_lower, quality_upper = self.null_quality.p_values(real_qualities)
+        error_p, error_lower, error_upper = self.null_error.p_values(real_errors)
         
         p_values = {}
         significance_levels = {}
+        self.tail_estimates = {}
         
-        for const_name, real_result in REAL_RESULTS.items():
-            real_quality = real_result['quality']
-            real_error = real_result['error_percent']
-            
-            # P-value: proporção de simulações com qualidade igual ou melhor
-            better_quality_count = sum(1 for q in self.summary_stats['best_quality_distribution'] 
-                                     if q <= real_quality)
-            p_value_quality = better_quality_count / len(self.summary_stats['best_quality_distribution'])
-            
-            # P-value para erro percentual
-            better_error_count = sum(1 for e in self.summary_stats['best_error_distribution'] 
-                                   if e <= real_error)
-            p_value_error = better_error_count / len(self.summary_stats['best_error_distribution'])
-            
+        for i, const_name in enumerate(names):
             p_values[const_name] = {
-                'p_value_quality': p_value_quality,
-                'p_value_error': p_value_error,
-                'real_quality': real_quality,
-                'real_error': real_error
+                'p_value_quality': float(quality_p[i]),
+                'p_value_quality_ci': (float(quality_lower[i]), float(quality_upper[i])),
+                'p_value_quality_method': 'monte_carlo',
+                'p_value_error': float(error_p[i]),
+                'p_value_error_ci': (float(error_lower[i]), float(error_upper[i])),
+                'p_value_error_method': 'monte_carlo',
+                'real_quality': float(real_qualities[i]),
+                'real_error': float(real_errors[i])
             }
             
+            # Nenhuma simulação superou: p-value de cauda por amostragem por importância, ou
+            # analítico quando nenhuma constante resolve o limiar nos zeros (tail_p_value)
+            for statistic, p_key, real_value in (('quality', 'p_value_quality', real_qualities[i]),
+                                                 ('error_percent', 'p_value_error', real_errors[i])):
+                if p_values[const_name][p_key] == 0:
+                    tail = self.estimate_tail_p_value(statistic, float(real_value), i)
+                    self.tail_estimates[(const_name, statistic)] = tail
+                    p_values[const_name][p_key] = tail['p_value']
+                    p_values[const_name][f'{p_key}_ci'] = tail['ci']
+                    p_values[const_name][f'{p_key}_method'] = tail['method']
+                    if tail['method'] == 'analytic':
+                        print(f"⚠️ {const_name} ({statistic}): limiar abaixo da resolução dos resíduos, "
+                              f"p-value analítico (nula fechada, sem os zeros)")
+            
             # Determinar nível de significância
-            if p_value_quality < 0.001:
-                significance = "***"  # Extremamente significativo
-            elif p_value_quality < 0.01:
-                significance = "**"   # Muito significativo
-            elif p_value_quality < 0.05:
-                significance = "*"    # Significativo
-            else:
-                significance = "n.s." # Não significativo
-                
-            significance_levels[const_name] = significance
+            significance_levels[const_name] = significance_label(p_values[const_name]['p_value_quality'])
         
         self.p_values = p_values
         self.significance_levels = significance_levels
         
         print("✅ P-values calculados para todas as constantes")
+        return p_values
+        
+    def estimate_tail_p_value(self, statistic, threshold, result_index):
+        """P-value de cauda de um resultado real com TAIL_DRAWS sorteios (stream próprio)"""
+        _, gammas = zeros_as_arrays(self.zeros)
+        statistic_index = 0 if statistic == 'quality' else 1
+        rng = stream_generator(self.entropy, TAIL_STREAM, result_index, statistic_index)
+        return tail_p_value(gammas, statistic, threshold, self.n_constants, rng, RANDOM_LOG_MIN, RANDOM_LOG_MAX)
+    
+    def calculate_analytic_p_values(self, real_results=None):
+        """P-values da nula analítica, na mesma forma do Monte Carlo, mais o da própria constante
+
+        'p_value_quality'/'p_value_error': melhor entre n_constants constantes
+        log-uniformes (o que o MC estima); 'p_value_constant': melhor qualidade com
+        o c da própria constante; 'p_value_global': esse último corrigido por
+        look-elsewhere sobre todas as constantes testadas.
+        """
+        if real_results is None:
+            real_results = REAL_RESULTS
+        n_zeros = len(self.zeros)
+        names = list(real_results)
+        qualities = np.array([real_results[name]['quality'] for name in names])
+        errors = np.array([real_results[name]['error_percent'] for name in names])
+        constants = np.array([REAL_CONSTANTS[name] for name in names])
+        
+        p_quality = monte_carlo_quality_cdf(qualities, n_zeros, self.n_constants, RANDOM_LOG_MIN, RANDOM_LOG_MAX)
+        p_error = best_error_p_value(errors, n_zeros, self.n_constants)
+        p_constant = best_quality_p_value(qualities, constants, n_zeros)
+        p_global = look_elsewhere(p_constant, len(REAL_CONSTANTS))
+        
+        self.analytic_p_values = {
+            name: {
+                'p_value_quality': float(p_quality[i]),
+                'p_value_error': float(p_error[i]),
+                'p_value_constant': float(p_constant[i]),
+                'p_value_global': float(p_global[i]),
+                'real_quality': float(qualities[i]),
+                'real_error': float(errors[i])
+            } for i, name in enumerate(names)
+        }
+        return self.analytic_p_values
+    
+    def cross_validate_analytic(self):
+        """Compara a nula analítica com as distribuições e p-values do Monte Carlo
+
+        O KS usa só as constantes avaliadas sobre os zeros: as abaixo do limite de
+        resolução vêm da própria estatística de ordem e passariam qualquer que
+        fossem os zeros. Condicionada a c ≥ limite, uma constante log-uniforme é
+        log-uniforme em [limite, 10^RANDOM_LOG_MAX], então cada qualidade avaliada
+        é comparada com a nula de uma constante nessa faixa. Só é omitida se
+        nenhuma constante foi avaliada.
+        """
+        print("\n🧮 Validação cruzada: nula analítica vs Monte Carlo...")
+        analytic = self.calculate_analytic_p_values()
+        summary = self.simulation_summary
+        evaluated = np.isfinite(summary['evaluated_quality'])
+        n_evaluated = int(np.count_nonzero(evaluated))
+        if n_evaluated == 0:
+            self.analytic_check = {'skipped': int(summary['n_shortcut'].sum())}
+            print("   ⚠️ Omitida: nenhuma constante avaliada sobre os zeros, comparação circular")
+            return self.analytic_check
+        _, gammas = zeros_as_arrays(self.zeros)
+        with np.errstate(divide='ignore'):
+            log_min = float(np.clip(np.log10(resolution_limit(gammas)), RANDOM_LOG_MIN, RANDOM_LOG_MAX))
+        ks = cross_validate(summary['evaluated_quality'][evaluated], summary['evaluated_error_percent'][evaluated],
+                            len(self.zeros), 1, log_min, RANDOM_LOG_MAX)
+        # Nula analítica dentro do IC de Clopper-Pearson do p-value do MC?
+        inside = {name: lower <= analytic[name]['p_value_quality'] <= upper
+                  for name, (lower, upper) in ((name, self.p_values[name]['p_value_quality_ci'])
+                                               for name in self.p_values)}
+        self.analytic_check = {'ks': ks, 'inside_ci': inside, 'n_evaluated': n_evaluated,
+                               'n_constants': evaluated.size, 'log_min': log_min}
+        agreement = sum(inside.values())
+        print(f"   {n_evaluated:,} de {evaluated.size:,} constantes avaliadas (c ≥ 1e{log_min:.1f})")
+        print(f"   KS qualidade: D={ks['quality'][0]:.4f} (p={ks['quality'][1]:.3f}) | "
+              f"KS erro: D={ks['error'][0]:.4f} (p={ks['error'][1]:.3f})")
+        print(f"   p-values analíticos dentro do IC do MC: {agreement}/{len(inside)}")
+        return self.analytic_check
+    
+    def generate_analytic_report(self):
+        """Relatório só com a nula analítica (modo --analytic, sem simulações)"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_file = os.path.join(self.monte_carlo_dir, f"Analytic_Null_Report_{timestamp}.txt")
+        
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write("="*80 + "\n")
+            f.write("ZVT NULA ANALÍTICA - RELATÓRIO DE VALIDAÇÃO ESTATÍSTICA\n")
+            f.write("="*80 + "\n\n")
+            f.write(f"Data: {datetime.now().isoformat()}\n")
+            f.write(f"Zeros utilizados: {len(self.zeros):,}\n")
+            f.write(f"Nula: resíduo dobrado uniforme em [0, c/2]; P(melhor ≤ q) = 1 − (1 − 2q/c)^N\n")
+            f.write(f"Look-elsewhere: Šidák sobre {len(REAL_CONSTANTS)} constantes testadas\n\n")
+            f.write("| Constante          | p (MC equiv.) | p (própria c) | p global   | Significância |\n")
+            f.write("|--------------------|--------------:|--------------:|-----------:|:-------------:|\n")
+            for const_name, results in sorted(self.analytic_p_values.items(), key=lambda x: x[1]['p_value_quality']):
+                f.write(f"| {const_name:18s} | {results['p_value_quality']:13.3e} | {results['p_value_constant']:13.3e} | "
+                        f"{results['p_value_global']:10.3e} | {self.significance_levels[const_name]:13s} |\n")
+            f.write("="*80 + "\n")
         
+        print(f"📊 Relatório salvo: {report_file}")
+    
     def visualize_monte_carlo_results(self):
         """Visualiza resultados da análise Monte Carlo"""
         print("📈 Gerando visualizações da análise Monte Carlo...")
@@ -375,10 +613,17 @@ class ZVTMonteCarloAnalyzer:
             f.write("ZVT MONTE CARLO - RELATÓRIO DE VALIDAÇÃO ESTATÍSTICA\n")
             f.write("="*80 + "\n\n")
             f.write(f"Data: {datetime.now().isoformat()}\n")
-            f.write(f"Simulações executadas: {self.n_simulations:,}\n")
+            f.write(f"Simulações executadas: {self.n_simulations:,} (ids 0 a {self.n_simulations - 1:,}) | "
+                    f"modo {self.run_mode}" + (f", teto {ADAPTIVE_MAX_SIMULATIONS:,}" if self.adaptive else "") + "\n")
+            f.write(f"Semente (entropia): {self.entropy} | {MC_BATCH_SIZE} simulações por bloco\n")
+            f.write(f"Reproduzir uma simulação: {self.reproduce_command()}\n")
             f.write(f"Simulações válidas: {self.summary_stats['n_valid_simulations']:,}\n")
             f.write(f"Zeros utilizados: {len(self.zeros):,}\n")
-            f.write(f"Constantes testadas: {self.n_constants}\n\n")
+            f.write(f"Constantes testadas: {self.n_constants}\n")
+            n_shortcut = self.summary_stats['n_shortcut_constants']
+            n_drawn = self.summary_stats['n_valid_simulations'] * self.n_constants
+            f.write(f"Estatística de ordem: {n_shortcut:,} de {n_drawn:,} constantes sorteadas da nula "
+                    f"(abaixo do limite de resolução dos zeros); as demais avaliadas sobre os zeros\n\n")
             
             f.write("RESUMO ESTATÍSTICO DAS SIMULAÇÕES:\n")
             f.write("-" * 50 + "\n")
@@ -389,8 +634,8 @@ class ZVTMonteCarloAnalyzer:
             
             f.write("VALIDAÇÃO DOS NOSSOS RESULTADOS:\n")
             f.write("-" * 50 + "\n")
-            f.write("| Constante          | P-value    | Significância | Qualidade Real |\n")
-            f.write("|--------------------|-----------:|:-------------:|:--------------:|\n")
+            f.write(f"| Constante          | P-value    | IC {CONFIDENCE_LEVEL:.0%} (Clopper-Pearson) | Origem     | Significância | Qualidade Real |\n")
+            f.write("|--------------------|-----------:|:-----------------------:|:----------:|:-------------:|:--------------:|\n")
             
             # Ordenar por p-value
             sorted_results = sorted(self.p_values.items(), key=lambda x: x[1]['p_value_quality'])
@@ -399,13 +644,61 @@ class ZVTMonteCarloAnalyzer:
                 p_val = results['p_value_quality']
                 sig = self.significance_levels[const_name]
                 quality = results['real_quality']
-                f.write(f"| {const_name:18s} | {p_val:9.3e} | {sig:11s} | {quality:14.2e} |\n")
+                lower, upper = results['p_value_quality_ci']
+                origin = P_VALUE_ORIGINS[results['p_value_quality_method']]
+                f.write(f"| {const_name:18s} | {p_val:9.3e} | [{lower:9.3e}, {upper:9.3e}] | {origin:10s} | {sig:11s} | {quality:14.2e} |\n")
             
             f.write(f"\nLEGENDA DE SIGNIFICÂNCIA:\n")
             f.write("*** = p < 0.001 (Extremamente significativo)\n")
             f.write("**  = p < 0.01  (Muito significativo)\n")
             f.write("*   = p < 0.05  (Significativo)\n")
-            f.write("n.s.= p ≥ 0.05  (Não significativo)\n\n")
+            f.write("n.s.= p ≥ 0.05  (Não significativo)\n")
+            f.write("Origem: MC = proporção de simulações; cauda IS = amostragem por importância;\n")
+            f.write("analítico = limiar abaixo da resolução dos resíduos, nula fechada sem os zeros\n\n")
+            
+            if self.adaptive:
+                f.write("PARADA SEQUENCIAL (modo adaptativo):\n")
+                f.write("-" * 50 + "\n")
+                for const_name in self.p_values:
+                    if const_name in self.stopping_points:
+                        n_sims, p_val, (lower, upper) = self.stopping_points[const_name]
+                        f.write(f"{const_name}: decidido em {n_sims:,} simulações (p = {p_val:.3e}, IC [{lower:.3e}, {upper:.3e}])\n")
+                    else:
+                        f.write(f"{const_name}: ambíguo após {self.n_simulations:,} simulações\n")
+                f.write("\n")
+            
+            if self.tail_estimates:
+                f.write("P-VALUES DE CAUDA (nenhuma simulação superou):\n")
+                f.write("-" * 50 + "\n")
+                for (const_name, statistic), tail in self.tail_estimates.items():
+                    if tail['method'] == 'analytic':
+                        f.write(f"{const_name} ({statistic}): p = {tail['p_value']:.3e} | analítico: limiar abaixo da "
+                                f"resolução float64/decimal dos resíduos, os zeros não entram\n")
+                        continue
+                    lower, upper = tail['ci']
+                    f.write(f"{const_name} ({statistic}): p = {tail['p_value']:.3e}, IC [{lower:.3e}, {upper:.3e}] "
+                            f"| amostragem por importância, {tail['draws']:,} sorteios, ESS {tail['ess']:.0f}\n")
+                f.write("\n")
+            
+            if self.analytic_check and 'skipped' in self.analytic_check:
+                f.write("VALIDAÇÃO CRUZADA COM A NULA ANALÍTICA: omitida\n")
+                f.write("-" * 50 + "\n")
+                f.write(f"Nenhuma constante avaliada sobre os zeros: as {self.analytic_check['skipped']:,} vieram da própria\n")
+                f.write("nula (estatística de ordem) e a comparação do MC com a fórmula fechada seria circular.\n\n")
+            elif self.analytic_check:
+                ks = self.analytic_check['ks']
+                f.write("VALIDAÇÃO CRUZADA COM A NULA ANALÍTICA:\n")
+                f.write("-" * 50 + "\n")
+                f.write(f"Constantes avaliadas sobre os zeros: {self.analytic_check['n_evaluated']:,} de "
+                        f"{self.analytic_check['n_constants']:,} (log-uniformes em [1e{self.analytic_check['log_min']:.1f}, "
+                        f"1e{RANDOM_LOG_MAX}], as demais sorteadas da nula ficam de fora)\n")
+                f.write(f"KS qualidade por constante: D = {ks['quality'][0]:.4f}, p = {ks['quality'][1]:.3f}\n")
+                f.write(f"KS erro por constante: D = {ks['error'][0]:.4f}, p = {ks['error'][1]:.3f}\n")
+                for const_name, inside in self.analytic_check['inside_ci'].items():
+                    analytic_p = self.analytic_p_values[const_name]['p_value_quality']
+                    marker = "✅" if inside else "⚠️"
+                    f.write(f"{marker} {const_name}: analítico {analytic_p:.3e} vs MC {self.p_values[const_name]['p_value_quality']:.3e}\n")
+                f.write("\n")
             
             # Análise específica das melhores
             extremes = [name for name, results in self.p_values.items() 
@@ -417,7 +710,8 @@ class ZVTMonteCarloAnalyzer:
                 for const_name in extremes:
                     p_val = self.p_values[const_name]['p_value_quality']
                     if p_val == 0:
-                        f.write(f"{const_name}: p < {1/self.n_simulations:.0e} (nenhuma simulação superou)\n")
+                        upper = self.p_values[const_name]['p_value_quality_ci'][1]
+                        f.write(f"{const_name}: p < {upper:.2e} (IC {CONFIDENCE_LEVEL:.0%}; nenhuma simulação superou)\n")
                     else:
                         f.write(f"{const_name}: p = {p_val:.3e}\n")
                 
@@ -445,14 +739,30 @@ class ZVTMonteCarloAnalyzer:
         if not self.load_zeros():
             return
         
-        # Executar simulações
-        self.run_monte_carlo_parallel()
+        # Modo analítico: p-values fechados, sem simulações (MC fica como verificação pontual)
+        if self.analytic:
+            self.calculate_analytic_p_values()
+            self.p_values = self.analytic_p_values
+            self.significance_levels = {name: significance_label(p['p_value_quality'])
+                                        for name, p in self.analytic_p_values.items()}
+            self.generate_analytic_report()
+            n_significant = sum(1 for sig in self.significance_levels.values() if sig != "n.s.")
+            print(f"\n📊 RESUMO RÁPIDO (nula analítica):")
+            print(f"   • {n_significant}/{len(self.p_values)} constantes significativas")
+            return
+        
+        # Executar simulações (fixas ou em rodadas adaptativas)
+        if self.adaptive:
+            self.run_monte_carlo_adaptive()
+        else:
+            self.run_monte_carlo_parallel()
         
         # Analisar resultados
         self.analyze_simulation_results()
         
-        # Calcular p-values
+        # Calcular p-values e conferir a nula analítica
         self.calculate_p_values()
+        self.cross_validate_analytic()
         
         # Visualizar
         self.visualize_monte_carlo_results()
@@ -475,7 +785,18 @@ class ZVTMonteCarloAnalyzer:
 
 def main():
     """Função principal"""
-    analyzer = ZVTMonteCarloAnalyzer()
+    # Uso: python3 montecarlo.py [--seed N] [--adaptive | --analytic]
+    #                            [--reproduce ID [--simulations TOTAL]]  (modo e total como no relatório)
+    analyzer = ZVTMonteCarloAnalyzer(seed=int_option('--seed'), adaptive='--adaptive' in sys.argv[1:],
+                                     analytic='--analytic' in sys.argv[1:])
+    simulation_id = int_option('--reproduce')
+    if simulation_id is not None:
+        if analyzer.load_zeros():
+            result = analyzer.reproduce_simulation(simulation_id, int_option('--simulations'))
+            print(f"\n🔁 Simulação #{simulation_id} (modo {analyzer.run_mode}):")
+            for value, quality, error in zip(result['constants'], result['quality'], result['error_percent']):
+                print(f"   c = {value:.6e} | qualidade {quality:.6e} | erro {error:.6e}%")
+        return
     analyzer.run_complete_analysis()
 
 if __name__ == "__main__":
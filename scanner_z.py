@@ -12,104 +12,26 @@ import numpy as np
 from mpmath import mp
 import time
 from concurrent.futures import ProcessPoolExecutor
-import pickle
 import os
 import signal
 import sys
 from datetime import datetime
-from scipy import stats
-from scipy.stats import kstest, anderson
 import warnings
 import matplotlib.pyplot as plt
+from zvt_kernels import zeros_as_arrays
+from zvt_checkpoint import BatchCheckpointer, checkpoint_path_for, checkpoint_fingerprint
+from zvt_engine import UnifiedResonanceEngine, load_constant_families
+from zvt_families import (ABSOLUTE_TOLERANCE_LEVELS as TOLERANCE_LEVELS, FUNDAMENTAL_CONSTANTS as FUNDAMENTAL_FORCES,
+                          FUNDAMENTAL_TOLERANCES as FORCE_TOLERANCES,
+                          FUNDAMENTAL_CONTROL_CONSTANTS as CONTROL_CONSTANTS, FUNDAMENTAL_FAMILY as CONSTANT_FAMILY)
+from zvt_zero_store import (ZeroStore, store_path_for, load_zero_store, write_zero_store,
+                            read_zero_file, iter_zero_file_batches, shared_zeros, attach_zero_store)
 
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
 # Configuration
 mp.dps = 50  # High precision
 
-# 4 FORÇAS FUNDAMENTAIS + CONSTANTES DE ALTA E MÉDIA PRIORIDADE
-FUNDAMENTAL_FORCES = {
-    # === 4 FORÇAS FUNDAMENTAIS ===
-    'eletromagnetica': 1 / 137.035999084,      # α (constante de estrutura fina)
-    'forte': 0.1185,                           # αs (constante de acoplamento forte at MZ)
-    'fraca': 0.0338,                           # αW (constante de acoplamento fraca)
-    'gravitacional': 5.906e-39,                # αG (constante gravitacional adimensional)
-    
-    # === ALTA PRIORIDADE ===
-    'weinberg_angle': 0.2312,                  # sin²θW (ângulo de Weinberg) - Unificação eletrofraca
-    'proton_electron': 1836.15267343,          # mp/me (razão próton-elétron) - Fundamental para átomos
-    'euler_mascheroni': 0.5772156649,          # γ (constante de Euler-Mascheroni) - Conectada à zeta
-    'fermi_coupling': 1.1663787e-5,            # GF (constante de Fermi) - Interações fracas
-    
-    # === MÉDIA PRIORIDADE - Razões de Massas ===
-    'muon_electron': 206.7682826,              # mμ/me (razão múon-elétron)
-    'tau_electron': 3477.15,                   # mτ/me (razão tau-elétron)
-    'neutron_proton': 1.00137841931,           # mn/mp (razão nêutron-próton)
-    
-    # === MÉDIA PRIORIDADE - Constantes Cosmológicas ===
-    'dark_energy': 0.6847,                     # ΩΛ (densidade energia escura)
-    'dark_matter': 0.2589,                     # Ωdm (densidade matéria escura)
-    'baryon_density': 0.0486,                  # Ωb (densidade bariônica)
-    'hubble_reduced': 0.6736,                  # h (parâmetro Hubble reduzido)
-    'sigma8': 0.8111,                          # σ8 (flutuação densidade matéria)
-    
-    # === MÉDIA PRIORIDADE - Fatores Magnéticos ===
-    'gyromagnetic_proton': 2.7928473508,       # gp (fator g do próton)
-    'gyromagnetic_neutron': 1.9130427,         # |gn| (valor absoluto do fator g do nêutron)
-    'magnetic_moment_ratio': 3.1524512605,     # μp/μn (razão momentos magnéticos)
-}
-
-# Tolerâncias específicas para cada constante (ajustadas às suas magnitudes)
-FORCE_TOLERANCES = {
-    # === 4 FORÇAS FUNDAMENTAIS ===
-    'eletromagnetica': [1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9],
-    'forte': [1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7],
-    'fraca': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],
-    'gravitacional': [1e-38, 1e-39, 1e-40, 1e-41, 1e-42, 1e-43],
-    
-    # === ALTA PRIORIDADE ===
-    'weinberg_angle': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],        # Ordem ~0.23
-    'proton_electron': [1e-1, 1e-2, 1e-3, 1e-4, 1e-5, 1e-6],       # Ordem ~1836
-    'euler_mascheroni': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],      # Ordem ~0.58
-    'fermi_coupling': [1e-6, 1e-7, 1e-8, 1e-9, 1e-10, 1e-11],      # Ordem ~1e-5
-    
-    # === MÉDIA PRIORIDADE - Razões de Massas ===
-    'muon_electron': [1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7],         # Ordem ~207
-    'tau_electron': [1e-1, 1e-2, 1e-3, 1e-4, 1e-5, 1e-6],          # Ordem ~3477
-    'neutron_proton': [1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9],        # Ordem ~1.00
-    
-    # === MÉDIA PRIORIDADE - Constantes Cosmológicas ===
-    'dark_energy': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],           # Ordem ~0.68
-    'dark_matter': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],           # Ordem ~0.26
-    'baryon_density': [1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9],        # Ordem ~0.05
-    'hubble_reduced': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],        # Ordem ~0.67
-    'sigma8': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],                # Ordem ~0.81
-    
-    # === MÉDIA PRIORIDADE - Fatores Magnéticos ===
-    'gyromagnetic_proton': [1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7],   # Ordem ~2.79
-    'gyromagnetic_neutron': [1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7],  # Ordem ~1.91
-    'magnetic_moment_ratio': [1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7], # Ordem ~3.15
-}
-
-# Constantes de controle para validação estatística (amostra representativa)
-CONTROL_CONSTANTS = {
-    # Amostra das fundamentais
-    'eletromagnetica': FUNDAMENTAL_FORCES['eletromagnetica'],
-    'forte': FUNDAMENTAL_FORCES['forte'],
-    'fraca': FUNDAMENTAL_FORCES['fraca'],
-    'weinberg_angle': FUNDAMENTAL_FORCES['weinberg_angle'],
-    'euler_mascheroni': FUNDAMENTAL_FORCES['euler_mascheroni'],
-    'dark_energy': FUNDAMENTAL_FORCES['dark_energy'],
-    
-    # Constantes aleatórias para controle
-    'random_1': 1 / 142.7,
-    'random_2': 1 / 129.3,
-    'golden_ratio': (np.sqrt(5) - 1) / 2,
-    'pi_scale': np.pi / 100,
-    'e_scale': np.e / 100
-}
-
-TOLERANCE_LEVELS = [1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9]
 DEFAULT_TOLERANCE = 1e-5
 INCREMENT = 10000  # Lotes maiores para processar mais rapidamente os 2M+ zeros
 
@@ -123,7 +45,9 @@ SIGNIFICANCE_CRITERIA = {
 
 MAX_WORKERS = os.cpu_count()
 CACHE_FILE = "zeta_zeros_cache.pkl"
+STORE_FILE = store_path_for(CACHE_FILE)  # Store colunar preferido ao pickle
 STATS_FILE = "zvt_constants_stats.txt"
+CHECKPOINT_FILE = checkpoint_path_for(STATS_FILE)  # Progresso da varredura para --resume
 RESULTS_DIR = "zvt_constants_results"
 ZEROS_FILE = os.path.expanduser("~/zeta/zero.txt")  # Path to the zeros file
 
@@ -145,35 +69,31 @@ def signal_handler(signum, frame):
     shutdown_requested = True
 
 # Função para verificar se uma ressonância é significativa
-def is_significant_resonance(resonances, stats_result, force_name, constant_value, tolerance):
-    """Verifica se uma ressonância atende aos critérios de significância"""
-    if not stats_result or len(resonances) < SIGNIFICANCE_CRITERIA['min_resonances']:
+def is_significant_resonance(significance, force_name, tolerance):
+    """Verifica os critérios de significância direto nos arrays da SignificanceTable"""
+    row = significance.row(force_name, tolerance)
+    if row is None:
+        return False, "Sem estatísticas"
+    arrays = significance.arrays
+    if arrays['resonant_count'][row] < SIGNIFICANCE_CRITERIA['min_resonances']:
         return False, "Insuficientes ressonâncias"
     
-    basic_stats = stats_result['basic_stats']
-    significance_factor = basic_stats['significance_factor']
-    
     # Verificar fator de significância
+    significance_factor = arrays['significance_factor'][row]
     if significance_factor < SIGNIFICANCE_CRITERIA['min_significance_factor']:
         return False, f"Significância baixa: {significance_factor:.2f}x"
     
     # Verificar testes estatísticos
     significant_tests = []
     
-    if 'chi2_test' in stats_result:
-        chi2 = stats_result['chi2_test']
-        if chi2['statistic'] > SIGNIFICANCE_CRITERIA['min_chi2_stat']:
-            significant_tests.append(f"Chi2: χ²={chi2['statistic']:.3f}")
+    if arrays['chi2_valid'][row] and arrays['chi2_statistic'][row] > SIGNIFICANCE_CRITERIA['min_chi2_stat']:
+        significant_tests.append(f"Chi2: χ²={arrays['chi2_statistic'][row]:.3f}")
     
-    if 'binomial_test' in stats_result:
-        binom = stats_result['binomial_test']
-        if binom['p_value'] < SIGNIFICANCE_CRITERIA['max_p_value']:
-            significant_tests.append(f"Binomial: p={binom['p_value']:.2e}")
+    if arrays['binomial_p_value'][row] < SIGNIFICANCE_CRITERIA['max_p_value']:
+        significant_tests.append(f"Binomial: p={arrays['binomial_p_value'][row]:.2e}")
     
-    if 'poisson_test' in stats_result:
-        poisson = stats_result['poisson_test']
-        if poisson['p_value'] < SIGNIFICANCE_CRITERIA['max_p_value']:
-            significant_tests.append(f"Poisson: p={poisson['p_value']:.2e}")
+    if arrays['poisson_valid'][row] and arrays['poisson_p_value'][row] < SIGNIFICANCE_CRITERIA['max_p_value']:
+        significant_tests.append(f"Poisson: p={arrays['poisson_p_value'][row]:.2e}")
     
     if len(significant_tests) > 0:
         return True, f"Testes significativos: {', '.join(significant_tests)}"
@@ -190,7 +110,7 @@ def log_significant_resonance(force_name, constant_value, tolerance, resonances,
     print(f"🎯 CONSTANTE: {constant_value:.15e}")
     print(f"📏 TOLERÂNCIA: {tolerance:.0e}")
     print(f"📊 ZEROS ANALISADOS: {zeros_count:,}")
-    print(f"🔍 RESSONÂNCIAS: {len(resonances):,}")
+    print(f"🔍 RESSONÂNCIAS: {stats_result['basic_stats']['resonant_count'] if stats_result else len(resonances):,}")
     
     if stats_result:
         basic = stats_result['basic_stats']
@@ -215,37 +135,11 @@ def log_significant_resonance(force_name, constant_value, tolerance, resonances,
 
 # Load zeros from a file with progress indicator
 def load_zeros_from_file(filename):
-    zeros = []
     try:
         print(f"📂 Carregando zeros do arquivo: {filename}")
-        
-        # Primeiro, contar total de linhas para mostrar progresso
-        print("📊 Contando linhas do arquivo...")
-        with open(filename, 'r') as f:
-            total_lines = sum(1 for line in f if line.strip())
-        print(f"📊 Total de linhas encontradas: {total_lines:,}")
-        
-        with open(filename, 'r') as f:
-            progress_counter = 0
-            for line_num, line in enumerate(f, start=1):
-                if shutdown_requested:
-                    break
-                line = line.strip()
-                if line:
-                    try:
-                        zero = float(line)
-                        zeros.append((line_num, zero))  # Format: (index, value)
-                        progress_counter += 1
-                        
-                        # Mostrar progresso a cada 100,000 zeros
-                        if progress_counter % 100000 == 0:
-                            percent = (progress_counter / total_lines) * 100
-                            print(f"📈 Carregados {progress_counter:,} zeros ({percent:.1f}%)")
-                            
-                    except ValueError:
-                        print(f"⚠️ Linha inválida {line_num}: '{line}'")
-                        continue
-        print(f"✅ {len(zeros):,} zeros carregados com sucesso de {total_lines:,} linhas")
+        # Leitura única em blocos, progresso pelo offset em bytes
+        zeros = read_zero_file(filename, should_stop=lambda: shutdown_requested)
+        print(f"✅ {len(zeros):,} zeros carregados")
         return zeros
     except Exception as e:
         print(f"❌ Erro ao ler arquivo: {e}")
@@ -254,41 +148,42 @@ def load_zeros_from_file(filename):
 # Save zeros to cache
 def save_enhanced_cache(zeros, backup=True):
     try:
-        if backup and os.path.exists(CACHE_FILE):
-            backup_file = f"{CACHE_FILE}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            os.rename(CACHE_FILE, backup_file)
+        if backup and os.path.exists(STORE_FILE):
+            backup_file = f"{STORE_FILE}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            os.rename(STORE_FILE, backup_file)
             print(f"📦 Backup do cache criado: {backup_file}")
-        with open(CACHE_FILE, 'wb') as f:
-            pickle.dump(zeros, f, protocol=pickle.HIGHEST_PROTOCOL)
+        indices, gammas = zeros_as_arrays(zeros)
+        write_zero_store(STORE_FILE, indices, gammas, getattr(zeros, 'source_bytes', 0))
         print(f"💾 Cache salvo: {len(zeros)} zeros")
     except Exception as e:
         print(f"❌ Erro ao salvar cache: {e}")
 
 # Load zeros from cache or file with forced reload option
-def load_enhanced_cache(force_reload=False):
-    if not force_reload and os.path.exists(CACHE_FILE):
+def load_enhanced_cache(force_reload=False, load_from_file=True):
+    if not force_reload and (os.path.exists(STORE_FILE) or os.path.exists(CACHE_FILE)):
         try:
             print(f"🔍 Verificando cache existente...")
-            with open(CACHE_FILE, 'rb') as f:
-                data = pickle.load(f)
-                if isinstance(data, list) and len(data) > 0:
-                    print(f"✅ Cache válido: {len(data):,} zeros carregados")
-                    
-                    # Verificar se o cache parece completo
-                    file_size = os.path.getsize(ZEROS_FILE)
-                    expected_zeros = file_size // 20  # Estimativa aproximada (20 bytes por zero)
-                    
-                    if len(data) < expected_zeros * 0.5:  # Se cache tem menos de 50% do esperado
-                        print(f"⚠️ Cache parece incompleto ({len(data):,} vs ~{expected_zeros:,} esperados)")
-                        print(f"🔄 Forçando recarga do arquivo...")
-                        force_reload = True
-                    else:
-                        return data
+            # Store colunar mapeado em memória (converte o pickle antigo na primeira vez)
+            data = load_zero_store(CACHE_FILE)
+            if data is not None and len(data) > 0:
+                print(f"✅ Cache válido: {len(data):,} zeros mapeados")
+                
+                # Verificar se o cache parece completo
+                file_size = os.path.getsize(ZEROS_FILE)
+                expected_zeros = file_size // 20  # Estimativa aproximada (20 bytes por zero)
+                
+                if len(data) < expected_zeros * 0.5:  # Se cache tem menos de 50% do esperado
+                    print(f"⚠️ Cache parece incompleto ({len(data):,} vs ~{expected_zeros:,} esperados)")
+                    print(f"🔄 Forçando recarga do arquivo...")
+                    force_reload = True
+                else:
+                    return data
         except Exception as e:
             print(f"⚠️ Cache inválido ({e}), carregando do arquivo...")
             force_reload = True
     
-    if force_reload or not os.path.exists(CACHE_FILE):
+    # Sem cache válido: o chamador pode preferir processar o arquivo em streaming
+    if load_from_file and (force_reload or not os.path.exists(STORE_FILE)):
         print("📂 Carregando todos os zeros do arquivo original...")
         zeros = load_zeros_from_file(ZEROS_FILE)
         if zeros:
@@ -297,132 +192,55 @@ def load_enhanced_cache(force_reload=False):
             return zeros
     return []
 
-def find_resonances_for_constant(args):
-    const_name, const_value, zeros, tolerances = args
-    results = {}
-    for tolerance in tolerances:
-        resonances = []
-        for n, gamma in zeros:
-            mod_val = gamma % const_value
-            min_distance = min(mod_val, const_value - mod_val)
-            if min_distance < tolerance:
-                resonances.append((n, gamma, min_distance, tolerance))
-        results[tolerance] = resonances
-    return const_name, results
+def init_resonance_worker(store_file=None):
+    """Pré-aquece o worker com o mapeamento do store de zeros"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C é tratado só pelo processo principal
+    if store_file is not None:
+        attach_zero_store(store_file, 0, 0)  # Mapeia o store uma vez; os lotes reutilizam o mapeamento
+
+def create_resonance_pool(store_file=None):
+    """Pool de workers de longa duração para uma sessão do hunter"""
+    return ProcessPoolExecutor(max_workers=MAX_WORKERS, initializer=init_resonance_worker,
+                               initargs=(store_file,))
+
+def family_engine():
+    """Motor unificado só com a família deste hunter"""
+    return UnifiedResonanceEngine(load_constant_families([CONSTANT_FAMILY.name]))
+
+def scan_zero_slice(zeros):
+    """Ressonâncias de uma fatia do lote e o motor que a processou (resíduos confirmados em mpmath)"""
+    engine = family_engine()
+    indices, gammas = zeros_as_arrays(zeros)
+    return engine.process_block(indices, gammas, collect=True)[CONSTANT_FAMILY.name], engine
 
 # Find resonances at multiple tolerance levels with force-specific tolerances
-def find_multi_tolerance_resonances(zeros, constants_dict=None):
-    if constants_dict is None:
-        constants_dict = FUNDAMENTAL_FORCES
-    all_results = {}
-    with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        tasks = [(name, value, zeros, FORCE_TOLERANCES.get(name, TOLERANCE_LEVELS))
-                 for name, value in constants_dict.items()]
-        for const_name, results in executor.map(find_resonances_for_constant, tasks):
-            all_results[const_name] = results
+# Fatias contíguas do lote vão aos workers; os motores das fatias são somados ao da sessão
+# na ordem dos zeros. Devolve as ressonâncias do lote de todas as constantes da família
+def find_multi_tolerance_resonances(zeros, engine, executor=None):
+    all_results = {const_name: {} for const_name in CONSTANT_FAMILY.constants}
+    # Cada tarefa leva só (caminho, offset, tamanho) da sua fatia de zeros
+    with shared_zeros(zeros) as shared:
+        bounds = np.linspace(0, len(shared), MAX_WORKERS + 1).astype(int)
+        tasks = [shared[start:stop] for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        if executor is None:
+            with create_resonance_pool() as pool:
+                outputs = list(pool.map(scan_zero_slice, tasks))
+        else:
+            outputs = list(executor.map(scan_zero_slice, tasks))
+    for slice_results, slice_engine in outputs:
+        engine.merge(slice_engine)
+        for const_name, results in slice_results.items():
+            for tolerance, resonances in results.items():
+                all_results[const_name].setdefault(tolerance, []).extend(resonances)
     return all_results
 
-# Enhanced statistical analysis with validation
-def enhanced_statistical_analysis(zeros, resonances, constant_value, tolerance):
-    if len(zeros) == 0 or len(resonances) == 0:
-        return None
-    total_zeros = len(zeros)
-    resonant_count = len(resonances)
-    expected_random = total_zeros * (2 * tolerance / constant_value)
-    
-    # Validação básica para evitar valores inválidos
-    if constant_value <= 0 or tolerance <= 0:
-        return None
-        
-    results = {
-        'basic_stats': {
-            'total_zeros': total_zeros,
-            'resonant_count': resonant_count,
-            'expected_random': expected_random,
-            'resonance_rate': resonant_count / total_zeros,
-            'significance_factor': resonant_count / expected_random if expected_random > 0 else float('inf')
-        }
-    }
-    
-    # Teste qui-quadrado (apenas se esperado >= 5)
-    if expected_random >= 5:
-        chi2_stat = (resonant_count - expected_random)**2 / expected_random
-        chi2_pvalue = 1 - stats.chi2.cdf(chi2_stat, df=1)
-        results['chi2_test'] = {
-            'statistic': chi2_stat,
-            'p_value': chi2_pvalue,
-            'critical_value_05': 3.841,
-            'significant': chi2_stat > 3.841
-        }
-    
-    # Teste binomial com validação de probabilidade
-    p_expected = 2 * tolerance / constant_value
-    
-    # Verificar se p_expected está no intervalo válido [0,1]
-    if 0 <= p_expected <= 1:
-        try:
-            binom_result = stats.binomtest(resonant_count, total_zeros, p_expected, alternative='two-sided')
-            binom_pvalue = binom_result.pvalue
-        except AttributeError:
-            try:
-                binom_pvalue = stats.binom_test(resonant_count, total_zeros, p_expected, alternative='two-sided')
-            except AttributeError:
-                from scipy.stats import binom
-                binom_pvalue = 2 * min(binom.cdf(resonant_count, total_zeros, p_expected),
-                                      1 - binom.cdf(resonant_count - 1, total_zeros, p_expected))
-        except Exception as e:
-            print(f"    Aviso: Teste binomial falhou: {e}")
-            binom_pvalue = 1.0  # p-value neutro em caso de erro
-            
-        results['binomial_test'] = {
-            'p_value': binom_pvalue,
-            'significant': binom_pvalue < 0.05
-        }
-    else:
-        # Se p_expected é inválido, não fazer teste binomial
-        print(f"    Aviso: p_expected={p_expected:.2e} fora do intervalo [0,1] - pulando teste binomial")
-        results['binomial_test'] = {
-            'p_value': 1.0,  # p-value neutro
-            'significant': False,
-            'invalid_probability': True
-        }
-    
-    # Teste de Poisson (mais robusto para casos extremos)
-    if expected_random > 0:
-        try:
-            poisson_pvalue = 1 - stats.poisson.cdf(resonant_count - 1, expected_random)
-            results['poisson_test'] = {
-                'p_value': poisson_pvalue,
-                'significant': poisson_pvalue < 0.05
-            }
-        except Exception as e:
-            print(f"    Aviso: Teste de Poisson falhou: {e}")
-            results['poisson_test'] = {
-                'p_value': 1.0,
-                'significant': False
-            }
-    
-    # Teste Kolmogorov-Smirnov
-    residuals = [min(gamma % constant_value, constant_value - (gamma % constant_value)) for _, gamma in zeros]
-    if len(residuals) > MINIMUM_FOR_STATS:
-        ks_stat, ks_pvalue = kstest(residuals, 'uniform', args=(0, constant_value))
-        results['ks_test'] = {
-            'statistic': ks_stat,
-            'p_value': ks_pvalue,
-            'significant': ks_pvalue < 0.05
-        }
-    
-    return results
-
 # Compare resonances between different constants
-def comparative_constant_analysis(zeros, tolerance=DEFAULT_TOLERANCE):
-    multi_results = find_multi_tolerance_resonances(zeros, CONTROL_CONSTANTS)
+def comparative_constant_analysis(zeros, family_results, significance, tolerance=DEFAULT_TOLERANCE):
     comparative_stats = {}
-    for const_name, const_results in multi_results.items():
-        if tolerance in const_results:
-            resonances = const_results[tolerance]
-            const_value = CONTROL_CONSTANTS[const_name]
-            stats_result = enhanced_statistical_analysis(zeros, resonances, const_value, tolerance)
+    for const_name, const_value in CONTROL_CONSTANTS.items():
+        if tolerance in family_results[const_name]:
+            resonances = family_results[const_name][tolerance]
+            stats_result = significance.result(const_name, tolerance)
             comparative_stats[const_name] = {
                 'constant_value': const_value,
                 'resonance_count': len(resonances),
@@ -432,18 +250,22 @@ def comparative_constant_analysis(zeros, tolerance=DEFAULT_TOLERANCE):
     return comparative_stats
 
 # Analyze a batch of zeros with significance detection (sem pausa)
-def analyze_batch_with_significance_detection(zeros, batch_num):
+def analyze_batch_with_significance_detection(zeros, batch_num, engine, executor=None):
     print(f"\n🔬 LOTE #{batch_num}: {len(zeros):,} zeros")
     
-    # Análise das constantes fundamentais
-    forces_results = find_multi_tolerance_resonances(zeros, FUNDAMENTAL_FORCES)
+    # Análise das constantes fundamentais (e dos controles) num único passe do motor da sessão
+    family_results = find_multi_tolerance_resonances(zeros, engine, executor)
+    forces_results = {force_name: family_results[force_name] for force_name in FUNDAMENTAL_FORCES}
+    zeros_seen = engine.zeros_seen
+    significance = engine.significance(CONSTANT_FAMILY)  # Todos os p-values do lote de uma vez
     
     significant_found = False
     best_resonances = {}  # Armazenar melhores ressonâncias por constante
     
     print(f"\n🌌 ANÁLISE DAS CONSTANTES FUNDAMENTAIS:")
-    print("| Constante        | Valor         | Tolerância | Ressonâncias | Taxa (%) | Significância |")
-    print("|------------------|---------------|------------|--------------|----------|---------------|")
+    print(f"📊 Ressonâncias, taxa e significância acumuladas sobre {zeros_seen:,} zeros")
+    print("| Constante        | Valor         | Tolerância | Ressonâncias acum. | Taxa acum. (%) | Significância |")
+    print("|------------------|---------------|------------|--------------------|----------------|---------------|")
     
     # Organizar constantes por prioridade para exibição limitada
     priority_constants = [
@@ -460,21 +282,23 @@ def analyze_batch_with_significance_detection(zeros, batch_num):
             continue
             
         force_value = FUNDAMENTAL_FORCES[force_name]
-        # Usar tolerâncias específicas para cada constante
-        tolerances_to_check = FORCE_TOLERANCES.get(force_name, TOLERANCE_LEVELS[:3])
+        # Usar tolerâncias específicas para cada constante (todas: o índice ordenado as torna baratas)
+        tolerances_to_check = FORCE_TOLERANCES.get(force_name, TOLERANCE_LEVELS)
         
         # Mostrar apenas a tolerância mais significativa para economizar espaço
         best_tolerance_result = None
         best_significance = 0
         
-        for tolerance in tolerances_to_check[:3]:
+        for tolerance in tolerances_to_check:
             try:
                 if tolerance in forces_results[force_name]:
                     resonances = forces_results[force_name][tolerance]
-                    count = len(resonances)
-                    rate = count / len(zeros) * 100 if len(zeros) > 0 else 0
+                    # Contagem e taxa acumuladas, sobre os mesmos zeros do fator de significância
+                    accumulator = significance.accumulators[force_name]
+                    count = accumulator.counts.get(tolerance, 0)
+                    rate = count / accumulator.total_zeros * 100 if accumulator.total_zeros > 0 else 0
                     
-                    stats_result = enhanced_statistical_analysis(zeros, resonances, force_value, tolerance)
+                    stats_result = significance.result(force_name, tolerance)
                     sig_factor = stats_result['basic_stats']['significance_factor'] if stats_result else 0
                     
                     if sig_factor > best_significance:
@@ -488,36 +312,35 @@ def analyze_batch_with_significance_detection(zeros, batch_num):
                             best_resonances[force_name] = current_best
                     
                     # Verificar se é significativo e registrar no log
-                    is_sig, reason = is_significant_resonance(resonances, stats_result, force_name, force_value, tolerance)
+                    is_sig, reason = is_significant_resonance(significance, force_name, tolerance)
                     if is_sig:
                         significant_found = True
-                        log_significant_resonance(force_name, force_value, tolerance, resonances, stats_result, len(zeros))
+                        log_significant_resonance(force_name, force_value, tolerance, resonances, stats_result, zeros_seen)
             except Exception as e:
-                print(f"|❌{force_name:16s} | {force_value:.6e} | ERROR     |      ERRO |      N/A |      N/A |")
+                print(f"|❌{force_name:16s} | {force_value:.6e} | ERROR     |             ERRO |            N/A |      N/A |")
                 continue
         
         # Mostrar melhor resultado para esta constante
         if best_tolerance_result:
             tolerance, count, rate, sig_factor, resonances, stats_result = best_tolerance_result
             sig_marker = "🚨" if sig_factor > SIGNIFICANCE_CRITERIA['min_significance_factor'] else "  "
-            print(f"|{sig_marker}{force_name:14s} | {force_value:.6e} | {tolerance:8.0e} | {count:10d} | {rate:8.3f} | {sig_factor:8.2f}x |")
+            print(f"|{sig_marker}{force_name:14s} | {force_value:.6e} | {tolerance:8.0e} | {count:16d} | {rate:14.3f} | {sig_factor:8.2f}x |")
         else:
-            print(f"|  {force_name:14s} | {force_value:.6e} |    N/A    |        N/A |      N/A |      N/A |")
+            print(f"|  {force_name:14s} | {force_value:.6e} |    N/A    |              N/A |            N/A |      N/A |")
     
     # Mostrar resumo de outras constantes se houver resultados interessantes
     other_constants = [name for name in FUNDAMENTAL_FORCES.keys() if name not in priority_constants]
     interesting_others = []
     
     for const_name in other_constants:
-        const_value = FUNDAMENTAL_FORCES[const_name]
-        tolerances_to_check = FORCE_TOLERANCES.get(const_name, TOLERANCE_LEVELS[:3])
+        tolerances_to_check = FORCE_TOLERANCES.get(const_name, TOLERANCE_LEVELS)
         
         max_sig = 0
-        for tolerance in tolerances_to_check[:2]:  # Apenas 2 tolerâncias para economizar tempo
+        for tolerance in tolerances_to_check:
             if tolerance in forces_results[const_name]:
                 resonances = forces_results[const_name][tolerance]
                 if resonances:
-                    stats_result = enhanced_statistical_analysis(zeros, resonances, const_value, tolerance)
+                    stats_result = significance.result(const_name, tolerance)
                     sig_factor = stats_result['basic_stats']['significance_factor'] if stats_result else 0
                     if sig_factor > max_sig:
                         max_sig = sig_factor
@@ -549,7 +372,7 @@ def analyze_batch_with_significance_detection(zeros, batch_num):
     
     # Análise comparativa sempre continua (com tratamento de erro)
     try:
-        comparative_analysis = comparative_constant_analysis(zeros)
+        comparative_analysis = comparative_constant_analysis(zeros, family_results, significance)
     except Exception as e:
         print(f"⚠️ Erro na análise comparativa: {e}")
         comparative_analysis = {}
@@ -645,93 +468,144 @@ def infinite_hunter_fundamental_constants():
                 print(f"   {const_name}: {force_value:.6e} (tol: {tolerances_str})")
     
     print(f"\n📁 Arquivo: {ZEROS_FILE}")
-    print("🛑 Ctrl+C para parar")
+    print("🛑 Ctrl+C para parar (continue depois com --resume)")
     print("🚨 Ressonâncias significativas serão destacadas automaticamente")
     print("=" * 80)
     
     # Verificar se deve forçar recarga
     force_reload = False
-    if len(sys.argv) > 1 and sys.argv[1] == '--force-reload':
+    if '--force-reload' in sys.argv[1:]:
         force_reload = True
         print("🔄 MODO FORÇA RECARGA ATIVADO - Recarregando do arquivo original")
     
-    all_zeros = load_enhanced_cache(force_reload=force_reload)
-    current_count = len(all_zeros)
-    
-    if current_count == 0:
-        print("❌ Nenhum zero carregado. Verifique o arquivo.")
-        return [], [], None
+    # Retomar do último lote concluído de uma execução interrompida
+    checkpointer = BatchCheckpointer(CHECKPOINT_FILE, checkpoint_fingerprint(ZEROS_FILE, INCREMENT))
+    state = checkpointer.resume() if '--resume' in sys.argv[1:] else None
+    next_zero = state['next_zero'] if state else 0
     
-    # Diagnóstico do arquivo original
-    try:
-        file_size = os.path.getsize(ZEROS_FILE)
-        print(f"📊 Arquivo original: {file_size:,} bytes ({file_size/1024/1024:.1f} MB)")
-        with open(ZEROS_FILE, 'r') as f:
-            total_lines = sum(1 for line in f if line.strip())
-        print(f"📊 Linhas no arquivo: {total_lines:,}")
-        print(f"📊 Zeros carregados: {current_count:,}")
+    all_zeros = load_enhanced_cache(force_reload=force_reload, load_from_file=False)
+    current_count = len(all_zeros)
+    streaming = current_count == 0
+    
+    if streaming:
+        # Sem cache: a análise começa enquanto o arquivo ainda está sendo lido
+        if not os.path.exists(ZEROS_FILE):
+            print("❌ Nenhum zero carregado. Verifique o arquivo.")
+            return [], [], None
+        print(f"📂 Processando {ZEROS_FILE} em streaming (cache será salvo ao final)")
+        batch_source = ((batch, bytes_read / file_size if file_size > 0 else 1.0)
+                        for batch, bytes_read, file_size in iter_zero_file_batches(ZEROS_FILE, INCREMENT))
+    else:
+        # Diagnóstico do arquivo original pelo cabeçalho do store, sem reler o arquivo
+        try:
+            file_size = os.path.getsize(ZEROS_FILE)
+            print(f"📊 Arquivo original: {file_size:,} bytes ({file_size/1024/1024:.1f} MB)")
+            print(f"📊 Zeros carregados: {current_count:,}")
+            source_bytes = getattr(all_zeros, 'source_bytes', 0)
+            if source_bytes and source_bytes < file_size * 0.9:  # Se o cache cobre menos de 90% do arquivo
+                print(f"⚠️ AVISO: Cache cobre apenas {(source_bytes/file_size)*100:.1f}% do arquivo!")
+                print(f"💡 Execute com: python3 {sys.argv[0]} --force-reload")
+                
+        except Exception as e:
+            print(f"⚠️ Erro ao verificar arquivo: {e}")
         
-        if current_count < total_lines * 0.9:  # Se carregou menos de 90% das linhas
-            print(f"⚠️ AVISO: Carregou apenas {(current_count/total_lines)*100:.1f}% do arquivo!")
-            print(f"💡 Execute com: python3 {sys.argv[0]} --force-reload")
-            
-    except Exception as e:
-        print(f"⚠️ Erro ao verificar arquivo: {e}")
+        print(f"🎯 PROCESSANDO TODOS OS {current_count:,} ZEROS!")
+        print(f"⏱️ Estimativa: ~{(current_count//INCREMENT)} lotes")
+        batch_source = ((all_zeros[i:min(i + INCREMENT, current_count)], min(i + INCREMENT, current_count) / current_count)
+                        for i in range(next_zero, current_count, INCREMENT))
     
-    print(f"🎯 PROCESSANDO TODOS OS {current_count:,} ZEROS!")
     print(f"📦 Lotes de {INCREMENT:,} zeros cada")
-    print(f"⏱️ Estimativa: ~{(current_count//INCREMENT)} lotes")
     print(f"🔬 Analisando {len(FUNDAMENTAL_FORCES)} constantes fundamentais")
     
-    session_results = []
-    best_overall = {}  # Melhores ressonâncias globais por constante
-    batch_num = 1
+    session_results = state['session_results'] if state else []
+    best_overall = state['best_overall'] if state else {}  # Melhores ressonâncias globais por constante
+    batch_num = state['batch_num'] if state else 1
+    batch_start = 0 if streaming else next_zero  # Em streaming os lotes já analisados são apenas lidos
+    previous_progress = 0.0 if streaming else next_zero / current_count
+    streamed_batches = []  # Lotes lidos em streaming, para salvar o cache ao final
+    # Motor da sessão: acumuladores e melhores ressonâncias de todas as constantes, somados lote a lote
+    engine = family_engine()
+    if state and 'engine' in state:
+        engine.restore(state['engine'])
+    checkpoint_state = lambda: {'batch_num': batch_num, 'next_zero': max(batch_start, next_zero),
+                                'best_overall': best_overall, 'session_results': session_results,
+                                'engine': engine.state()}
+    
+    # Pool da sessão: criado uma vez, pré-aquecido com o store
+    resonance_pool = create_resonance_pool(getattr(all_zeros, 'path', None))
+    try:
+        for batch, progress in batch_source:
+            if shutdown_requested:
+                break
+            
+            batch_end = batch_start + len(batch)
+            if streaming:
+                streamed_batches.append(batch)
+            if batch_end <= next_zero:  # Já analisado antes da interrupção
+                batch_start = batch_end
+                previous_progress = progress
+                continue
+            
+            # Indicador de progresso
+            progress_percent = progress * 100
+            print(f"\n🔬 LOTE #{batch_num}: Zeros {batch_start:,} a {batch_end:,} ({progress_percent:.1f}% concluído)")
+            start_time = time.time()
+            
+            forces_analysis, comparative_analysis, batch_best, decision = analyze_batch_with_significance_detection(batch, batch_num, engine, resonance_pool)
+            
+            # Atualizar melhores ressonâncias globais
+            if batch_best:
+                for const_name, (n, gamma, quality, tolerance) in batch_best.items():
+                    if const_name not in best_overall or quality < best_overall[const_name][2]:
+                        best_overall[const_name] = (n, gamma, quality, tolerance)
+                        print(f"    🎯 NOVO MELHOR GLOBAL para {const_name.upper()}!")
+                        print(f"    Zero #{n:,} → γ={gamma:.12f}, qualidade={quality:.6e}")
+            
+            elapsed = time.time() - start_time
+            zeros_per_sec = len(batch) / elapsed if elapsed > 0 else 0
+            batch_fraction = progress - previous_progress
+            eta_seconds = elapsed * (1 - progress) / batch_fraction if batch_fraction > 0 else 0
+            eta_hours = eta_seconds / 3600
+            
+            print(f"⏱️ Lote processado em {elapsed:.1f}s ({zeros_per_sec:,.0f} zeros/s)")
+            if eta_hours > 0:
+                print(f"📈 ETA para conclusão: {eta_hours:.1f} horas")
+            
+            session_results.append({
+                'batch': batch_num,
+                'timestamp': datetime.now().isoformat(),
+                'zeros_analyzed': batch_end,
+                'batch_time': elapsed,
+                'forces_analysis': forces_analysis,
+                'comparative_analysis': comparative_analysis,
+                'best_resonance': batch_best,
+                'progress_percent': progress_percent
+            })
+            
+            batch_num += 1
+            batch_start = batch_end
+            previous_progress = progress
+            checkpointer.update(checkpoint_state())
+    finally:
+        # Encerramento limpo (inclusive após shutdown_requested): descarta tarefas pendentes
+        resonance_pool.shutdown(wait=True, cancel_futures=True)
     
-    for i in range(0, current_count, INCREMENT):
-        if shutdown_requested:
-            break
-        
-        batch_start = i
-        batch_end = min(i + INCREMENT, current_count)
-        batch = all_zeros[batch_start:batch_end]
-        
-        # Indicador de progresso
-        progress_percent = (batch_end / current_count) * 100
-        print(f"\n🔬 LOTE #{batch_num}: Zeros {batch_start:,} a {batch_end:,} ({progress_percent:.1f}% concluído)")
-        start_time = time.time()
-        
-        forces_analysis, comparative_analysis, batch_best, decision = analyze_batch_with_significance_detection(batch, batch_num)
-        
-        # Atualizar melhores ressonâncias globais
-        if batch_best:
-            for const_name, (n, gamma, quality, tolerance) in batch_best.items():
-                if const_name not in best_overall or quality < best_overall[const_name][2]:
-                    best_overall[const_name] = (n, gamma, quality, tolerance)
-                    print(f"    🎯 NOVO MELHOR GLOBAL para {const_name.upper()}!")
-                    print(f"    Zero #{n:,} → γ={gamma:.12f}, qualidade={quality:.6e}")
-        
-        elapsed = time.time() - start_time
-        zeros_per_sec = len(batch) / elapsed if elapsed > 0 else 0
-        remaining_zeros = current_count - batch_end
-        eta_seconds = remaining_zeros / zeros_per_sec if zeros_per_sec > 0 else 0
-        eta_hours = eta_seconds / 3600
-        
-        print(f"⏱️ Lote processado em {elapsed:.1f}s ({zeros_per_sec:,.0f} zeros/s)")
-        if eta_hours > 0:
-            print(f"📈 ETA para conclusão: {eta_hours:.1f} horas")
-        
-        session_results.append({
-            'batch': batch_num,
-            'timestamp': datetime.now().isoformat(),
-            'zeros_analyzed': batch_end,
-            'batch_time': elapsed,
-            'forces_analysis': forces_analysis,
-            'comparative_analysis': comparative_analysis,
-            'best_resonance': batch_best,
-            'progress_percent': progress_percent
-        })
-        
-        batch_num += 1
+    if shutdown_requested:
+        checkpointer.save(checkpoint_state())
+        print(f"💡 Continue com: python3 {sys.argv[0]} --resume")
+    else:
+        checkpointer.finish()  # Varredura completa: a próxima execução começa do início
+    
+    if streaming:
+        if not streamed_batches:
+            print("❌ Nenhum zero carregado. Verifique o arquivo.")
+            return [], [], None
+        all_zeros = ZeroStore(np.concatenate([b.indices for b in streamed_batches]),
+                              np.concatenate([b.gammas for b in streamed_batches]),
+                              int(previous_progress * os.path.getsize(ZEROS_FILE)))  # Cobertura parcial se interrompido
+        current_count = len(all_zeros)
+        print(f"💾 Salvando {current_count:,} zeros no cache...")
+        save_enhanced_cache(all_zeros)
     
     print(f"\n📊 Gerando relatório final...")
     generate_comprehensive_report(all_zeros, session_results, batch_num-1, best_overall, categories)
@@ -795,7 +669,7 @@ if __name__ == "__main__":
         if zeros and len(zeros) > 0:
             print(f"\n🎯 Análise Concluída!")
             print(f"📁 Resultados em: {RESULTS_DIR}/")
-            print(f"💾 Cache: {CACHE_FILE}")
+            print(f"💾 Cache: {STORE_FILE}")
             print(f"📊 Estatísticas: {STATS_FILE}")
     except KeyboardInterrupt:
         print(f"\n⏹️ Análise interrompida. Progresso salvo.")
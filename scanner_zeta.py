@@ -7,53 +7,29 @@ Date: 2025-08-10
 Modificado para buscar ressonâncias com as 4 forças fundamentais
 """
 
-import numpy as np
 from mpmath import mp
 import time
 from concurrent.futures import ProcessPoolExecutor
-import pickle
 import os
 import signal
 import sys
 from datetime import datetime
-from scipy import stats
 from scipy.stats import kstest, anderson
 import warnings
+from zvt_kernels import zeros_as_arrays
+from zvt_zero_store import store_path_for, load_zero_store, write_zero_store, read_zero_file
+from zvt_checkpoint import BatchCheckpointer, checkpoint_path_for, checkpoint_fingerprint
+from zvt_engine import UnifiedResonanceEngine, load_constant_families
+from zvt_families import (ABSOLUTE_TOLERANCE_LEVELS as TOLERANCE_LEVELS, FOUR_FORCES as FUNDAMENTAL_FORCES,
+                          FOUR_FORCE_TOLERANCES as FORCE_TOLERANCES,
+                          FOUR_FORCES_CONTROL_CONSTANTS as CONTROL_CONSTANTS, FOUR_FORCES_FAMILY as CONSTANT_FAMILY)
+from zvt_statistics import batch_significance, significance_record
 
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
 # Configuration
 mp.dps = 50  # High precision
 
-# 4 FORÇAS FUNDAMENTAIS DA FÍSICA
-FUNDAMENTAL_FORCES = {
-    'eletromagnetica': 1 / 137.035999084,      # α (constante de estrutura fina)
-    'forte': 0.1185,                           # αs (constante de acoplamento forte at MZ)
-    'fraca': 0.0338,                           # αW (constante de acoplamento fraca)
-    'gravitacional': 5.906e-39                 # αG (constante gravitacional adimensional)
-}
-
-# Tolerâncias específicas para cada força (ajustadas às suas magnitudes)
-FORCE_TOLERANCES = {
-    'eletromagnetica': [1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9],
-    'forte': [1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7],
-    'fraca': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],
-    'gravitacional': [1e-38, 1e-39, 1e-40, 1e-41, 1e-42, 1e-43]  # Tolerâncias apropriadas para escala gravitacional
-}
-
-# Constantes de controle para validação estatística
-CONTROL_CONSTANTS = {
-    'eletromagnetica': FUNDAMENTAL_FORCES['eletromagnetica'],
-    'forte': FUNDAMENTAL_FORCES['forte'],
-    'fraca': FUNDAMENTAL_FORCES['fraca'], 
-    'random_1': 1 / 142.7,
-    'random_2': 1 / 129.3,
-    'golden_ratio': (np.sqrt(5) - 1) / 2,
-    'pi_scale': np.pi / 100,
-    'e_scale': np.e / 100
-}
-
-TOLERANCE_LEVELS = [1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9]
 DEFAULT_TOLERANCE = 1e-5
 INCREMENT = 10000  # Lotes maiores para processar mais rapidamente os 2M+ zeros
 
@@ -67,7 +43,9 @@ SIGNIFICANCE_CRITERIA = {
 
 MAX_WORKERS = os.cpu_count()
 CACHE_FILE = "zeta_zeros_cache.pkl"
+STORE_FILE = store_path_for(CACHE_FILE)  # Store colunar preferido ao pickle
 STATS_FILE = "zvt_4forces_stats.txt"
+CHECKPOINT_FILE = checkpoint_path_for(STATS_FILE)  # Progresso da varredura para --resume
 RESULTS_DIR = "zvt_4forces_results"
 ZEROS_FILE = os.path.expanduser("~/zeta/zero.txt")  # Path to the zeros file
 
@@ -159,37 +137,11 @@ def log_significant_resonance(force_name, constant_value, tolerance, resonances,
 
 # Load zeros from a file with progress indicator
 def load_zeros_from_file(filename):
-    zeros = []
     try:
         print(f"📂 Carregando zeros do arquivo: {filename}")
-        
-        # Primeiro, contar total de linhas para mostrar progresso
-        print("📊 Contando linhas do arquivo...")
-        with open(filename, 'r') as f:
-            total_lines = sum(1 for line in f if line.strip())
-        print(f"📊 Total de linhas encontradas: {total_lines:,}")
-        
-        with open(filename, 'r') as f:
-            progress_counter = 0
-            for line_num, line in enumerate(f, start=1):
-                if shutdown_requested:
-                    break
-                line = line.strip()
-                if line:
-                    try:
-                        zero = float(line)
-                        zeros.append((line_num, zero))  # Format: (index, value)
-                        progress_counter += 1
-                        
-                        # Mostrar progresso a cada 100,000 zeros
-                        if progress_counter % 100000 == 0:
-                            percent = (progress_counter / total_lines) * 100
-                            print(f"📈 Carregados {progress_counter:,} zeros ({percent:.1f}%)")
-                            
-                    except ValueError:
-                        print(f"⚠️ Linha inválida {line_num}: '{line}'")
-                        continue
-        print(f"✅ {len(zeros):,} zeros carregados com sucesso de {total_lines:,} linhas")
+        # Leitura única em blocos, progresso pelo offset em bytes
+        zeros = read_zero_file(filename, should_stop=lambda: shutdown_requested)
+        print(f"✅ {len(zeros):,} zeros carregados")
         return zeros
     except Exception as e:
         print(f"❌ Erro ao ler arquivo: {e}")
@@ -198,41 +150,41 @@ def load_zeros_from_file(filename):
 # Save zeros to cache
 def save_enhanced_cache(zeros, backup=True):
     try:
-        if backup and os.path.exists(CACHE_FILE):
-            backup_file = f"{CACHE_FILE}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            os.rename(CACHE_FILE, backup_file)
+        if backup and os.path.exists(STORE_FILE):
+            backup_file = f"{STORE_FILE}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            os.rename(STORE_FILE, backup_file)
             print(f"📦 Backup do cache criado: {backup_file}")
-        with open(CACHE_FILE, 'wb') as f:
-            pickle.dump(zeros, f, protocol=pickle.HIGHEST_PROTOCOL)
+        indices, gammas = zeros_as_arrays(zeros)
+        write_zero_store(STORE_FILE, indices, gammas, getattr(zeros, 'source_bytes', 0))
         print(f"💾 Cache salvo: {len(zeros)} zeros")
     except Exception as e:
         print(f"❌ Erro ao salvar cache: {e}")
 
 # Load zeros from cache or file with forced reload option
 def load_enhanced_cache(force_reload=False):
-    if not force_reload and os.path.exists(CACHE_FILE):
+    if not force_reload and (os.path.exists(STORE_FILE) or os.path.exists(CACHE_FILE)):
         try:
             print(f"🔍 Verificando cache existente...")
-            with open(CACHE_FILE, 'rb') as f:
-                data = pickle.load(f)
-                if isinstance(data, list) and len(data) > 0:
-                    print(f"✅ Cache válido: {len(data):,} zeros carregados")
-                    
-                    # Verificar se o cache parece completo
-                    file_size = os.path.getsize(ZEROS_FILE)
-                    expected_zeros = file_size // 20  # Estimativa aproximada (20 bytes por zero)
-                    
-                    if len(data) < expected_zeros * 0.5:  # Se cache tem menos de 50% do esperado
-                        print(f"⚠️ Cache parece incompleto ({len(data):,} vs ~{expected_zeros:,} esperados)")
-                        print(f"🔄 Forçando recarga do arquivo...")
-                        force_reload = True
-                    else:
-                        return data
+            # Store colunar mapeado em memória (converte o pickle antigo na primeira vez)
+            data = load_zero_store(CACHE_FILE)
+            if data is not None and len(data) > 0:
+                print(f"✅ Cache válido: {len(data):,} zeros mapeados")
+                
+                # Verificar se o cache parece completo
+                file_size = os.path.getsize(ZEROS_FILE)
+                expected_zeros = file_size // 20  # Estimativa aproximada (20 bytes por zero)
+                
+                if len(data) < expected_zeros * 0.5:  # Se cache tem menos de 50% do esperado
+                    print(f"⚠️ Cache parece incompleto ({len(data):,} vs ~{expected_zeros:,} esperados)")
+                    print(f"🔄 Forçando recarga do arquivo...")
+                    force_reload = True
+                else:
+                    return data
         except Exception as e:
             print(f"⚠️ Cache inválido ({e}), carregando do arquivo...")
             force_reload = True
     
-    if force_reload or not os.path.exists(CACHE_FILE):
+    if force_reload or not os.path.exists(STORE_FILE):
         print("📂 Carregando todos os zeros do arquivo original...")
         zeros = load_zeros_from_file(ZEROS_FILE)
         if zeros:
@@ -241,29 +193,11 @@ def load_enhanced_cache(force_reload=False):
             return zeros
     return []
 
-# Find resonances at multiple tolerance levels with force-specific tolerances
-def find_multi_tolerance_resonances(zeros, constants_dict=None):
-    if constants_dict is None:
-        constants_dict = FUNDAMENTAL_FORCES
-    all_results = {}
-    for const_name, const_value in constants_dict.items():
-        all_results[const_name] = {}
-        
-        # Usar tolerâncias específicas para cada força ou tolerâncias genéricas para outras constantes
-        if const_name in FORCE_TOLERANCES:
-            tolerances_to_use = FORCE_TOLERANCES[const_name]
-        else:
-            tolerances_to_use = TOLERANCE_LEVELS
-            
-        for tolerance in tolerances_to_use:
-            resonances = []
-            for n, gamma in zeros:
-                mod_val = gamma % const_value
-                min_distance = min(mod_val, const_value - mod_val)
-                if min_distance < tolerance:
-                    resonances.append((n, gamma, min_distance, tolerance))
-            all_results[const_name][tolerance] = resonances
-    return all_results
+# Ressonâncias do lote de todas as constantes da família (tolerâncias específicas de cada força),
+# num único passe do motor unificado
+def find_multi_tolerance_resonances(zeros, engine):
+    indices, gammas = zeros_as_arrays(zeros)
+    return engine.process_block(indices, gammas, collect=True)[CONSTANT_FAMILY.name]
 
 # Enhanced statistical analysis with validation
 def enhanced_statistical_analysis(zeros, resonances, constant_value, tolerance):
@@ -271,85 +205,19 @@ def enhanced_statistical_analysis(zeros, resonances, constant_value, tolerance):
         return None
     total_zeros = len(zeros)
     resonant_count = len(resonances)
-    expected_random = total_zeros * (2 * tolerance / constant_value)
     
     # Validação básica para evitar valores inválidos
     if constant_value <= 0 or tolerance <= 0:
         return None
-        
-    results = {
-        'basic_stats': {
-            'total_zeros': total_zeros,
-            'resonant_count': resonant_count,
-            'expected_random': expected_random,
-            'resonance_rate': resonant_count / total_zeros,
-            'significance_factor': resonant_count / expected_random if expected_random > 0 else float('inf')
-        }
-    }
-    
-    # Teste qui-quadrado (apenas se esperado >= 5)
-    if expected_random >= 5:
-        chi2_stat = (resonant_count - expected_random)**2 / expected_random
-        chi2_pvalue = 1 - stats.chi2.cdf(chi2_stat, df=1)
-        results['chi2_test'] = {
-            'statistic': chi2_stat,
-            'p_value': chi2_pvalue,
-            'critical_value_05': 3.841,
-            'significant': chi2_stat > 3.841
-        }
-    
-    # Teste binomial com validação de probabilidade
-    p_expected = 2 * tolerance / constant_value
-    
-    # Verificar se p_expected está no intervalo válido [0,1]
-    if 0 <= p_expected <= 1:
-        try:
-            binom_result = stats.binomtest(resonant_count, total_zeros, p_expected, alternative='two-sided')
-            binom_pvalue = binom_result.pvalue
-        except AttributeError:
-            try:
-                binom_pvalue = stats.binom_test(resonant_count, total_zeros, p_expected, alternative='two-sided')
-            except AttributeError:
-                from scipy.stats import binom
-                binom_pvalue = 2 * min(binom.cdf(resonant_count, total_zeros, p_expected),
-                                      1 - binom.cdf(resonant_count - 1, total_zeros, p_expected))
-        except Exception as e:
-            print(f"    Aviso: Teste binomial falhou: {e}")
-            binom_pvalue = 1.0  # p-value neutro em caso de erro
-            
-        results['binomial_test'] = {
-            'p_value': binom_pvalue,
-            'significant': binom_pvalue < 0.05
-        }
-    else:
-        # Se p_expected é inválido, não fazer teste binomial
-        print(f"    Aviso: p_expected={p_expected:.2e} fora do intervalo [0,1] - pulando teste binomial")
-        results['binomial_test'] = {
-            'p_value': 1.0,  # p-value neutro
-            'significant': False,
-            'invalid_probability': True
-        }
-    
-    # Teste de Poisson (mais robusto para casos extremos)
-    if expected_random > 0:
-        try:
-            poisson_pvalue = 1 - stats.poisson.cdf(resonant_count - 1, expected_random)
-            results['poisson_test'] = {
-                'p_value': poisson_pvalue,
-                'significant': poisson_pvalue < 0.05
-            }
-        except Exception as e:
-            print(f"    Aviso: Teste de Poisson falhou: {e}")
-            results['poisson_test'] = {
-                'p_value': 1.0,
-                'significant': False
-            }
+    
+    # Qui-quadrado, binomial e Poisson numa única chamada vetorizada
+    results = significance_record(batch_significance(resonant_count, total_zeros, 2 * tolerance / constant_value), 0)
     
     return results
 
 # Compare resonances between different constants
-def comparative_constant_analysis(zeros, tolerance=DEFAULT_TOLERANCE):
-    multi_results = find_multi_tolerance_resonances(zeros, CONTROL_CONSTANTS)
+def comparative_constant_analysis(zeros, family_results, tolerance=DEFAULT_TOLERANCE):
+    multi_results = {const_name: family_results[const_name] for const_name in CONTROL_CONSTANTS}
     comparative_stats = {}
     for const_name, const_results in multi_results.items():
         if tolerance in const_results:
@@ -365,11 +233,11 @@ def comparative_constant_analysis(zeros, tolerance=DEFAULT_TOLERANCE):
     return comparative_stats
 
 # Analyze a batch of zeros with significance detection (sem pausa)
-def analyze_batch_with_significance_detection(zeros, batch_num):
+def analyze_batch_with_significance_detection(zeros, batch_num, family_results):
     print(f"\n🔬 LOTE #{batch_num}: {len(zeros):,} zeros")
     
     # Análise das 4 forças fundamentais
-    forces_results = find_multi_tolerance_resonances(zeros, FUNDAMENTAL_FORCES)
+    forces_results = {force_name: family_results[force_name] for force_name in FUNDAMENTAL_FORCES}
     
     significant_found = False
     best_resonances = {}  # Armazenar melhores ressonâncias por força
@@ -425,7 +293,7 @@ def analyze_batch_with_significance_detection(zeros, batch_num):
     
     # Análise comparativa sempre continua (com tratamento de erro)
     try:
-        comparative_analysis = comparative_constant_analysis(zeros)
+        comparative_analysis = comparative_constant_analysis(zeros, family_results)
     except Exception as e:
         print(f"⚠️ Erro na análise comparativa: {e}")
         comparative_analysis = {}
@@ -475,13 +343,13 @@ def infinite_hunter_four_forces():
         print(f"🔬 {force_name.upper()}: {force_value:.15e} (tolerâncias: {tolerances_str})")
     
     print(f"\n📁 Arquivo: {ZEROS_FILE}")
-    print("🛑 Ctrl+C para parar")
+    print("🛑 Ctrl+C para parar (continue depois com --resume)")
     print("🚨 Ressonâncias significativas serão destacadas automaticamente")
     print("=" * 80)
     
     # Verificar se deve forçar recarga
     force_reload = False
-    if len(sys.argv) > 1 and sys.argv[1] == '--force-reload':
+    if '--force-reload' in sys.argv[1:]:
         force_reload = True
         print("🔄 MODO FORÇA RECARGA ATIVADO - Recarregando do arquivo original")
     
@@ -516,11 +384,22 @@ def infinite_hunter_four_forces():
     print(f"📦 Lotes de {INCREMENT:,} zeros cada")
     print(f"⏱️ Estimativa: ~{(current_count//INCREMENT)} lotes")
     
-    session_results = []
-    best_overall = {}  # Melhores ressonâncias globais por força
-    batch_num = 1
-    
-    for i in range(0, current_count, INCREMENT):
+    # Retomar do último lote concluído de uma execução interrompida
+    checkpointer = BatchCheckpointer(CHECKPOINT_FILE, checkpoint_fingerprint(ZEROS_FILE, INCREMENT))
+    state = checkpointer.resume() if '--resume' in sys.argv[1:] else None
+    session_results = state['session_results'] if state else []
+    best_overall = state['best_overall'] if state else {}  # Melhores ressonâncias globais por força
+    batch_num = state['batch_num'] if state else 1
+    # Motor unificado só com a família das 4 forças (forças e controles no mesmo passe)
+    engine = UnifiedResonanceEngine(load_constant_families([CONSTANT_FAMILY.name]))
+    if state and 'engine' in state:
+        engine.restore(state['engine'])
+    checkpoint_state = lambda: {'batch_num': batch_num,
+                                'next_zero': session_results[-1]['zeros_analyzed'] if session_results else 0,
+                                'best_overall': best_overall, 'session_results': session_results,
+                                'engine': engine.state()}
+    
+    for i in range(state['next_zero'] if state else 0, current_count, INCREMENT):
         if shutdown_requested:
             break
         
@@ -533,7 +412,8 @@ def infinite_hunter_four_forces():
         print(f"\n🔬 LOTE #{batch_num}: Zeros {batch_start:,} a {batch_end:,} ({progress_percent:.1f}% concluído)")
         start_time = time.time()
         
-        forces_analysis, comparative_analysis, batch_best, decision = analyze_batch_with_significance_detection(batch, batch_num)
+        family_results = find_multi_tolerance_resonances(batch, engine)
+        forces_analysis, comparative_analysis, batch_best, decision = analyze_batch_with_significance_detection(batch, batch_num, family_results)
         
         # Atualizar melhores ressonâncias globais
         if batch_best:
@@ -565,6 +445,13 @@ def infinite_hunter_four_forces():
         })
         
         batch_num += 1
+        checkpointer.update(checkpoint_state())
+    
+    if shutdown_requested:
+        checkpointer.save(checkpoint_state())
+        print(f"💡 Continue com: python3 {sys.argv[0]} --resume")
+    else:
+        checkpointer.finish()  # Varredura completa: a próxima execução começa do início
     
     print(f"\n📊 Gerando relatório final...")
     generate_comprehensive_report(all_zeros, session_results, batch_num-1)
@@ -622,7 +509,7 @@ if __name__ == "__main__":
         if zeros and len(zeros) > 0:
             print(f"\n🎯 Análise Concluída!")
             print(f"📁 Resultados em: {RESULTS_DIR}/")
-            print(f"💾 Cache: {CACHE_FILE}")
+            print(f"💾 Cache: {STORE_FILE}")
             print(f"📊 Estatísticas: {STATS_FILE}")
     except KeyboardInterrupt:
         print(f"\n⏹️ Análise interrompida. Progresso salvo.")
@@ -11,8 +11,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
-import pickle
+from zvt_zero_store import load_zero_store, shared_zeros
+from zvt_kernels import zeros_as_arrays, best_resonances, folded_residuals, is_resolved
+from zvt_precision import float64_margin
+from zvt_random import root_seed_sequence, stream_generator, simulation_blocks, int_option
+from zvt_statistics import clopper_pearson, interval_clear_of
 import os
+import sys
 from datetime import datetime
 from scipy import stats
 from concurrent.futures import ProcessPoolExecutor, as_completed
@@ -72,8 +77,117 @@ PHYSICS_CATEGORIES = {
     'Matemáticas': ['euler_mascheroni']
 }
 
+# Modo adaptativo (--adaptive): cada nível para quando as taxas têm veredito decidido
+RATE_THRESHOLDS = (0.2, 0.3, 0.4)  # Limiares das interpretações do relatório
+ADAPTIVE_FIRST_ROUND = 500  # Simulações da primeira rodada; cada rodada dobra o total
+
+# Varredura vetorizada: tensor níveis × simulações × constantes avaliado em blocos
+PERTURBATION_BATCH = 250  # Simulações por tarefa (matriz 250 × 19 constantes)
+CONSTANT_NAMES = list(REAL_CONSTANTS)
+CATEGORY_COLUMNS = {category: [CONSTANT_NAMES.index(name) for name in constants if name in REAL_RESULTS]
+                    for category, constants in PHYSICS_CATEGORIES.items()
+                    if any(name in REAL_RESULTS for name in constants)}  # Colunas com resultado real
+REAL_QUALITY_ROW = np.array([REAL_RESULTS[name]['quality'] if name in REAL_RESULTS else np.nan
+                             for name in CONSTANT_NAMES])
+
+# Curvas de resposta (--curves): qualidade como função contínua da perturbação relativa ε
+CURVE_POINTS = 100_000  # Valores de ε por constante (metade de cada lado de 0)
+CURVE_LOG_MIN, CURVE_LOG_MAX = -12, -2  # |ε| de 1e-12 a 1e-2 (1%, o maior nível discreto)
+CURVE_RANK = 16  # Posto do limiar T que garante a exatidão dos pontos rastreados
+CURVE_MIN_CANDIDATES = 64
+CURVE_ESCAPE_FACTOR = 10  # Largura do poço: menor |ε| com q(ε) ≥ 10·q(0)
+
+
+def perturbation_tensor(entropy, perturbation_levels, n_simulations):
+    """Constantes perturbadas (níveis × simulações × constantes) com ruído gaussiano
+
+    Cada (nível, simulação) tem seu próprio stream, como antes: a linha é
+    real × (1 + σ·z), igual bit a bit a rng.normal(1, σ) constante a constante.
+    """
+    real_values = np.array(list(REAL_CONSTANTS.values()))
+    tensor = np.empty((len(perturbation_levels), n_simulations, len(real_values)))
+    for level_index, perturbation_percent in enumerate(perturbation_levels):
+        noise = np.array([stream_generator(entropy, level_index, simulation_id).standard_normal(len(real_values))
+                          for simulation_id in range(n_simulations)]).reshape(n_simulations, len(real_values))
+        tensor[level_index] = real_values * (1.0 + perturbation_percent / 100 * noise)
+    return tensor
+
+
+def evaluate_perturbation_block(zeros, constants):
+    """Melhor ressonância de cada constante de um bloco: (qualidade, índice do zero, gamma)
+
+    Constantes abaixo do limite de resolução dos zeros saem com (NaN, −1, NaN).
+    """
+    indices, gammas = zeros_as_arrays(zeros)
+    qualities, positions = best_resonances(gammas, constants)
+    resolved = positions >= 0
+    return qualities, np.where(resolved, indices[positions], -1), np.where(resolved, gammas[positions], np.nan)
+
+
+def response_epsilons(n_points=CURVE_POINTS):
+    """Perturbações relativas ε ordenadas: ±|ε| log-espaçados de cada lado, mais ε = 0"""
+    magnitudes = np.logspace(CURVE_LOG_MIN, CURVE_LOG_MAX, n_points // 2)
+    return np.concatenate([-magnitudes[::-1], [0.0], magnitudes])
+
+
+def perturbation_response_curve(zeros, constant_value, epsilons):
+    """Melhor qualidade q(ε) de c·(1+ε) em todos os ε ordenados, rastreando candidatos
+
+    O resíduo de cada zero é Lipschitz em ε (|dr/dε| ≤ γ/(1+ε) + c/2). Após uma
+    varredura completa em ε_a, T = r_(CURVE_RANK) e θ = r_(B): nenhum zero com
+    r > θ desce abaixo de T até ε_a + (θ − T)/L, então os pontos seguintes só
+    avaliam os B candidatos. B equilibra a varredura completa com a matriz
+    candidatos × pontos; onde o passo de ε é grosso cada ponto é varrido inteiro,
+    e pontos com q > T (não garantidos) também. Devolve (q, índice do zero, avaliações).
+    """
+    indices, gammas = zeros_as_arrays(zeros)
+    n_zeros = len(gammas)
+    qualities = np.full(len(epsilons), np.inf)
+    positions = np.zeros(len(epsilons), dtype=np.int64)
+    gamma_max = float(np.max(np.abs(gammas)))
+    margin = 2 * float(np.max(float64_margin(gammas)))  # Erro float64 em r e em q
+    evaluations = 0
+    
+    def full_scan(j):
+        residuals = folded_residuals(gammas, constant_value * (1 + epsilons[j]))
+        positions[j] = int(np.argmin(residuals))
+        qualities[j] = residuals[positions[j]]
+        return residuals
+    
+    start = 0
+    while start < len(epsilons):
+        residuals = full_scan(start)
+        evaluations += n_zeros
+        end = start + 1
+        if end < len(epsilons) and n_zeros > 2 * CURVE_RANK:
+            lipschitz = gamma_max / (1 + epsilons[start]) + constant_value / 2
+            # Custo por ponto N/(B·κ) + B, mínimo em B = √(N/κ); κ = pontos por candidato
+            kappa = constant_value / (2 * n_zeros) / (lipschitz * (epsilons[end] - epsilons[start]))
+            budget = int(np.sqrt(n_zeros / kappa)) if kappa > 0 else n_zeros
+            if budget < n_zeros // 2:
+                budget = max(budget, CURVE_MIN_CANDIDATES)
+                ordered = np.partition(residuals, [CURVE_RANK, budget])
+                threshold, reach = ordered[CURVE_RANK], ordered[budget]
+                width = (reach - threshold - margin) / lipschitz
+                end = max(end, int(np.searchsorted(epsilons, epsilons[start] + width, side='right')))
+                if end > start + 1:
+                    candidates = np.flatnonzero(residuals <= reach)
+                    segment = slice(start + 1, end)
+                    segment_qualities, segment_positions = best_resonances(
+                        gammas[candidates], constant_value * (1 + epsilons[segment]))
+                    qualities[segment] = segment_qualities
+                    positions[segment] = candidates[segment_positions]
+                    evaluations += len(candidates) * (end - start - 1)
+                    # Acima de T um zero fora dos candidatos poderia vencer: varredura completa
+                    for j in start + 1 + np.flatnonzero(segment_qualities > threshold):
+                        full_scan(j)
+                        evaluations += n_zeros
+        start = end
+    return qualities, indices[positions], evaluations
+
+
 class ZVTMonteCarloCorrected:
-    def __init__(self, cache_file="zeta_zeros_cache.pkl", results_dir="zvt_constants_results"):
+    def __init__(self, cache_file="zeta_zeros_cache.pkl", results_dir="zvt_constants_results", seed=None, adaptive=False, curves=False):
         self.cache_file = cache_file
         self.results_dir = results_dir
         self.monte_carlo_dir = os.path.join(results_dir, "monte_carlo_corrected")
@@ -82,11 +196,17 @@ class ZVTMonteCarloCorrected:
         
         # Configurações do teste
         self.perturbation_levels = [0.001, 0.01, 0.1, 1.0]  # 0.1%, 1%, 10%, 100%
+        self.entropy = root_seed_sequence(seed).entropy  # Stream (nível, simulação) reprodutível
+        self.adaptive = adaptive  # Rodadas até as taxas saírem dos limiares (máximo n_simulations)
+        self.curves = curves  # Curvas densas q(ε) no lugar dos quatro níveis discretos
+        self.curve_points = CURVE_POINTS
         
         # Resultados
         self.simulation_results = {}
         self.hierarchy_results = []
         self.uniqueness_results = []
+        self.response_curves = {}  # Constante → curva q(ε) e resumos por década de |ε|
+        self.unresolved_curves = []  # Constantes abaixo do limite de resolução dos zeros (sem curva)
         
         os.makedirs(self.monte_carlo_dir, exist_ok=True)
         
@@ -96,193 +216,305 @@ class ZVTMonteCarloCorrected:
         print("   • Os valores EXATOS das constantes são especiais?")
         print("   • Ou valores próximos também dariam ressonâncias?")
         print(f"🧪 {self.n_simulations:,} simulações com perturbações: {self.perturbation_levels}")
+        print(f"🎲 Semente (entropia): {self.entropy}")
         
     def load_zeros(self):
         """Carrega zeros da função zeta"""
         print("\n📂 Carregando zeros da função zeta...")
         
-        if os.path.exists(self.cache_file):
-            with open(self.cache_file, 'rb') as f:
-                self.zeros = pickle.load(f)
+        # Store colunar mapeado em memória (converte o pickle na primeira vez)
+        self.zeros = load_zero_store(self.cache_file)
+        if self.zeros is not None:
             print(f"✅ {len(self.zeros):,} zeros carregados")
             return True
         else:
             print("❌ Cache de zeros não encontrado!")
             return False
     
-    def perturb_constants(self, perturbation_percent):
-        """Gera versões perturbadas das constantes reais"""
-        perturbed = {}
-        
-        for const_name, real_value in REAL_CONSTANTS.items():
-            # Adicionar ruído gaussiano
-            noise_factor = np.random.normal(1.0, perturbation_percent/100)
-            perturbed_value = real_value * noise_factor
-            perturbed[const_name] = perturbed_value
-            
-        return perturbed
+    def find_best_resonances(self, zeros, constants_matrix):
+        """Melhores ressonâncias de uma matriz (simulações × constantes) em blocos vetorizados"""
+        constants_matrix = np.asarray(constants_matrix, dtype=np.float64)
+        indices, gammas = zeros_as_arrays(zeros)
+        qualities, positions = best_resonances(gammas, constants_matrix)
+        resolved = positions >= 0  # Constantes abaixo do limite de resolução: qualidade NaN
+        return {
+            'quality': qualities,
+            'error_percent': (qualities / constants_matrix) * 100,
+            'zero_index': np.where(resolved, indices[positions], -1),
+            'gamma': np.where(resolved, gammas[positions], np.nan)
+        }
     
     def find_best_resonance_for_constant(self, zeros, constant_value):
         """Encontra a melhor ressonância para uma constante específica"""
-        best_quality = float('inf')
-        best_result = None
-        
-        for n, gamma in zeros:
-            mod_val = gamma % constant_value
-            min_distance = min(mod_val, constant_value - mod_val)
-            
-            if min_distance < best_quality:
-                best_quality = min_distance
-                best_result = {
-                    'quality': min_distance,
-                    'error_percent': (min_distance / constant_value) * 100,
-                    'zero_index': n,
-                    'gamma': gamma
-                }
-        
-        return best_result
-    
-    def run_single_perturbation_test(self, perturbation_level, simulation_id):
-        """Executa um teste com constantes perturbadas"""
-        # Gerar constantes perturbadas
-        perturbed_constants = self.perturb_constants(perturbation_level)
-        
-        # Encontrar melhores ressonâncias
-        results = {}
-        for const_name, perturbed_value in perturbed_constants.items():
-            resonance = self.find_best_resonance_for_constant(self.zeros, perturbed_value)
-            if resonance:
-                results[const_name] = resonance
-        
-        # Analisar se mantém padrões observados
-        analysis = self.analyze_simulation_patterns(results)
-        
+        if len(zeros) == 0:
+            return None
+        best = self.find_best_resonances(zeros, [constant_value])
         return {
-            'simulation_id': simulation_id,
-            'perturbation_level': perturbation_level,
-            'results': results,
-            'analysis': analysis
+            'quality': float(best['quality'][0]),
+            'error_percent': float(best['error_percent'][0]),
+            'zero_index': int(best['zero_index'][0]),
+            'gamma': float(best['gamma'][0])
         }
     
-    def analyze_simulation_patterns(self, sim_results):
-        """Analisa se a simulação mantém os padrões observados"""
+    def analyze_simulation_patterns(self, qualities, gammas):
+        """Padrões observados em cada simulação, a partir das matrizes (simulações × constantes)
+
+        Colunas NaN (constantes não resolvidas pelos decimais dos zeros) ficam de fora.
+        """
+        n_sims = len(qualities)
         analysis = {
-            'hierarchy_preserved': False,
-            'uniqueness_preserved': False,
-            'energy_concentration': False,
+            'hierarchy_preserved': np.zeros(n_sims, dtype=bool),
+            'uniqueness_preserved': np.zeros(n_sims, dtype=bool),
+            'energy_concentration': np.zeros(n_sims, dtype=bool),
             'category_patterns': {}
         }
         
-        if not sim_results:
+        if n_sims == 0:
             return analysis
         
-        # 1. Testar hierarquia por categoria
-        category_qualities = {}
-        for category, constants in PHYSICS_CATEGORIES.items():
-            cat_qualities = []
-            for const_name in constants:
-                if const_name in sim_results and const_name in REAL_RESULTS:
-                    cat_qualities.append(sim_results[const_name]['quality'])
-            if cat_qualities:
-                category_qualities[category] = np.median(cat_qualities)
-        
-        # Verificar se cosmologia ainda domina
-        if 'Cosmologia' in category_qualities:
-            cosmo_quality = category_qualities['Cosmologia']
-            other_qualities = [q for cat, q in category_qualities.items() if cat != 'Cosmologia']
-            if other_qualities and cosmo_quality <= min(other_qualities):
-                analysis['hierarchy_preserved'] = True
-        
-        # 2. Testar se ainda encontra ressonâncias "únicas" (muito melhores)
-        qualities = [r['quality'] for r in sim_results.values()]
-        if qualities:
-            best_quality = min(qualities)
-            mean_quality = np.mean(qualities)
-            # Se a melhor é muito melhor que a média (fator 100x)
-            if best_quality * 100 < mean_quality:
-                analysis['uniqueness_preserved'] = True
-        
-        # 3. Testar concentração energética (~100 TeV)
-        energies = [r['gamma']/10 for r in sim_results.values()]
-        if energies:
-            # Concentração se >50% estão na faixa 50-150 TeV
-            target_range = sum(1 for e in energies if 50000 <= e <= 150000)
-            if target_range / len(energies) > 0.5:
-                analysis['energy_concentration'] = True
-        
-        # 4. Análise por categoria
-        for category, constants in PHYSICS_CATEGORIES.items():
-            cat_results = []
-            for const_name in constants:
-                if const_name in sim_results and const_name in REAL_RESULTS:
-                    real_quality = REAL_RESULTS[const_name]['quality']
-                    sim_quality = sim_results[const_name]['quality']
-                    # Comparar se simulação chegou perto do resultado real
-                    ratio = sim_quality / real_quality
-                    cat_results.append(ratio)
-            
-            if cat_results:
-                analysis['category_patterns'][category] = {
-                    'mean_ratio': np.mean(cat_results),
-                    'median_ratio': np.median(cat_results),
-                    'close_matches': sum(1 for r in cat_results if 0.1 <= r <= 10)  # Dentro de 1 ordem de magnitude
-                }
+        # 1. Testar hierarquia: cosmologia ainda domina (mediana por categoria)?
+        category_medians = {category: np.nanmedian(qualities[:, columns], axis=1)
+                            for category, columns in CATEGORY_COLUMNS.items()}
+        if 'Cosmologia' in category_medians and len(category_medians) > 1:
+            others = np.min([medians for category, medians in category_medians.items()
+                             if category != 'Cosmologia'], axis=0)
+            analysis['hierarchy_preserved'] = category_medians['Cosmologia'] <= others
+        
+        # 2. Testar se ainda encontra ressonâncias "únicas" (melhor 100x melhor que a média)
+        analysis['uniqueness_preserved'] = np.nanmin(qualities, axis=1) * 100 < np.nanmean(qualities, axis=1)
+        
+        # 3. Testar concentração energética: >50% das ressonâncias na faixa 50-150 TeV
+        energies = gammas / 10
+        in_range = (energies >= 50000) & (energies <= 150000)
+        analysis['energy_concentration'] = in_range.sum(axis=1) > 0.5 * np.isfinite(energies).sum(axis=1)
+        
+        # 4. Análise por categoria: razão simulação / resultado real
+        ratios = qualities / REAL_QUALITY_ROW
+        for category, columns in CATEGORY_COLUMNS.items():
+            category_ratios = ratios[:, columns]
+            analysis['category_patterns'][category] = {
+                'mean_ratio': np.nanmean(category_ratios, axis=1),
+                'median_ratio': np.nanmedian(category_ratios, axis=1),
+                'close_matches': np.count_nonzero((category_ratios >= 0.1) & (category_ratios <= 10), axis=1)  # Dentro de 1 ordem de magnitude
+            }
         
         return analysis
     
     def run_perturbation_analysis(self):
-        """Executa análise completa com perturbações"""
+        """Executa análise completa com perturbações: um tensor (níveis × simulações × constantes)"""
         print("\n🚀 Iniciando análise de perturbações...")
-        
-        # Usar amostra menor para acelerar
-        sample_size = 200000  # 200k zeros para teste mais rápido
-        sample_zeros = self.zeros[-sample_size:] if len(self.zeros) > sample_size else self.zeros
-        original_zeros = self.zeros
-        self.zeros = sample_zeros
-        
-        print(f"📊 Usando amostra de {len(sample_zeros):,} zeros")
-        
-        for perturbation_level in self.perturbation_levels:
-            print(f"\n🔬 Testando perturbação de {perturbation_level*100:.1f}%...")
-            
-            level_results = []
-            
-            # Processo paralelo para cada nível
-            max_workers = min(6, os.cpu_count())
-            
-            with ProcessPoolExecutor(max_workers=max_workers) as executor:
-                # Submeter simulações para este nível
-                futures = [executor.submit(self.run_single_perturbation_test, perturbation_level, i) 
-                          for i in range(self.n_simulations)]
+        print(f"📊 Usando todos os {len(self.zeros):,} zeros")
+        
+        # Todas as perturbações de uma vez; o nível só escala o ruído de cada stream
+        tensor = perturbation_tensor(self.entropy, self.perturbation_levels, self.n_simulations)
+        n_levels = len(self.perturbation_levels)
+        qualities = np.full(tensor.shape, np.inf)
+        zero_indices = np.zeros(tensor.shape, dtype=np.int64)
+        gammas = np.zeros(tensor.shape)
+        evaluated = [0] * n_levels
+        pending = list(range(n_levels))
+        
+        # Rodadas: tudo de uma vez no modo fixo, totais dobrando no adaptativo
+        round_ends = [self.n_simulations]
+        if self.adaptive:
+            round_ends = [min(ADAPTIVE_FIRST_ROUND * 2 ** k, self.n_simulations)
+                          for k in range(int(np.ceil(np.log2(max(self.n_simulations / ADAPTIVE_FIRST_ROUND, 1)))) + 1)]
+        max_workers = min(6, os.cpu_count())
+        
+        # Um único pool para todos os níveis; zeros mapeados de arquivo (só caminho, offset, tamanho)
+        with shared_zeros(self.zeros) as shared, ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for round_end in round_ends:
+                futures = {}
+                for level_index in pending:
+                    for _, first_id, size in simulation_blocks(round_end - evaluated[level_index], PERTURBATION_BATCH):
+                        first_id += evaluated[level_index]
+                        block = tensor[level_index, first_id:first_id + size]
+                        futures[executor.submit(evaluate_perturbation_block, shared, block)] = (level_index, first_id, size)
                 
-                # Coletar resultados
-                for future in tqdm(as_completed(futures), total=self.n_simulations, 
-                                  desc=f"Perturbação {perturbation_level*100:.1f}%"):
+                for future in tqdm(as_completed(futures), total=len(futures), desc="Perturbações"):
+                    level_index, first_id, size = futures[future]
                     try:
-                        result = future.result()
-                        level_results.append(result)
+                        rows = slice(first_id, first_id + size)
+                        qualities[level_index, rows], zero_indices[level_index, rows], gammas[level_index, rows] = future.result()
                     except Exception as e:
                         print(f"⚠️ Erro: {e}")
-            
+                
+                for level_index in pending:
+                    evaluated[level_index] = round_end
+                if self.adaptive:
+                    settled = [level_index for level_index in pending
+                               if self.rates_settled(self.analyze_simulation_patterns(qualities[level_index, :round_end],
+                                                                                      gammas[level_index, :round_end]))]
+                    for level_index in settled:
+                        print(f"🛑 Perturbação {self.perturbation_levels[level_index]*100:.1f}%: "
+                              f"veredito decidido após {round_end:,} simulações")
+                    pending = [level_index for level_index in pending if level_index not in settled]
+                if not pending:
+                    break
+        
+        for level_index, perturbation_level in enumerate(self.perturbation_levels):
+            n_sims = evaluated[level_index]
+            level_qualities = qualities[level_index, :n_sims]
+            level_results = {
+                'simulation_id': np.arange(n_sims),
+                'constants': tensor[level_index, :n_sims],
+                'quality': level_qualities,
+                'error_percent': level_qualities / tensor[level_index, :n_sims] * 100,
+                'zero_index': zero_indices[level_index, :n_sims],
+                'gamma': gammas[level_index, :n_sims],
+                'analysis': self.analyze_simulation_patterns(level_qualities, gammas[level_index, :n_sims])
+            }
             self.simulation_results[perturbation_level] = level_results
             
             # Análise rápida dos resultados deste nível
+            print(f"\n🔬 Perturbação de {perturbation_level*100:.1f}%:")
             self.analyze_perturbation_level(perturbation_level, level_results)
         
-        # Restaurar zeros originais
-        self.zeros = original_zeros
+    def run_response_curves(self):
+        """Curvas q(ε) densas para cada constante real, uma tarefa por constante"""
+        print(f"\n🚀 Curvas de resposta: {self.curve_points:,} valores de ε por constante")
+        print(f"📊 Usando todos os {len(self.zeros):,} zeros")
+        _, all_gammas = zeros_as_arrays(self.zeros)
+        grids = {}
+        for const_name, const_value in REAL_CONSTANTS.items():
+            if not is_resolved(all_gammas, const_value):
+                print(f"⚠️ {const_name}: abaixo do limite de resolução dos zeros, não resolvida (sem curva)")
+                self.unresolved_curves.append(const_name)
+                continue
+            grids[const_name] = response_epsilons(self.curve_points)
+        max_workers = min(6, os.cpu_count())
+        
+        with shared_zeros(self.zeros) as shared, ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(perturbation_response_curve, shared, const_value, grids[const_name]): const_name
+                       for const_name, const_value in REAL_CONSTANTS.items() if const_name in grids}
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Curvas de resposta"):
+                const_name = futures[future]
+                try:
+                    qualities, zero_indices, evaluations = future.result()
+                except Exception as e:
+                    print(f"⚠️ Erro em {const_name}: {e}")
+                    continue
+                epsilons = grids[const_name]
+                self.response_curves[const_name] = self.summarize_response_curve(epsilons, qualities, zero_indices)
+                self.response_curves[const_name]['work_fraction'] = evaluations / (len(self.zeros) * len(epsilons))
+    
+    def summarize_response_curve(self, epsilons, qualities, zero_indices):
+        """q(0), largura do poço e, por década de |ε|, a fração de ε que iguala ou supera q(0)"""
+        center = int(np.flatnonzero(epsilons == 0)[0])
+        center_quality = qualities[center]
+        magnitudes = np.abs(epsilons)
+        # Largura do poço: menor |ε| em que a qualidade já é CURVE_ESCAPE_FACTOR vezes pior
+        escaped = (qualities >= CURVE_ESCAPE_FACTOR * center_quality) & (magnitudes > 0)
+        escape_epsilon = float(magnitudes[escaped].min()) if escaped.any() else np.inf
+        
+        decades = np.arange(CURVE_LOG_MIN, CURVE_LOG_MAX)
+        decade_of = np.floor(np.log10(np.where(magnitudes > 0, magnitudes, np.nan)))
+        match_fraction = np.array([np.mean(qualities[decade_of == d] <= center_quality) if np.any(decade_of == d) else np.nan
+                                   for d in decades])
+        median_ratio = np.array([np.median(qualities[decade_of == d]) / center_quality if np.any(decade_of == d) else np.nan
+                                 for d in decades])
+        return {
+            'epsilons': epsilons,
+            'quality': qualities,
+            'zero_index': zero_indices,
+            'center_quality': float(center_quality),
+            'center_zero': int(zero_indices[center]),
+            'escape_epsilon': escape_epsilon,
+            'decades': decades,
+            'match_fraction': match_fraction,
+            'median_ratio': median_ratio
+        }
+    
+    def visualize_response_curves(self):
+        """q(ε)/q(0) contra |ε| para cada constante (lados + e − sobrepostos)"""
+        print("\n📈 Gerando curvas de resposta...")
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 7))
+        
+        for const_name, curve in self.response_curves.items():
+            epsilons = curve['epsilons']
+            ratio = np.log10(np.maximum(curve['quality'], 1e-300) / curve['center_quality'])
+            positive = epsilons > 0
+            ax1.plot(np.log10(epsilons[positive]), ratio[positive], linewidth=0.5, alpha=0.6, label=const_name)
+            ax2.plot(curve['decades'] + 0.5, curve['match_fraction'] * 100, 'o-', markersize=4, alpha=0.7, label=const_name)
+        
+        ax1.axhline(0, color='black', linestyle='--', alpha=0.7)
+        ax1.set_xlabel('Log₁₀(ε) (perturbação relativa positiva)')
+        ax1.set_ylabel('Log₁₀(q(ε) / q(0))')
+        ax1.set_title('Curvas de Resposta da Melhor Qualidade')
+        ax1.grid(True, alpha=0.3)
+        
+        ax2.axhline(50, color='red', linestyle='--', alpha=0.7, label='Expectativa sem estrutura')
+        ax2.set_xlabel('Década de Log₁₀|ε|')
+        ax2.set_ylabel('ε com qualidade ≤ q(0) (%)')
+        ax2.set_title('Quão Especial é o Valor Exato?')
+        ax2.set_ylim(0, 100)
+        ax2.legend(fontsize=7, ncol=2)
+        ax2.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        filename = os.path.join(self.monte_carlo_dir, "perturbation_response_curves.png")
+        plt.savefig(filename, dpi=300, bbox_inches='tight')
+        plt.show()
+        print(f"💾 Salvo: {filename}")
+    
+    def generate_response_report(self):
+        """Relatório das curvas de resposta (modo --curves)"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_file = os.path.join(self.monte_carlo_dir, f"Perturbation_Response_Report_{timestamp}.txt")
+        decades = np.arange(CURVE_LOG_MIN, CURVE_LOG_MAX)
+        
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write("="*80 + "\n")
+            f.write("ZVT CURVAS DE RESPOSTA À PERTURBAÇÃO - QUALIDADE EM FUNÇÃO DE ε\n")
+            f.write("="*80 + "\n\n")
+            f.write(f"Data: {datetime.now().isoformat()}\n")
+            f.write(f"Zeros utilizados: {len(self.zeros):,}\n")
+            f.write(f"Valores de ε por constante: {self.curve_points + 1:,} (±|ε| de 1e{CURVE_LOG_MIN} a 1e{CURVE_LOG_MAX}, mais ε = 0)\n")
+            if self.unresolved_curves:
+                f.write(f"Sem curva (abaixo do limite de resolução dos zeros): {', '.join(self.unresolved_curves)}\n")
+            f.write("\n")
+            
+            f.write("LARGURA DO POÇO E TRABALHO:\n")
+            f.write("-" * 50 + "\n")
+            f.write("| Constante              | q(0)         | Zero #      | ε (q ≥ 10·q0) | Avaliações |\n")
+            f.write("|------------------------|--------------|-------------|---------------|-----------:|\n")
+            for const_name, curve in self.response_curves.items():
+                f.write(f"| {const_name:22s} | {curve['center_quality']:.6e} | {curve['center_zero']:11,} | "
+                        f"{curve['escape_epsilon']:13.3e} | {curve['work_fraction']:9.1%} |\n")
+            f.write("(Avaliações: fração das N × pontos de uma varredura completa em cada ε)\n\n")
+            
+            f.write("FRAÇÃO DE ε COM QUALIDADE ≤ q(0), POR DÉCADA DE |ε|:\n")
+            f.write("-" * 50 + "\n")
+            f.write(f"| {'Constante':22s} |" + "".join(f" 1e{d:<3d}|" for d in decades) + "\n")
+            for const_name, curve in self.response_curves.items():
+                f.write(f"| {const_name:22s} |" + "".join(f" {fraction:5.0%}|" for fraction in curve['match_fraction']) + "\n")
+            f.write("\nSem estrutura, q(0) é só mais um mínimo: a fração é uniforme entre as constantes\n")
+            f.write("(média 50%). Um valor exato especial fica perto de 0% em todas as décadas de |ε|.\n")
+            f.write("="*80 + "\n")
         
+        print(f"📊 Relatório salvo: {report_file}")
+    
+    def rates_settled(self, analysis):
+        """True se os ICs de Clopper-Pearson das taxas de hierarquia e unicidade não contêm limiares"""
+        total = len(analysis['hierarchy_preserved'])
+        if total == 0:
+            return False
+        counts = [np.count_nonzero(analysis['hierarchy_preserved']),
+                  np.count_nonzero(analysis['uniqueness_preserved'])]
+        lower, upper = clopper_pearson(counts, total)
+        return bool(np.all(interval_clear_of(lower, upper, RATE_THRESHOLDS)))
+    
     def analyze_perturbation_level(self, perturbation_level, level_results):
         """Analisa resultados de um nível de perturbação"""
-        if not level_results:
+        analysis = level_results['analysis']
+        total_sims = len(level_results['simulation_id'])
+        if total_sims == 0:
             return
         
         # Estatísticas dos padrões preservados
-        hierarchy_preserved = sum(1 for r in level_results if r['analysis']['hierarchy_preserved'])
-        uniqueness_preserved = sum(1 for r in level_results if r['analysis']['uniqueness_preserved'])
-        energy_concentration = sum(1 for r in level_results if r['analysis']['energy_concentration'])
-        
-        total_sims = len(level_results)
+        hierarchy_preserved = int(np.count_nonzero(analysis['hierarchy_preserved']))
+        uniqueness_preserved = int(np.count_nonzero(analysis['uniqueness_preserved']))
+        energy_concentration = int(np.count_nonzero(analysis['energy_concentration']))
         
         print(f"📊 Resultados para perturbação {perturbation_level*100:.1f}%:")
         print(f"   • Hierarquia preservada: {hierarchy_preserved}/{total_sims} ({hierarchy_preserved/total_sims*100:.1f}%)")
@@ -294,7 +526,8 @@ class ZVTMonteCarloCorrected:
             'perturbation': perturbation_level,
             'hierarchy_rate': hierarchy_preserved/total_sims,
             'uniqueness_rate': uniqueness_preserved/total_sims,
-            'energy_rate': energy_concentration/total_sims
+            'energy_rate': energy_concentration/total_sims,
+            'n_simulations': total_sims
         })
     
     def visualize_corrected_results(self):
@@ -335,13 +568,9 @@ class ZVTMonteCarloCorrected:
                 if const_name in REAL_CONSTANTS:
                     real_qualities.append(REAL_RESULTS[const_name]['quality'])
                     
-                    # Média das qualidades perturbadas para esta constante
-                    pert_quals = []
-                    for sim in small_pert_results:
-                        if const_name in sim['results']:
-                            pert_quals.append(sim['results'][const_name]['quality'])
-                    
-                    if pert_quals:
+                    # Média das qualidades perturbadas para esta constante (uma coluna da matriz)
+                    pert_quals = small_pert_results['quality'][:, CONSTANT_NAMES.index(const_name)]
+                    if len(pert_quals):
                         pert_qualities_mean.append(np.mean(pert_quals))
                         const_names.append(const_name)
             
@@ -364,13 +593,11 @@ class ZVTMonteCarloCorrected:
         if 0.01 in self.simulation_results:
             med_pert_results = self.simulation_results[0.01]
             
-            category_data = {cat: [] for cat in PHYSICS_CATEGORIES.keys()}
-            
-            for sim in med_pert_results[:100]:  # Primeiras 100 simulações
-                for category, constants in PHYSICS_CATEGORIES.items():
-                    for const_name in constants:
-                        if const_name in sim['results']:
-                            category_data[category].append(np.log10(sim['results'][const_name]['quality']))
+            # Primeiras 100 simulações, todas as constantes de cada categoria
+            first_qualities = med_pert_results['quality'][:100]
+            category_data = {cat: np.log10(first_qualities[:, [CONSTANT_NAMES.index(name) for name in constants
+                                                               if name in REAL_CONSTANTS]]).ravel()
+                             for cat, constants in PHYSICS_CATEGORIES.items()}
             
             # Box plot por categoria
             valid_categories = [cat for cat, data in category_data.items() if len(data) > 10]
@@ -399,7 +626,7 @@ class ZVTMonteCarloCorrected:
         # P-values para cada perturbação
         p_values = []
         for i, obs_rate in enumerate(observed_hierarchy):
-            n_trials = len(self.simulation_results[perturbations[i]/100])
+            n_trials = self.hierarchy_results[i]['n_simulations']
             n_successes = int(obs_rate * n_trials / 100)
             
             # Teste binomial
@@ -446,6 +673,7 @@ class ZVTMonteCarloCorrected:
             f.write("="*80 + "\n\n")
             f.write(f"Data: {datetime.now().isoformat()}\n")
             f.write(f"Simulações por nível: {self.n_simulations:,}\n")
+            f.write(f"Semente (entropia): {self.entropy} | stream por (nível, simulação)\n")
             f.write(f"Níveis de perturbação testados: {self.perturbation_levels}\n")
             f.write(f"Zeros utilizados: {len(self.zeros):,}\n\n")
             
@@ -481,6 +709,10 @@ class ZVTMonteCarloCorrected:
                 
                 f.write(f"| {pert:9.1f}% | {hier:8.1f}% | {uniq:7.1f}% | {ener:5.1f}% | {interp:13s} |\n")
             
+            if self.adaptive:
+                runs = ", ".join(f"{r['perturbation']*100:.1f}%: {r['n_simulations']:,}" for r in self.hierarchy_results)
+                f.write(f"\nSimulações por nível (modo adaptativo): {runs}\n")
+            
             f.write(f"\nANÁLISE ESTATÍSTICA:\n")
             f.write("-" * 50 + "\n")
             
@@ -531,6 +763,16 @@ class ZVTMonteCarloCorrected:
         if not self.load_zeros():
             return
         
+        # Modo de curvas: q(ε) denso no lugar dos quatro níveis
+        if self.curves:
+            self.run_response_curves()
+            self.visualize_response_curves()
+            self.generate_response_report()
+            special = [name for name, curve in self.response_curves.items() if np.nanmax(curve['match_fraction']) < 0.1]
+            print(f"\n🎯 {len(special)}/{len(self.response_curves)} constantes com q(0) no decil inferior em todas as décadas "
+                  f"(~10% esperado por acaso)")
+            return
+        
         # Executar análise de perturbações
         self.run_perturbation_analysis()
         
@@ -559,7 +801,11 @@ class ZVTMonteCarloCorrected:
 
 def main():
     """Função principal"""
-    analyzer = ZVTMonteCarloCorrected()
+    # Uso: python3 validacao.py [--seed N] [--adaptive | --curves [--curve-points N]]
+    analyzer = ZVTMonteCarloCorrected(seed=int_option('--seed'), adaptive='--adaptive' in sys.argv[1:],
+                                      curves='--curves' in sys.argv[1:])
+    if int_option('--curve-points') is not None:
+        analyzer.curve_points = int_option('--curve-points')
     analyzer.run_complete_corrected_analysis()
 
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZVT_CHECKPOINT.py - Checkpoints atômicos do progresso dos hunters ZVT
+Author: Jefferson M. Okushigue
+Date: 2025-08-12
+Salva periodicamente o cursor de lotes, as melhores ressonâncias e as estatísticas
+acumuladas; com --resume o hunter continua do último lote concluído em vez de
+reprocessar tudo a partir do zero #0.
+"""
+
+import os
+import pickle
+import tempfile
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_INTERVAL = 5  # Lotes entre checkpoints (além do checkpoint no shutdown)
+HEAVY_RESULT_KEYS = ('forces_analysis', 'tolerance_analysis', 'comparative_analysis')  # Recalculáveis, não salvos
+
+
+def checkpoint_path_for(stats_file):
+    """Arquivo de checkpoint do hunter, ao lado do seu arquivo de estatísticas"""
+    return os.path.splitext(stats_file)[0] + '.checkpoint'
+
+
+def checkpoint_fingerprint(zeros_file, increment):
+    """Identifica a execução: um checkpoint só vale para o mesmo arquivo e tamanho de lote"""
+    try:
+        file_size = os.path.getsize(zeros_file)
+    except OSError:
+        file_size = 0
+    return {'zeros_file': os.path.abspath(zeros_file), 'file_size': file_size, 'increment': increment}
+
+
+def compact_session_results(session_results):
+    """Resultados por lote sem as listas completas de ressonâncias"""
+    return [{key: value for key, value in result.items() if key not in HEAVY_RESULT_KEYS}
+            for result in session_results]
+
+
+def save_checkpoint(checkpoint_file, fingerprint, state):
+    """Grava o checkpoint de forma atômica (arquivo temporário + os.replace)"""
+    payload = {'version': CHECKPOINT_VERSION, 'fingerprint': fingerprint, 'state': state}
+    directory = os.path.dirname(os.path.abspath(checkpoint_file))
+    fd, tmp_path = tempfile.mkstemp(prefix='.checkpoint_', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, checkpoint_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_checkpoint(checkpoint_file, fingerprint):
+    """Estado salvo, ou None se não houver checkpoint compatível com esta execução"""
+    if not os.path.exists(checkpoint_file):
+        return None
+    try:
+        with open(checkpoint_file, 'rb') as f:
+            payload = pickle.load(f)
+    except Exception as e:
+        print(f"⚠️ Checkpoint ilegível ({e}), começando do início")
+        return None
+    if payload.get('version') != CHECKPOINT_VERSION:
+        print(f"⚠️ Checkpoint de versão {payload.get('version')} ignorado")
+        return None
+    if payload.get('fingerprint') != fingerprint:
+        print("⚠️ Checkpoint de outro arquivo de zeros ou tamanho de lote, ignorado")
+        return None
+    return payload['state']
+
+
+class BatchCheckpointer:
+    """Checkpoints periódicos do laço de lotes de um hunter"""
+
+    def __init__(self, checkpoint_file, fingerprint, interval=CHECKPOINT_INTERVAL):
+        self.checkpoint_file = checkpoint_file
+        self.fingerprint = fingerprint
+        self.interval = interval
+        self.pending = 0
+
+    def resume(self):
+        """Estado do último lote concluído (batch_num, next_zero, best_overall, ...) ou None"""
+        state = load_checkpoint(self.checkpoint_file, self.fingerprint)
+        if state is not None:
+            print(f"♻️ Retomando do lote #{state['batch_num']} (zero {state['next_zero']:,})")
+        return state
+
+    def update(self, state):
+        """Registra um lote concluído; grava a cada `interval` lotes"""
+        self.pending += 1
+        if self.pending >= self.interval:
+            self.save(state)
+
+    def save(self, state):
+        """Grava o estado agora (ex.: no shutdown); erros só geram aviso"""
+        state = dict(state, session_results=compact_session_results(state.get('session_results', [])))
+        try:
+            save_checkpoint(self.checkpoint_file, self.fingerprint, state)
+        except Exception as e:
+            print(f"⚠️ Erro ao salvar checkpoint: {e}")
+            return False
+        self.pending = 0
+        print(f"💾 Checkpoint salvo: lote #{state['batch_num'] - 1} concluído")
+        return True
+
+    def finish(self):
+        """Remove o checkpoint quando a varredura termina por completo"""
+        if os.path.exists(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZVT_ENGINE.py - Motor unificado de ressonâncias para todas as famílias de constantes
+Author: Jefferson M. Okushigue
+Date: 2025-08-12
+As famílias de constantes dos hunters vêm de zvt_families.py (sem efeitos
+colaterais, sem importar os hunters); o motor percorre o store de zeros uma única vez, em blocos que cabem no cache, e
+avalia todas as famílias sobre cada bloco enquanto ele está quente. Uma campanha
+completa lê cada zero uma vez em vez de nove. Os hunters usam o mesmo motor com
+a sua família só (load_constant_families([nome])) no laço de lotes e montam o
+relatório final do estado acumulado, sem varrer os zeros de novo.
+"""
+
+import os
+import signal
+import sys
+import time
+from datetime import datetime
+from zvt_kernels import folded_residuals, resonances_from_residuals
+from zvt_precision import float64_margin, confirm_uncertain, precise_best_position
+from zvt_zero_store import load_zero_store
+from zvt_statistics import ResonanceAccumulator, SignificanceTable
+from zvt_checkpoint import BatchCheckpointer, checkpoint_path_for, checkpoint_fingerprint
+from zvt_families import CONSTANT_FAMILIES
+
+ENGINE_BLOCK = 65536  # Zeros por bloco: ~512 KB de gammas, cabe no cache L2
+CACHE_FILE = "zeta_zeros_cache.pkl"
+STATS_FILE = "zvt_engine_stats.txt"
+CHECKPOINT_FILE = checkpoint_path_for(STATS_FILE)  # Progresso da varredura para --resume
+RESULTS_DIR = "zvt_engine_results"
+MINIMUM_FOR_STATS = 1000
+
+# Critérios de destaque no relatório (os mesmos de scanner_z.py)
+SIGNIFICANCE_CRITERIA = {
+    'min_resonances': 10,
+    'min_significance_factor': 2.0,
+    'max_p_value': 0.01
+}
+
+shutdown_requested = False
+
+
+def signal_handler(signum, frame):
+    global shutdown_requested
+    print(f"\n⏸️ Shutdown solicitado. Completando bloco atual e salvando...")
+    shutdown_requested = True
+
+
+def load_constant_families(family_names=None):
+    """Famílias de zvt_families.py (todas, ou as nomeadas); nome desconhecido levanta KeyError"""
+    if family_names is None:
+        return list(CONSTANT_FAMILIES)
+    by_name = {family.name: family for family in CONSTANT_FAMILIES}
+    return [by_name[name] for name in family_names]
+
+
+class UnifiedResonanceEngine:
+    """Avalia todas as famílias de constantes em um único passe em blocos pelos zeros
+
+    Para cada bloco, o resíduo dobrado de cada valor distinto de constante é
+    calculado uma vez e compartilhado entre as famílias que o usam; contagens,
+    histogramas e a melhor ressonância de cada constante são acumulados.
+    Constantes abaixo do limite de resolução dos gammas ficam sem melhor ressonância
+    e sem contagens (ver zvt_kernels.is_resolved).
+    """
+
+    def __init__(self, families):
+        self.families = families
+        self.zeros_seen = 0
+        self.accumulators = {}
+        self.best = {}  # (família, constante) → (n, gamma, qualidade, erro relativo)
+        for family in families:
+            for const_name, const_value in family.constants.items():
+                self.accumulators[(family.name, const_name)] = ResonanceAccumulator(
+                    const_value, family.tolerances_for(const_name), relative=family.relative)
+
+    @property
+    def constant_count(self):
+        return len(self.accumulators)
+
+    def process_block(self, indices, gammas, collect=False):
+        """Incorpora um bloco de zeros a todas as constantes de todas as famílias
+
+        Com collect=True devolve também as ressonâncias do bloco,
+        {família: {constante: {tolerância: [...]}}} no formato de
+        multi_tolerance_resonances, tiradas dos mesmos resíduos confirmados.
+        """
+        resonances = {family.name: {const_name: {} for const_name in family.constants} for family in self.families}
+        if len(gammas) == 0:
+            return resonances if collect else None
+        residual_cache = {}  # Valor da constante → resíduos dobrados deste bloco
+        margin = float64_margin(gammas)
+        for family in self.families:
+            for const_name, const_value in family.constants.items():
+                residuals = residual_cache.get(const_value)
+                if residuals is None:
+                    residuals = residual_cache[const_value] = folded_residuals(gammas, const_value)
+                key = (family.name, const_name)
+                accumulator = self.accumulators[key]
+                accumulator.resolve_tolerances(gammas)
+                # Zeros próximos das fronteiras de tolerância confirmados em mpmath
+                residuals = confirm_uncertain(indices, gammas, residuals, const_value,
+                                              accumulator.tolerances, family.relative, margin)
+                counts = None
+                if collect:
+                    found = resonances_from_residuals(indices, gammas, residuals, const_value,
+                                                      accumulator.tolerances, family.relative)
+                    resonances[family.name][const_name] = found
+                    counts = {tolerance: len(found[tolerance]) for tolerance in accumulator.tolerances}
+                accumulator.add_residuals(residuals, counts)
+                position, quality = precise_best_position(indices, gammas, residuals, const_value)
+                if position is None:  # Constante abaixo do limite de resolução dos gammas
+                    continue
+                if key not in self.best or quality < self.best[key][2]:  # Empates mantêm o primeiro zero
+                    self.best[key] = (int(indices[position]), float(gammas[position]),
+                                      quality, quality / const_value)
+        self.zeros_seen += len(gammas)
+        return resonances if collect else None
+
+    def merge(self, other):
+        """Soma o estado de outro motor das mesmas famílias (ex.: fatias de um lote nos workers)
+
+        Fatias somadas na ordem dos zeros mantêm o desempate pelo primeiro zero.
+        """
+        self.zeros_seen += other.zeros_seen
+        for key, accumulator in other.accumulators.items():
+            self.accumulators[key].merge(accumulator)
+        for key, best in other.best.items():
+            if key not in self.best or best[2] < self.best[key][2]:
+                self.best[key] = best
+        return self
+
+    def significance(self, family):
+        """SignificanceTable das constantes de uma família"""
+        accumulators = {const_name: self.accumulators[(family.name, const_name)]
+                        for const_name in family.constants}
+        return SignificanceTable(accumulators, MINIMUM_FOR_STATS)
+
+    def state(self):
+        """Estado acumulado, para checkpoints"""
+        return {'zeros_seen': self.zeros_seen, 'accumulators': self.accumulators, 'best': self.best}
+
+    def restore(self, state):
+        """Restaura o estado de um checkpoint (as famílias vêm do código atual)"""
+        self.zeros_seen = state['zeros_seen']
+        self.best.update(state['best'])
+        for key, accumulator in state['accumulators'].items():
+            if key in self.accumulators:
+                self.accumulators[key] = accumulator
+
+
+def best_tolerance_summary(significance, const_name, tolerances):
+    """(tolerância, contagem, fator, menor p-value) da tolerância mais significativa"""
+    arrays = significance.arrays
+    best = None
+    for tolerance in tolerances:
+        row = significance.row(const_name, tolerance)
+        if row is None or arrays['resonant_count'][row] == 0:
+            continue
+        factor = arrays['significance_factor'][row]
+        p_value = min(arrays['binomial_p_value'][row], arrays['poisson_p_value'][row])
+        if best is None or factor > best[2]:
+            best = (tolerance, int(arrays['resonant_count'][row]), factor, p_value)
+    return best
+
+
+def session_tolerance_summary(engine, family, const_name):
+    """Resumo por tolerância do estado acumulado, no formato tolerance_summary dos hunters
+
+    Contagens e p-values vêm dos acumuladores; a melhor qualidade (erro relativo
+    nas famílias relativas) é a da melhor ressonância, que cai em toda
+    tolerância com contagem > 0.
+    """
+    key = (family.name, const_name)
+    accumulator = engine.accumulators[key]
+    significance = engine.significance(family)
+    best = engine.best.get(key)
+    summary = {}
+    for tolerance in accumulator.tolerances:
+        count = accumulator.counts[tolerance]
+        stats_result = significance.result(const_name, tolerance)
+        best_quality = None
+        if count > 0 and best is not None:
+            best_quality = best[3] if family.relative else best[2]
+        summary[tolerance] = {
+            'count': count,
+            'rate': count / accumulator.total_zeros * 100 if accumulator.total_zeros else 0,
+            'best_quality': best_quality,
+            'significance': stats_result['basic_stats']['significance_factor'] if stats_result else 0,
+            'stats': stats_result
+        }
+    return summary
+
+
+def session_comparison(engine, family, constants, tolerance):
+    """Contagens e estatísticas acumuladas de constantes de controle numa tolerância"""
+    significance = engine.significance(family)
+    comparison = {}
+    for const_name, const_value in constants.items():
+        accumulator = engine.accumulators[(family.name, const_name)]
+        if tolerance not in accumulator.counts:
+            continue
+        count = accumulator.counts[tolerance]
+        comparison[const_name] = {
+            'constant_value': const_value,
+            'resonance_count': count,
+            'resonance_rate': count / accumulator.total_zeros * 100 if accumulator.total_zeros else 0,
+            'stats': significance.result(const_name, tolerance)
+        }
+    return comparison
+
+
+def session_best_resonance(engine, family, const_name, tolerance):
+    """Melhor ressonância acumulada como tupla de multi_tolerance_resonances, ou None fora da tolerância"""
+    best = engine.best.get((family.name, const_name))
+    if best is None:
+        return None
+    n, gamma, quality, relative_error = best
+    if not (relative_error if family.relative else quality) < tolerance:
+        return None
+    if family.relative:
+        return (n, gamma, quality, tolerance, relative_error)
+    return (n, gamma, quality, tolerance)
+
+
+def is_highlighted(summary):
+    """Aplica SIGNIFICANCE_CRITERIA ao resumo da melhor tolerância"""
+    if summary is None:
+        return False
+    _, count, factor, p_value = summary
+    return (count >= SIGNIFICANCE_CRITERIA['min_resonances'] and
+            factor >= SIGNIFICANCE_CRITERIA['min_significance_factor'] and
+            p_value < SIGNIFICANCE_CRITERIA['max_p_value'])
+
+
+def generate_engine_report(engine, zero_count):
+    """Relatório por família: melhor ressonância e significância acumulada de cada constante"""
+    if not os.path.exists(RESULTS_DIR):
+        os.makedirs(RESULTS_DIR)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    report_file = os.path.join(RESULTS_DIR, f"Relatorio_Motor_Unificado_{timestamp}.txt")
+
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write("=" * 80 + "\n")
+        f.write("ZVT MOTOR UNIFICADO - RELATÓRIO DE CAMPANHA\n")
+        f.write("=" * 80 + "\n\n")
+        f.write(f"Data: {datetime.now().isoformat()}\n")
+        f.write(f"Zeros analisados: {engine.zeros_seen:,} de {zero_count:,}\n")
+        f.write(f"Famílias: {len(engine.families)} | Constantes: {engine.constant_count}\n\n")
+
+        for family in engine.families:
+            significance = engine.significance(family)
+            mode = "relativa" if family.relative else "absoluta"
+            f.write(f"\n{family.name.upper()} (tolerância {mode}):\n")
+            f.write("| Constante              | Valor           | Zero #      | Qualidade      | Erro relativo  | Tol.    | Fator   |\n")
+            f.write("|------------------------|-----------------|-------------|----------------|----------------|---------|---------|\n")
+            for const_name, const_value in family.constants.items():
+                best = engine.best.get((family.name, const_name))
+                if best is None:
+                    if engine.zeros_seen == 0:
+                        continue
+                    f.write(f"|  {const_name:20s} | {const_value:.9e} | abaixo da resolução dos zeros: não resolvida |\n")
+                    continue
+                n, gamma, quality, relative_error = best
+                summary = best_tolerance_summary(significance, const_name, family.tolerances_for(const_name))
+                marker = "🚨" if is_highlighted(summary) else "  "
+                tol_str = f"{summary[0]:7.0e}" if summary else "    N/A"
+                factor_str = f"{summary[2]:6.2f}x" if summary else "    N/A"
+                f.write(f"|{marker}{const_name:20s} | {const_value:.9e} | {n:11,} | {quality:.6e} | "
+                        f"{relative_error:.6e} | {tol_str} | {factor_str} |\n")
+
+    print(f"📊 Relatório salvo: {report_file}")
+    return report_file
+
+
+def run_unified_campaign():
+    """Executa todas as famílias em um único passe pelo store de zeros"""
+    print(f"🚀 ZVT MOTOR UNIFICADO DE RESSONÂNCIAS")
+    print("=" * 80)
+
+    families = load_constant_families()
+
+    zeros = load_zero_store(CACHE_FILE)
+    if zeros is None or len(zeros) == 0:
+        print(f"❌ Store de zeros não encontrado. Execute um hunter ou zvt_zero_store.py primeiro.")
+        return None
+    zero_count = len(zeros)
+
+    engine = UnifiedResonanceEngine(families)
+    for family in families:
+        print(f"🔬 {family.name}: {len(family.constants)} constantes")
+    print(f"📦 {zero_count:,} zeros em blocos de {ENGINE_BLOCK:,} | {engine.constant_count} constantes por bloco")
+    print("🛑 Ctrl+C para parar (continue depois com --resume)")
+
+    checkpointer = BatchCheckpointer(CHECKPOINT_FILE, checkpoint_fingerprint(zeros.path, ENGINE_BLOCK))
+    state = checkpointer.resume() if '--resume' in sys.argv[1:] else None
+    if state:
+        engine.restore(state['engine'])
+    block_num = state['batch_num'] if state else 1
+    checkpoint_state = lambda: {'batch_num': block_num, 'next_zero': engine.zeros_seen,
+                                'engine': engine.state()}
+
+    start_time = time.time()
+    for block_start in range(engine.zeros_seen, zero_count, ENGINE_BLOCK):
+        if shutdown_requested:
+            break
+        block = zeros[block_start:block_start + ENGINE_BLOCK]
+        engine.process_block(block.indices, block.gammas)
+        elapsed = time.time() - start_time
+        print(f"🔬 Bloco #{block_num}: zeros {block_start:,} a {block_start + len(block):,} "
+              f"({engine.zeros_seen / zero_count * 100:.1f}%) - {elapsed:.1f}s")
+        block_num += 1
+        checkpointer.update(checkpoint_state())
+
+    if shutdown_requested:
+        checkpointer.save(checkpoint_state())
+        print(f"💡 Continue com: python3 {sys.argv[0]} --resume")
+    else:
+        checkpointer.finish()
+
+    generate_engine_report(engine, zero_count)
+
+    # Destaques de todas as famílias
+    highlights = []
+    for family in families:
+        significance = engine.significance(family)
+        for const_name in family.constants:
+            summary = best_tolerance_summary(significance, const_name, family.tolerances_for(const_name))
+            if is_highlighted(summary):
+                highlights.append((family.name, const_name, summary))
+    if highlights:
+        print(f"\n🚨 CONSTANTES COM SINAL SIGNIFICATIVO:")
+        for family_name, const_name, (tolerance, count, factor, p_value) in sorted(highlights, key=lambda x: -x[2][2]):
+            print(f"   {family_name}/{const_name}: {count:,} ressonâncias em {tolerance:.0e} ({factor:.2f}x, p={p_value:.2e})")
+    else:
+        print(f"\n📊 Nenhuma constante atingiu os critérios de significância")
+    return engine
+
+
+if __name__ == "__main__":
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+    run_unified_campaign()
@@ -0,0 +1,585 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZVT_FAMILIES.py - Famílias de constantes dos hunters ZVT
+Author: Jefferson M. Okushigue
+Date: 2025-08-12
+Definições puras (constantes, tolerâncias e ConstantFamily de cada hunter),
+sem efeitos colaterais: importar este módulo não cria diretórios, não altera
+mp.dps nem lê zeros. Os hunters importam daqui as suas constantes e o motor
+unificado (zvt_engine.py) importa daqui todas as famílias.
+"""
+
+import math
+import numpy as np
+
+
+class ConstantFamily:
+    """Constantes de um hunter e suas tolerâncias, registradas como plugin do motor"""
+
+    def __init__(self, name, constants, tolerances, specific_tolerances=None, relative=False):
+        self.name = name
+        self.constants = dict(constants)
+        self.tolerances = list(tolerances)
+        self.specific_tolerances = specific_tolerances or {}
+        self.relative = relative  # Tolerâncias aplicadas ao erro relativo resíduo/c
+
+    def tolerances_for(self, const_name):
+        """Tolerâncias específicas da constante ou as genéricas da família"""
+        return self.specific_tolerances.get(const_name, self.tolerances)
+
+
+# Tolerâncias genéricas: absolutas (resíduo) e relativas (resíduo/c)
+ABSOLUTE_TOLERANCE_LEVELS = [1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9]
+RELATIVE_TOLERANCE_LEVELS = [1e-6, 1e-7, 1e-8, 1e-9, 1e-10, 1e-11]
+
+# Constantes físicas compartilhadas (CODATA 2018)
+C_LIGHT = 299792458                # m/s (valor exato por definição)
+H_PLANCK = 6.62607015e-34          # J⋅s (valor exato CODATA 2018)
+H_BAR = H_PLANCK / (2 * math.pi)   # ℏ = h/(2π)
+G_GRAVITY = 6.67430e-11            # m³⋅kg⁻¹⋅s⁻²
+ALPHA = 7.2973525693e-3            # Estrutura fina
+E_ELECTRON = 1.602176634e-19       # C (carga elementar)
+M_ELECTRON = 9.1093837015e-31      # kg (massa do elétron)
+M_PROTON = 1.67262192369e-27       # kg (massa do próton)
+EPSILON_0 = 8.8541878128e-12       # F/m (permissividade do vácuo)
+K_BOLTZMANN = 1.380649e-23         # J/K (CODATA 2018)
+
+
+# ===== scanner_z.py: 4 forças fundamentais + constantes de alta e média prioridade =====
+FUNDAMENTAL_CONSTANTS = {
+    # === 4 FORÇAS FUNDAMENTAIS ===
+    'eletromagnetica': 1 / 137.035999084,      # α (constante de estrutura fina)
+    'forte': 0.1185,                           # αs (constante de acoplamento forte at MZ)
+    'fraca': 0.0338,                           # αW (constante de acoplamento fraca)
+    'gravitacional': 5.906e-39,                # αG (constante gravitacional adimensional)
+
+    # === ALTA PRIORIDADE ===
+    'weinberg_angle': 0.2312,                  # sin²θW (ângulo de Weinberg) - Unificação eletrofraca
+    'proton_electron': 1836.15267343,          # mp/me (razão próton-elétron) - Fundamental para átomos
+    'euler_mascheroni': 0.5772156649,          # γ (constante de Euler-Mascheroni) - Conectada à zeta
+    'fermi_coupling': 1.1663787e-5,            # GF (constante de Fermi) - Interações fracas
+
+    # === MÉDIA PRIORIDADE - Razões de Massas ===
+    'muon_electron': 206.7682826,              # mμ/me (razão múon-elétron)
+    'tau_electron': 3477.15,                   # mτ/me (razão tau-elétron)
+    'neutron_proton': 1.00137841931,           # mn/mp (razão nêutron-próton)
+
+    # === MÉDIA PRIORIDADE - Constantes Cosmológicas ===
+    'dark_energy': 0.6847,                     # ΩΛ (densidade energia escura)
+    'dark_matter': 0.2589,                     # Ωdm (densidade matéria escura)
+    'baryon_density': 0.0486,                  # Ωb (densidade bariônica)
+    'hubble_reduced': 0.6736,                  # h (parâmetro Hubble reduzido)
+    'sigma8': 0.8111,                          # σ8 (flutuação densidade matéria)
+
+    # === MÉDIA PRIORIDADE - Fatores Magnéticos ===
+    'gyromagnetic_proton': 2.7928473508,       # gp (fator g do próton)
+    'gyromagnetic_neutron': 1.9130427,         # |gn| (valor absoluto do fator g do nêutron)
+    'magnetic_moment_ratio': 3.1524512605,     # μp/μn (razão momentos magnéticos)
+}
+
+# Tolerâncias específicas para cada constante (ajustadas às suas magnitudes)
+FUNDAMENTAL_TOLERANCES = {
+    # === 4 FORÇAS FUNDAMENTAIS ===
+    'eletromagnetica': [1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9],
+    'forte': [1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7],
+    'fraca': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],
+    'gravitacional': [1e-38, 1e-39, 1e-40, 1e-41, 1e-42, 1e-43],
+
+    # === ALTA PRIORIDADE ===
+    'weinberg_angle': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],        # Ordem ~0.23
+    'proton_electron': [1e-1, 1e-2, 1e-3, 1e-4, 1e-5, 1e-6],       # Ordem ~1836
+    'euler_mascheroni': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],      # Ordem ~0.58
+    'fermi_coupling': [1e-6, 1e-7, 1e-8, 1e-9, 1e-10, 1e-11],      # Ordem ~1e-5
+
+    # === MÉDIA PRIORIDADE - Razões de Massas ===
+    'muon_electron': [1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7],         # Ordem ~207
+    'tau_electron': [1e-1, 1e-2, 1e-3, 1e-4, 1e-5, 1e-6],          # Ordem ~3477
+    'neutron_proton': [1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9],        # Ordem ~1.00
+
+    # === MÉDIA PRIORIDADE - Constantes Cosmológicas ===
+    'dark_energy': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],           # Ordem ~0.68
+    'dark_matter': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],           # Ordem ~0.26
+    'baryon_density': [1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9],        # Ordem ~0.05
+    'hubble_reduced': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],        # Ordem ~0.67
+    'sigma8': [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8],                # Ordem ~0.81
+
+    # === MÉDIA PRIORIDADE - Fatores Magnéticos ===
+    'gyromagnetic_proton': [1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7],   # Ordem ~2.79
+    'gyromagnetic_neutron': [1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7],  # Ordem ~1.91
+    'magnetic_moment_ratio': [1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7], # Ordem ~3.15
+}
+
+# Constantes de controle para validação estatística (amostra representativa)
+FUNDAMENTAL_CONTROL_CONSTANTS = {
+    # Amostra das fundamentais
+    'eletromagnetica': FUNDAMENTAL_CONSTANTS['eletromagnetica'],
+    'forte': FUNDAMENTAL_CONSTANTS['forte'],
+    'fraca': FUNDAMENTAL_CONSTANTS['fraca'],
+    'weinberg_angle': FUNDAMENTAL_CONSTANTS['weinberg_angle'],
+    'euler_mascheroni': FUNDAMENTAL_CONSTANTS['euler_mascheroni'],
+    'dark_energy': FUNDAMENTAL_CONSTANTS['dark_energy'],
+
+    # Constantes aleatórias para controle
+    'random_1': 1 / 142.7,
+    'random_2': 1 / 129.3,
+    'golden_ratio': (np.sqrt(5) - 1) / 2,
+    'pi_scale': np.pi / 100,
+    'e_scale': np.e / 100
+}
+
+FUNDAMENTAL_FAMILY = ConstantFamily('constantes_fundamentais',
+                                    {**FUNDAMENTAL_CONSTANTS, **FUNDAMENTAL_CONTROL_CONSTANTS},
+                                    ABSOLUTE_TOLERANCE_LEVELS, FUNDAMENTAL_TOLERANCES)
+
+
+# ===== scanner_zeta.py: 4 forças fundamentais da física =====
+FOUR_FORCES = {name: FUNDAMENTAL_CONSTANTS[name] for name in ('eletromagnetica', 'forte', 'fraca', 'gravitacional')}
+FOUR_FORCE_TOLERANCES = {name: FUNDAMENTAL_TOLERANCES[name] for name in FOUR_FORCES}
+
+# Constantes de controle para validação estatística
+FOUR_FORCES_CONTROL_CONSTANTS = {
+    'eletromagnetica': FOUR_FORCES['eletromagnetica'],
+    'forte': FOUR_FORCES['forte'],
+    'fraca': FOUR_FORCES['fraca'],
+    'random_1': 1 / 142.7,
+    'random_2': 1 / 129.3,
+    'golden_ratio': (np.sqrt(5) - 1) / 2,
+    'pi_scale': np.pi / 100,
+    'e_scale': np.e / 100
+}
+
+FOUR_FORCES_FAMILY = ConstantFamily('4_forcas', {**FOUR_FORCES, **FOUR_FORCES_CONTROL_CONSTANTS},
+                                    ABSOLUTE_TOLERANCE_LEVELS, FOUR_FORCE_TOLERANCES)
+
+
+# ===== zvt_alpha_hunter.py: constante de estrutura fina =====
+FINE_STRUCTURE = 1 / 137.035999084  # Fine-structure constant (α)
+
+# Control constants for statistical validation
+FINE_STRUCTURE_CONTROL_CONSTANTS = {
+    'fine_structure': FINE_STRUCTURE,
+    'random_1': 1 / 142.7,
+    'random_2': 1 / 129.3,
+    'random_3': 1 / 131.2,
+    'random_4': 1 / 144.8,
+    'golden_ratio': (np.sqrt(5) - 1) / 2,
+    'pi_scale': np.pi / 100,
+    'e_scale': np.e / 100
+}
+
+FINE_STRUCTURE_FAMILY = ConstantFamily('estrutura_fina',
+                                       {'fine_structure': FINE_STRUCTURE, **FINE_STRUCTURE_CONTROL_CONSTANTS},
+                                       ABSOLUTE_TOLERANCE_LEVELS)
+
+
+# ===== plank_resonance_hunter.py: constante de Planck =====
+# Unidades de Planck fundamentais
+L_PLANCK = math.sqrt(H_BAR * G_GRAVITY / C_LIGHT**3)  # 1.616e-35 m
+T_PLANCK = L_PLANCK / C_LIGHT  # 5.391e-44 s
+M_PLANCK = math.sqrt(H_BAR * C_LIGHT / G_GRAVITY)  # 2.176e-8 kg
+E_PLANCK = M_PLANCK * C_LIGHT**2  # 1.956e9 J
+F_PLANCK = 1 / T_PLANCK  # 1.855e43 Hz
+
+# Constantes principais para análise - múltiplos para compatibilidade com zeros
+PLANCK_CONSTANT = H_PLANCK
+PLANCK_REDUCED = H_BAR
+
+# Múltiplos da constante de Planck para busca
+PLANCK_MULTIPLIERS = [
+    1e30 * H_PLANCK,   # 6.626e-4
+    1e32 * H_PLANCK,   # 6.626e-2
+    1e34 * H_PLANCK,   # 6.626
+    1e35 * H_PLANCK,   # 66.26
+    1e36 * H_PLANCK,   # 662.6
+    1e37 * H_PLANCK,   # 6626
+]
+
+# Constantes de controle para validação estatística
+PLANCK_CONTROL_CONSTANTS = {
+    'planck_30x': 1e30 * H_PLANCK,  # 6.626e-4
+    'planck_32x': 1e32 * H_PLANCK,  # 6.626e-2
+    'planck_34x': 1e34 * H_PLANCK,  # 6.626
+    'planck_35x': 1e35 * H_PLANCK,  # 66.26
+    'planck_36x': 1e36 * H_PLANCK,  # 662.6
+    'planck_37x': 1e37 * H_PLANCK,  # 6626
+    'planck_hbar_34x': 1e34 * H_BAR,  # 1.055
+    'random_1': 6.5,
+    'random_2': 6.8,
+    'random_3': 1.0,
+    'random_4': 66.5,
+}
+
+PLANCK_FAMILY = ConstantFamily('planck', {'planck_34x': 1e34 * PLANCK_CONSTANT, **PLANCK_CONTROL_CONSTANTS},
+                               RELATIVE_TOLERANCE_LEVELS, relative=True)
+
+
+# ===== zvt_rydberg_resonance_hunter.py: constante de Rydberg =====
+R_INFINITY = 10973731.568160  # m⁻¹ (CODATA 2018)
+
+# Quantidades derivadas da constante de Rydberg
+# Energia de Rydberg: E_Ry = hc R∞
+E_RYDBERG = H_PLANCK * C_LIGHT * R_INFINITY  # ≈ 2.18e-18 J ≈ 13.6 eV
+
+# Comprimento de onda característico: λ = 1/R∞
+LAMBDA_RYDBERG = 1 / R_INFINITY  # ≈ 9.11e-8 m ≈ 91.1 nm
+
+# Frequência de Rydberg: ν = c R∞
+FREQ_RYDBERG = C_LIGHT * R_INFINITY  # ≈ 3.29e15 Hz
+
+# Tempo característico: τ = 1/(c R∞)
+TIME_RYDBERG = 1 / (C_LIGHT * R_INFINITY)  # ≈ 3.04e-16 s
+
+# Escalas normalizadas para compatibilidade com zeros de Riemann
+R_SCALED = R_INFINITY / 1e6      # ≈ 10.97 (escala dos zeros)
+E_SCALED = E_RYDBERG * 1e18      # ≈ 2.18 (energia em escala)
+FREQ_SCALED = FREQ_RYDBERG / 1e15  # ≈ 3.29 (frequência em escala)
+RYDBERG_LAMBDA_SCALED = LAMBDA_RYDBERG * 1e8  # ≈ 9.11 (comprimento de onda)
+
+# Fatores relacionados às transições atômicas
+LYMAN_FACTOR = R_INFINITY * (1 - 1/4) / 1e6    # Série de Lyman (≈ 8.23)
+BALMER_FACTOR = R_INFINITY * (1/4 - 1/9) / 1e6  # Série de Balmer (≈ 1.52)
+PASCHEN_FACTOR = R_INFINITY * (1/9 - 1/16) / 1e6 # Série de Paschen (≈ 0.53)
+
+# Constante principal para análise
+RYDBERG_CONSTANT = R_SCALED  # ≈ 10.97
+
+# Constantes de controle para validação estatística
+RYDBERG_CONTROL_CONSTANTS = {
+    'rydberg_scaled': R_SCALED,          # ≈ 10.97
+    'energy_scaled': E_SCALED,           # ≈ 2.18
+    'freq_scaled': FREQ_SCALED,          # ≈ 3.29
+    'lambda_scaled': RYDBERG_LAMBDA_SCALED,  # ≈ 9.11
+    'lyman_series': LYMAN_FACTOR,        # ≈ 8.23
+    'balmer_series': BALMER_FACTOR,      # ≈ 1.52
+    'paschen_series': PASCHEN_FACTOR,    # ≈ 0.53
+    'alpha_scaled': ALPHA * 1000,        # ≈ 7.30
+    'random_1': 10.5,
+    'random_2': 11.3,
+    'random_3': 8.7,
+    'random_4': 12.4,
+}
+
+RYDBERG_FAMILY = ConstantFamily('rydberg', {'rydberg_scaled': RYDBERG_CONSTANT, **RYDBERG_CONTROL_CONSTANTS},
+                                RELATIVE_TOLERANCE_LEVELS, relative=True)
+
+
+# ===== zvt_light_speed_resonance_hunter.py: velocidade da luz =====
+# Quantidades derivadas da velocidade da luz
+# Energia de massa do elétron: E = mc²
+E_ELECTRON_REST = M_ELECTRON * C_LIGHT**2  # ≈ 8.19e-14 J ≈ 0.511 MeV
+
+# Energia de massa do próton: E = mc²
+E_PROTON_REST = M_PROTON * C_LIGHT**2  # ≈ 1.50e-10 J ≈ 938 MeV
+
+# Comprimento de onda Compton do elétron: λ_C = h/(mc)
+LAMBDA_COMPTON_E = H_PLANCK / (M_ELECTRON * C_LIGHT)  # ≈ 2.43e-12 m
+
+# Comprimento de onda Compton do próton
+LAMBDA_COMPTON_P = H_PLANCK / (M_PROTON * C_LIGHT)  # ≈ 1.32e-15 m
+
+# Raio clássico do elétron: r_e = e²/(4πε₀mc²)
+R_CLASSICAL_E = E_ELECTRON**2 / (4 * math.pi * EPSILON_0 * M_ELECTRON * C_LIGHT**2)  # ≈ 2.82e-15 m
+
+# Constante de estrutura fina em termos de c: α = e²/(4πε₀ℏc)
+ALPHA_HC = ALPHA * H_BAR * C_LIGHT  # ≈ 2.31e-30 J⋅m
+
+# Escalas normalizadas para compatibilidade com zeros de Riemann
+C_SCALED = C_LIGHT / 1e8           # ≈ 3.0 (velocidade normalizada)
+C2_SCALED = C_LIGHT**2 / 1e16      # ≈ 9.0 (c² normalizada)
+HC_SCALED = H_PLANCK * C_LIGHT / 1e26  # ≈ 2.0 (ℏc normalizada)
+MC2_E_SCALED = E_ELECTRON_REST * 1e13  # ≈ 8.19 (energia elétron)
+MC2_P_SCALED = E_PROTON_REST * 1e10    # ≈ 15.0 (energia próton)
+
+# Fatores relativísticos característicos
+GAMMA_1_5 = 1 / math.sqrt(1 - 0.5**2)      # γ para v = 0.5c ≈ 1.15
+GAMMA_0_9 = 1 / math.sqrt(1 - 0.9**2)      # γ para v = 0.9c ≈ 2.29
+GAMMA_0_99 = 1 / math.sqrt(1 - 0.99**2)    # γ para v = 0.99c ≈ 7.09
+
+# Escalas de tempo relativísticas
+TIME_LIGHT_METER = 1 / C_LIGHT * 1e9       # Tempo para luz viajar 1m (ns) ≈ 3.34
+TIME_LIGHT_KM = 1000 / C_LIGHT * 1e6       # Tempo para luz viajar 1km (μs) ≈ 3.34
+
+# Constante principal para análise
+LIGHT_SPEED_CONSTANT = C_SCALED  # ≈ 3.0
+
+# Constantes de controle para validação estatística
+LIGHT_SPEED_CONTROL_CONSTANTS = {
+    'light_speed': C_SCALED,              # ≈ 3.0
+    'light_squared': C2_SCALED,           # ≈ 9.0
+    'planck_light': HC_SCALED,            # ≈ 2.0
+    'electron_energy': MC2_E_SCALED,      # ≈ 8.19
+    'proton_energy': MC2_P_SCALED,        # ≈ 15.0
+    'gamma_half_c': GAMMA_1_5,            # ≈ 1.15
+    'gamma_0_9c': GAMMA_0_9,              # ≈ 2.29
+    'gamma_0_99c': GAMMA_0_99,            # ≈ 7.09
+    'time_meter_ns': TIME_LIGHT_METER,    # ≈ 3.34
+    'alpha_scaled': ALPHA * 1000,         # ≈ 7.30
+    'random_1': 2.8,
+    'random_2': 3.2,
+    'random_3': 8.5,
+    'random_4': 15.7,
+}
+
+LIGHT_SPEED_FAMILY = ConstantFamily('velocidade_luz',
+                                    {'light_speed': LIGHT_SPEED_CONSTANT, **LIGHT_SPEED_CONTROL_CONSTANTS},
+                                    RELATIVE_TOLERANCE_LEVELS, relative=True)
+
+
+# ===== zvt_alcubierre_resonance_hunter.py: métrica de Alcubierre =====
+# Parâmetros característicos da métrica de Alcubierre
+# Velocidades de distorção superluminais
+V_WARP_2C = 2 * C_LIGHT       # 5.996e8 m/s
+V_WARP_5C = 5 * C_LIGHT       # 1.499e9 m/s
+V_WARP_10C = 10 * C_LIGHT     # 2.998e9 m/s
+V_WARP_100C = 100 * C_LIGHT   # 2.998e10 m/s
+
+# Raios de bolha característicos
+R_PLANCK = 1.616e-35    # m
+R_ATOMIC = 1e-10        # m
+R_NUCLEAR = 1e-15       # m
+R_EARTH = 6.371e6       # m
+R_SOLAR = 6.96e8        # m
+
+# Densidades de energia exótica
+RHO_PLANCK = C_LIGHT**4 / (8 * math.pi * G_GRAVITY * H_PLANCK)  # 7.267e75 kg/m³
+RHO_NUCLEAR = 2.3e17    # kg/m³
+RHO_VACUUM = 9.3e-27    # kg/m³
+
+# Fatores geométricos da métrica
+SIGMA_FACTOR = math.tanh(1)                    # 0.7616
+THETA_FACTOR = (1/math.cosh(1))**2            # 0.4199 (sech²)
+F_SHAPE = 1 / (1 + math.exp(1))               # 0.2689
+
+# Parâmetros de eficiência Alcubierre
+ETA_OPTIMAL = 1/(4*math.pi)                   # 0.0796
+BETA_EXPANSION = math.sqrt(2/math.pi)         # 0.7979
+EPSILON_CAUSALITY = 1/(2*math.pi)             # 0.1592
+
+# Escalas de energia e frequência
+E_WARP_PLANCK = H_PLANCK * C_LIGHT / R_PLANCK # Energia escala Planck
+F_WARP_PLANCK = C_LIGHT / R_PLANCK            # Frequência de Planck
+
+# Constantes principais para análise - valores na escala dos zeros
+ALCUBIERRE_CONSTANT = V_WARP_10C / 1e8  # ~30 (escala compatível)
+WARP_GEOMETRY = SIGMA_FACTOR * 10       # ~7.6
+EXOTIC_DENSITY = RHO_NUCLEAR / 1e15     # ~230
+
+# Constantes de controle para validação estatística
+ALCUBIERRE_CONTROL_CONSTANTS = {
+    'alcubierre_vel': V_WARP_10C / 1e8,      # ~30
+    'warp_geometry': SIGMA_FACTOR * 10,       # ~7.6
+    'exotic_density': RHO_NUCLEAR / 1e15,    # ~230
+    'warp_efficiency': ETA_OPTIMAL * 100,     # ~7.96
+    'expansion_factor': BETA_EXPANSION * 10,  # ~7.98
+    'causality_limit': EPSILON_CAUSALITY * 100, # ~15.92
+    'planck_ratio': E_WARP_PLANCK / 1e8,     # Escala Planck normalizada
+    'random_1': 25.5,
+    'random_2': 31.8,
+    'random_3': 7.2,
+    'random_4': 150.0,
+}
+
+ALCUBIERRE_FAMILY = ConstantFamily('alcubierre', {'alcubierre_vel': ALCUBIERRE_CONSTANT, **ALCUBIERRE_CONTROL_CONSTANTS},
+                                   RELATIVE_TOLERANCE_LEVELS, relative=True)
+
+
+# ===== zvt_spacetime_constants_hunter.py: constantes do espaço-tempo =====
+E_CHARGE = E_ELECTRON             # C (carga elementar)
+MU_0 = 4 * math.pi * 1e-7         # H/m (permeabilidade do vácuo)
+M_NEUTRON = 1.67492749804e-27     # kg (massa do nêutron)
+
+# Constantes derivadas importantes
+STEFAN_BOLTZMANN = 5.670374419e-8  # W⋅m⁻²⋅K⁻⁴
+AVOGADRO = 6.02214076e23          # mol⁻¹
+R_GAS = K_BOLTZMANN * AVOGADRO    # J⋅mol⁻¹⋅K⁻¹
+
+# Escalas normalizadas para compatibilidade com zeros de Riemann
+# Normalizando para ordem de grandeza ~1-100 (compatível com zeros)
+
+# Grupo 1: Constantes Termodinâmicas
+KB_SCALED = K_BOLTZMANN * 1e23     # ≈ 1.38 (Boltzmann normalizada)
+STEFAN_SCALED = STEFAN_BOLTZMANN * 1e8  # ≈ 5.67 (Stefan-Boltzmann)
+R_GAS_SCALED = R_GAS / 10          # ≈ 0.831 (constante dos gases)
+AVOGADRO_SCALED = AVOGADRO / 1e23  # ≈ 6.02 (número de Avogadro)
+
+# Grupo 2: Constantes Eletromagnéticas
+E_CHARGE_SCALED = E_CHARGE * 1e19  # ≈ 1.60 (carga elementar)
+EPSILON0_SCALED = EPSILON_0 * 1e12 # ≈ 8.85 (permissividade)
+MU0_SCALED = MU_0 * 1e7           # ≈ 12.57 (permeabilidade)
+IMPEDANCE_0 = math.sqrt(MU_0/EPSILON_0) / 10  # ≈ 37.7 Ω (impedância do vácuo)
+
+# Grupo 3: Massas Fundamentais
+ME_SCALED = M_ELECTRON * 1e31     # ≈ 9.11 (massa elétron)
+MP_SCALED = M_PROTON * 1e27       # ≈ 1.67 (massa próton)
+MN_SCALED = M_NEUTRON * 1e27      # ≈ 1.67 (massa nêutron)
+MASS_RATIO_PE = M_PROTON / M_ELECTRON  # ≈ 1836.15 (razão próton/elétron)
+
+# Grupo 4: Energias Características
+KB_TEMP_ROOM = K_BOLTZMANN * 300 * 1e21    # ≈ 4.14 (energia térmica ambiente)
+ELECTRON_VOLT = E_CHARGE * 1e19             # ≈ 1.60 (1 eV em Joules normalizado)
+THERMAL_VOLTAGE = K_BOLTZMANN * 300 / E_CHARGE  # ≈ 0.0259 V a 300K
+COMPTON_E = H_PLANCK / (M_ELECTRON * C_LIGHT) * 1e12  # ≈ 2.43 (Compton elétron)
+
+# Grupo 5: Frequências e Tempos
+PLASMA_FREQ_E = math.sqrt(E_CHARGE**2 / (EPSILON_0 * M_ELECTRON)) / 1e10  # frequência plasma
+CYCLOTRON_FREQ = E_CHARGE / M_ELECTRON / 1e10  # fator ciclotron
+BOHR_FREQ = (M_ELECTRON * E_CHARGE**4) / (4 * math.pi * EPSILON_0**2 * H_BAR**3) / 1e15  # freq Bohr
+
+# Constante principal para análise
+SPACETIME_CONSTANT = KB_SCALED  # Começando com Boltzmann
+
+# Constantes de controle para validação estatística
+SPACETIME_CONTROL_CONSTANTS = {
+    # Grupo Termodinâmico
+    'boltzmann': KB_SCALED,              # ≈ 1.38
+    'stefan_boltz': STEFAN_SCALED,       # ≈ 5.67
+    'gas_constant': R_GAS_SCALED,        # ≈ 0.831
+    'avogadro': AVOGADRO_SCALED,         # ≈ 6.02
+    'thermal_room': KB_TEMP_ROOM,        # ≈ 4.14
+
+    # Grupo Eletromagnético
+    'elem_charge': E_CHARGE_SCALED,      # ≈ 1.60
+    'epsilon_0': EPSILON0_SCALED,        # ≈ 8.85
+    'mu_0': MU0_SCALED,                  # ≈ 12.57
+    'impedance_vac': IMPEDANCE_0,        # ≈ 37.7
+    'electron_volt': ELECTRON_VOLT,      # ≈ 1.60
+
+    # Grupo Massas
+    'mass_electron': ME_SCALED,          # ≈ 9.11
+    'mass_proton': MP_SCALED,            # ≈ 1.67
+    'mass_neutron': MN_SCALED,           # ≈ 1.67
+    'mass_ratio_pe': MASS_RATIO_PE / 100, # ≈ 18.36
+    'compton_electron': COMPTON_E,       # ≈ 2.43
+
+    # Controles aleatórios
+    'random_1': 1.5,
+    'random_2': 5.8,
+    'random_3': 12.3,
+    'random_4': 37.2,
+}
+
+SPACETIME_FAMILY = ConstantFamily('espaco_tempo', {'boltzmann': SPACETIME_CONSTANT, **SPACETIME_CONTROL_CONSTANTS},
+                                  RELATIVE_TOLERANCE_LEVELS, relative=True)
+
+
+# ===== zvt_nuclear_cosmic_hunter.py: forças nucleares e cosmologia =====
+# Forças Nucleares
+ALPHA_STRONG = 0.118                    # Constante de acoplamento forte (adimensional)
+FERMI_CONSTANT = 1.1663787e-5          # GeV^-2 (força nuclear fraca)
+QCD_SCALE = 0.217                      # GeV (escala QCD - Lambda_QCD)
+
+# Constantes Cosmológicas
+HUBBLE_CONSTANT = 2.268e-18            # s^-1 (H₀ em unidades SI)
+CMB_TEMPERATURE = 2.72548               # K (temperatura radiação cósmica)
+COSMIC_LAMBDA = 1.1e-52                # m^-2 (constante cosmológica)
+CRITICAL_DENSITY = 9.47e-27             # kg/m^3 (densidade crítica)
+
+# Constantes do Modelo Padrão
+HIGGS_MASS = 125.1                      # GeV (massa do bóson de Higgs)
+WEINBERG_ANGLE = 0.23122                # ângulo de mistura eletrofraca (sin²θ_W)
+W_BOSON_MASS = 80.379                   # GeV (massa do bóson W)
+Z_BOSON_MASS = 91.1876                  # GeV (massa do bóson Z)
+TOP_QUARK_MASS = 173.1                  # GeV (massa do quark top)
+
+# Densidades cosmológicas (frações da densidade crítica)
+OMEGA_MATTER = 0.315                    # fração de matéria
+OMEGA_LAMBDA = 0.685                    # fração de energia escura
+OMEGA_BARYON = 0.0493                   # fração de matéria bariônica
+OMEGA_RADIATION = 9.2e-5                # fração de radiação
+
+# Escalas de energia características
+GEV_TO_JOULE = 1.602176634e-10         # Conversão GeV → J
+PLANCK_MASS_GEV = 1.22e19              # GeV (massa de Planck)
+ELECTROWEAK_SCALE = 246                 # GeV (vev do Higgs)
+
+# Normalizações para escala dos zeros (~1-100)
+
+# Grupo 1: Forças Nucleares
+STRONG_SCALED = ALPHA_STRONG * 100      # ≈ 11.8 (força forte)
+FERMI_SCALED = FERMI_CONSTANT * 1e5     # ≈ 1.17 (força fraca)
+QCD_SCALED = QCD_SCALE * 10             # ≈ 2.17 (escala QCD)
+WEINBERG_SCALED = WEINBERG_ANGLE * 100  # ≈ 23.1 (ângulo de Weinberg)
+
+# Grupo 2: Massas do Modelo Padrão
+HIGGS_SCALED = HIGGS_MASS / 10          # ≈ 12.51 (Higgs)
+W_MASS_SCALED = W_BOSON_MASS / 10       # ≈ 8.04 (W boson)
+Z_MASS_SCALED = Z_BOSON_MASS / 10       # ≈ 9.12 (Z boson)
+TOP_SCALED = TOP_QUARK_MASS / 10        # ≈ 17.31 (top quark)
+ELECTROWEAK_SCALED = ELECTROWEAK_SCALE / 10  # ≈ 24.6 (escala eletrofraca)
+
+# Grupo 3: Constantes Cosmológicas
+HUBBLE_SCALED = HUBBLE_CONSTANT * 1e18  # ≈ 2.27 (Hubble)
+CMB_SCALED = CMB_TEMPERATURE            # ≈ 2.73 (temperatura CMB)
+COSMIC_LAMBDA_SCALED = COSMIC_LAMBDA * 1e52    # ≈ 1.1 (constante cosmológica)
+CRITICAL_DENS_SCALED = CRITICAL_DENSITY * 1e27  # ≈ 9.47 (densidade crítica)
+
+# Grupo 4: Densidades Cosmológicas
+MATTER_SCALED = OMEGA_MATTER * 10       # ≈ 3.15 (fração matéria)
+DARK_ENERGY_SCALED = OMEGA_LAMBDA * 10  # ≈ 6.85 (energia escura)
+BARYON_SCALED = OMEGA_BARYON * 100      # ≈ 4.93 (matéria bariônica)
+RADIATION_SCALED = OMEGA_RADIATION * 1e5 # ≈ 9.2 (radiação)
+
+# Grupo 5: Relações Fundamentais
+PLANCK_MASS_SCALED = PLANCK_MASS_GEV / 1e19  # ≈ 1.22 (massa Planck)
+STRONG_WEAK_RATIO = ALPHA_STRONG / ALPHA  # ≈ 16.2 (razão forte/EM)
+HIGGS_PLANCK_RATIO = HIGGS_MASS / PLANCK_MASS_GEV * 1e19  # ≈ 1.02e-17 → normalizar
+COSMIC_TIME = 1 / HUBBLE_CONSTANT / (365.25 * 24 * 3600) / 1e9  # ≈ 14 Gyr → ≈ 14
+
+# Constante principal para análise
+NUCLEAR_COSMIC_CONSTANT = STRONG_SCALED  # Começando com força forte
+
+# Constantes de controle para validação estatística
+NUCLEAR_COSMIC_CONTROL_CONSTANTS = {
+    # Grupo Forças Nucleares
+    'strong_force': STRONG_SCALED,           # ≈ 11.8
+    'weak_force': FERMI_SCALED,              # ≈ 1.17
+    'qcd_scale': QCD_SCALED,                 # ≈ 2.17
+    'weinberg_angle': WEINBERG_SCALED,       # ≈ 23.1
+    'strong_em_ratio': STRONG_WEAK_RATIO,    # ≈ 16.2
+
+    # Grupo Modelo Padrão
+    'higgs_mass': HIGGS_SCALED,              # ≈ 12.51
+    'w_boson': W_MASS_SCALED,                # ≈ 8.04
+    'z_boson': Z_MASS_SCALED,                # ≈ 9.12
+    'top_quark': TOP_SCALED,                 # ≈ 17.31
+    'electroweak': ELECTROWEAK_SCALED,       # ≈ 24.6
+
+    # Grupo Cosmologia
+    'hubble_const': HUBBLE_SCALED,           # ≈ 2.27
+    'cmb_temp': CMB_SCALED,                  # ≈ 2.73
+    'lambda_cosmo': COSMIC_LAMBDA_SCALED,    # ≈ 1.1
+    'critical_dens': CRITICAL_DENS_SCALED,   # ≈ 9.47
+    'cosmic_age': COSMIC_TIME,               # ≈ 14
+
+    # Grupo Densidades
+    'dark_matter': MATTER_SCALED,            # ≈ 3.15
+    'dark_energy': DARK_ENERGY_SCALED,       # ≈ 6.85
+    'baryons': BARYON_SCALED,                # ≈ 4.93
+    'radiation': RADIATION_SCALED,           # ≈ 9.2
+    'planck_mass': PLANCK_MASS_SCALED,       # ≈ 1.22
+
+    # Controles aleatórios
+    'random_1': 11.5,
+    'random_2': 2.5,
+    'random_3': 24.8,
+    'random_4': 14.2,
+}
+
+NUCLEAR_COSMIC_FAMILY = ConstantFamily('nuclear_cosmica',
+                                       {'strong_force': NUCLEAR_COSMIC_CONSTANT, **NUCLEAR_COSMIC_CONTROL_CONSTANTS},
+                                       RELATIVE_TOLERANCE_LEVELS, relative=True)
+
+
+# Todas as famílias, na ordem em que o motor as avalia
+CONSTANT_FAMILIES = [
+    FUNDAMENTAL_FAMILY,
+    FOUR_FORCES_FAMILY,
+    FINE_STRUCTURE_FAMILY,
+    PLANCK_FAMILY,
+    RYDBERG_FAMILY,
+    LIGHT_SPEED_FAMILY,
+    ALCUBIERRE_FAMILY,
+    SPACETIME_FAMILY,
+    NUCLEAR_COSMIC_FAMILY,
+]
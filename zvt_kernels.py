@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZVT_KERNELS.py - Kernels vetorizados compartilhados pelos hunters ZVT
+Author: Jefferson M. Okushigue
+Date: 2025-08-12
+Calcula o resíduo dobrado min(γ mod c, c − γ mod c) uma única vez por constante
+sobre um array contíguo de gammas; todas as tolerâncias saem desse mesmo array,
+via um índice ordenado consultado por busca binária.
+Os gammas só têm a casas decimais (9 em zero.txt): com c = C·10⁻ˢ todo resíduo é
+múltiplo de 10^−max(a, s). Constantes abaixo do passo 10⁻ᵃ, ou com γ_max/c além
+de 2⁵³ (onde γ mod c em float64 é só ruído), não são resolvidas pelos dados
+(resíduo NaN): é o caso de 'gravitacional' (5.9e-39). Tolerâncias até o
+espaçamento dos resíduos não são testadas, pois só contariam resíduos
+exatamente nulos.
+"""
+
+from decimal import Decimal
+import numpy as np
+
+BEST_MATCH_TILE = 4_000_000  # Elementos por bloco (constantes × zeros) ≈ 32 MB em float64
+FLOAT64_QUOTIENT_LIMIT = 2.0 ** 53  # Acima de γ/c = 2⁵³, γ mod c em float64 é só ruído
+MAX_DECIMALS = 17  # Casas decimais testadas ao estimar o passo dos gammas
+DECIMAL_SAMPLE = 1024  # Gammas amostrados para estimar as casas decimais
+RESOLUTION_RTOL = 1e-9  # Folga ao comparar tolerâncias com o espaçamento 10⁻ᵗ
+
+
+def zeros_as_arrays(zeros):
+    """Converte a lista de tuplas (índice, gamma) em arrays (int64, float64)"""
+    if hasattr(zeros, 'gammas'):  # ZeroStore: colunas já prontas, sem cópia
+        return zeros.indices, zeros.gammas
+    if isinstance(zeros, tuple) and len(zeros) == 2 and isinstance(zeros[1], np.ndarray):
+        return zeros
+    if len(zeros) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+    table = np.asarray(zeros, dtype=np.float64)
+    indices = table[:, 0].astype(np.int64)
+    gammas = np.ascontiguousarray(table[:, 1])
+    return indices, gammas
+
+
+def folded_residuals(gammas, constant_value):
+    """Resíduo dobrado min(γ mod c, c − γ mod c) para todos os gammas de uma vez
+
+    NaN para constantes abaixo do limite de resolução dos gammas (is_resolved).
+    """
+    if not is_resolved(gammas, constant_value):
+        return np.full(len(gammas), np.nan)
+    mod_vals = np.mod(gammas, constant_value)
+    return np.minimum(mod_vals, constant_value - mod_vals)
+
+
+def decimal_step(gammas):
+    """Passo decimal 10⁻ᵃ dos gammas, com a estimado numa amostra
+
+    0 sem gammas ou se a maioria não tem decimal curto (gammas calculados, não
+    lidos de arquivo): aí a resolução é a do próprio float64.
+    """
+    if len(gammas) == 0:
+        return 0.0
+    _, decimals, exact = decimal_mantissas(gammas[:DECIMAL_SAMPLE])
+    return 10.0 ** -decimals if 2 * np.count_nonzero(exact) > len(exact) else 0.0
+
+
+def resolution_limit(gammas):
+    """Menor constante resolvida: o passo decimal dos gammas ou γ_max/2⁵³
+
+    Abaixo do passo decimal γ mod c só percorre a grade decimal; abaixo de
+    γ_max/2⁵³ o erro de arredondamento de γ já é da ordem de c.
+    """
+    if len(gammas) == 0:
+        return 0.0
+    return max(decimal_step(gammas), float(np.max(np.abs(gammas))) / FLOAT64_QUOTIENT_LIMIT)
+
+
+def is_resolved(gammas, constant_value):
+    """c ≥ resolution_limit(gammas); abaixo dele os resíduos não dizem nada sobre c"""
+    return constant_value >= resolution_limit(gammas)
+
+
+def residual_spacing(gammas, constant_value):
+    """Espaçamento 10^−max(a, s) da grade em que caem os resíduos de c = C·10⁻ˢ"""
+    step = decimal_step(gammas)
+    if step == 0:
+        return 0.0
+    return min(step, 10.0 ** -decimal_fixed_point(constant_value)[1])
+
+
+def resolvable_tolerances(gammas, constant_value, tolerances, relative=False):
+    """Tolerâncias acima do espaçamento dos resíduos (nenhuma se c não é resolvida)
+
+    Com tolerância ≤ espaçamento, "resíduo < tol" só conta resíduos exatamente
+    nulos, de probabilidade espaçamento/c contra os 2·tol/c esperados.
+    """
+    if not is_resolved(gammas, constant_value):
+        return []
+    spacing = residual_spacing(gammas, constant_value) * (1 + RESOLUTION_RTOL)
+    scale = constant_value if relative else 1.0
+    return [tolerance for tolerance in tolerances if tolerance * scale > spacing]
+
+
+def decimal_fixed_point(value):
+    """(C, s) inteiros com value = C·10⁻ˢ, a partir do decimal mais curto de repr()"""
+    _, digits, exponent = Decimal(repr(float(value))).as_tuple()
+    mantissa = int(''.join(map(str, digits)))
+    if exponent > 0:
+        return mantissa * 10 ** exponent, 0
+    return mantissa, -exponent
+
+
+def decimal_mantissas(gammas):
+    """(G, a, exato): gammas como inteiros G·10⁻ᵃ, com o número de casas que melhor os representa"""
+    best = None
+    # Uma amostra indica as casas decimais do arquivo; testa-se primeiro esse valor
+    sample_decimals = decimal_mantissas(gammas[:DECIMAL_SAMPLE])[1] if len(gammas) > DECIMAL_SAMPLE else 0
+    for decimals in [sample_decimals] + list(range(MAX_DECIMALS + 1)):
+        scale = 10.0 ** decimals
+        scaled = np.rint(gammas * scale)
+        # Casas mais finas que o ulp de γ tornariam o decimal ambíguo (≠ repr)
+        exact = (np.spacing(np.abs(gammas)) * scale < 1.0) & (scaled / scale == gammas)
+        count = int(np.count_nonzero(exact))
+        if best is None or count > best[0]:
+            best = (count, decimals, scaled, exact)
+        if count == len(gammas):
+            break
+    _, decimals, scaled, exact = best
+    return np.where(exact, scaled, 0).astype(np.int64), decimals, exact
+
+
+class ResidualIndex:
+    """Resíduos dobrados de uma constante ordenados uma vez (O(N log N))
+
+    Qualquer consulta "resíduo < tolerância" vira busca binária + fatia,
+    O(log N + k), então tolerâncias aninhadas saem praticamente de graça.
+    """
+
+    def __init__(self, residuals):
+        self.order = np.argsort(residuals, kind='stable')
+        self.sorted_residuals = residuals[self.order]
+
+    def count_below(self, tolerance):
+        """Número de zeros com resíduo estritamente menor que a tolerância"""
+        return int(np.searchsorted(self.sorted_residuals, tolerance, side='left'))
+
+    def positions_below(self, tolerance):
+        """Posições (na ordem original dos zeros) com resíduo < tolerância"""
+        return np.sort(self.order[:self.count_below(tolerance)])
+
+    def best_position(self):
+        """Posição do zero com menor resíduo"""
+        return int(self.order[0])
+
+
+def multi_tolerance_resonances(indices, gammas, constant_value, tolerances, relative=False):
+    """Ressonâncias de uma constante em todas as tolerâncias a partir de um único passe
+
+    Com relative=False devolve tuplas (n, gamma, min_distance, tolerance), como em
+    scanner_z.py; com relative=True a tolerância se aplica ao erro relativo
+    min_distance / c e as tuplas ganham o quinto campo relative_error.
+    """
+    residuals = folded_residuals(gammas, constant_value)
+    return resonances_from_residuals(indices, gammas, residuals, constant_value, tolerances, relative)
+
+
+def resonances_from_residuals(indices, gammas, residuals, constant_value, tolerances, relative=False):
+    """Mesma saída de multi_tolerance_resonances a partir de resíduos já calculados
+
+    Só as tolerâncias de resolvable_tolerances entram no dicionário.
+    """
+    compared = residuals / constant_value if relative else residuals
+    index = ResidualIndex(compared)
+    results = {}
+    for tolerance in resolvable_tolerances(gammas, constant_value, tolerances, relative):
+        positions = index.positions_below(tolerance)
+        columns = [indices[positions].tolist(), gammas[positions].tolist(),
+                   residuals[positions].tolist(), [tolerance] * len(positions)]
+        if relative:
+            columns.append(compared[positions].tolist())
+        results[tolerance] = list(zip(*columns))
+    return results
+
+
+def best_resonances(gammas, constants, tile_elements=BEST_MATCH_TILE):
+    """Melhor resíduo de cada constante de uma matriz (ex.: simulações × constantes)
+
+    Avalia blocos constantes × zeros por broadcasting, com memória limitada a
+    tile_elements, e devolve (melhor_qualidade, posição_do_zero) no formato da
+    entrada. Empates mantêm o primeiro zero, como o antigo laço com '<'.
+    Constantes abaixo do limite de resolução dos gammas (resolution_limit)
+    saem com qualidade NaN e posição −1.
+    """
+    constants = np.asarray(constants, dtype=np.float64)
+    flat = constants.ravel()
+    best_quality = np.full(flat.shape, np.inf)
+    best_position = np.zeros(flat.shape, dtype=np.int64)
+    n_zeros = len(gammas)
+    if n_zeros == 0:
+        return best_quality.reshape(constants.shape), best_position.reshape(constants.shape)
+    unresolved = flat < resolution_limit(gammas)
+    best_quality[unresolved] = np.nan
+    best_position[unresolved] = -1
+    if unresolved.any():
+        regular = np.flatnonzero(~unresolved)
+        quality, positions = best_resonances(gammas, flat[regular], tile_elements)
+        best_quality[regular] = quality
+        best_position[regular] = positions
+        return best_quality.reshape(constants.shape), best_position.reshape(constants.shape)
+    zero_block = min(n_zeros, tile_elements)
+    const_block = max(1, tile_elements // zero_block)
+    for c_start in range(0, len(flat), const_block):
+        values = flat[c_start:c_start + const_block, None]
+        rows = np.arange(len(values))
+        block_quality = best_quality[c_start:c_start + const_block]
+        block_position = best_position[c_start:c_start + const_block]
+        for z_start in range(0, n_zeros, zero_block):
+            tile = np.mod(gammas[None, z_start:z_start + zero_block], values)
+            np.minimum(tile, values - tile, out=tile)
+            positions = np.argmin(tile, axis=1)
+            qualities = tile[rows, positions]
+            improved = qualities < block_quality
+            block_quality[improved] = qualities[improved]
+            block_position[improved] = positions[improved] + z_start
+    return best_quality.reshape(constants.shape), best_position.reshape(constants.shape)
@@ -10,94 +10,37 @@ import numpy as np
 from mpmath import mp
 import time
 from concurrent.futures import ProcessPoolExecutor
-import pickle
 import os
 import signal
 import sys
 from datetime import datetime
-from scipy import stats
 from scipy.stats import kstest, anderson
 import warnings
-import math
+from zvt_kernels import zeros_as_arrays
+from zvt_zero_store import store_path_for, load_zero_store, write_zero_store, read_zero_file
+from zvt_checkpoint import BatchCheckpointer, checkpoint_path_for, checkpoint_fingerprint
+from zvt_engine import (UnifiedResonanceEngine, load_constant_families, session_tolerance_summary,
+                        session_comparison, session_best_resonance)
+from zvt_families import (C_LIGHT, E_ELECTRON, E_ELECTRON_REST, E_PROTON_REST, LAMBDA_COMPTON_E,
+                          LAMBDA_COMPTON_P, R_CLASSICAL_E, GAMMA_1_5, GAMMA_0_9, GAMMA_0_99,
+                          LIGHT_SPEED_CONSTANT, RELATIVE_TOLERANCE_LEVELS as TOLERANCE_LEVELS,
+                          LIGHT_SPEED_CONTROL_CONSTANTS as CONTROL_CONSTANTS,
+                          LIGHT_SPEED_FAMILY as CONSTANT_FAMILY)
+from zvt_statistics import batch_significance, significance_record
 
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
 # Configuration
 mp.dps = 50  # High precision
 
-# Velocidade da luz e constantes fundamentais relacionadas
-C_LIGHT = 299792458  # m/s (valor exato por definição)
-H_PLANCK = 6.62607015e-34  # J⋅s
-H_BAR = H_PLANCK / (2 * math.pi)
-E_ELECTRON = 1.602176634e-19  # C
-M_ELECTRON = 9.1093837015e-31  # kg
-M_PROTON = 1.67262192369e-27  # kg
-ALPHA = 7.2973525693e-3  # Estrutura fina
-EPSILON_0 = 8.8541878128e-12  # F/m (permissividade do vácuo)
-
-# Quantidades derivadas da velocidade da luz
-# Energia de massa do elétron: E = mc²
-E_ELECTRON_REST = M_ELECTRON * C_LIGHT**2  # ≈ 8.19e-14 J ≈ 0.511 MeV
-
-# Energia de massa do próton: E = mc²
-E_PROTON_REST = M_PROTON * C_LIGHT**2  # ≈ 1.50e-10 J ≈ 938 MeV
-
-# Comprimento de onda Compton do elétron: λ_C = h/(mc)
-LAMBDA_COMPTON_E = H_PLANCK / (M_ELECTRON * C_LIGHT)  # ≈ 2.43e-12 m
-
-# Comprimento de onda Compton do próton
-LAMBDA_COMPTON_P = H_PLANCK / (M_PROTON * C_LIGHT)  # ≈ 1.32e-15 m
-
-# Raio clássico do elétron: r_e = e²/(4πε₀mc²)
-R_CLASSICAL_E = E_ELECTRON**2 / (4 * math.pi * EPSILON_0 * M_ELECTRON * C_LIGHT**2)  # ≈ 2.82e-15 m
-
-# Constante de estrutura fina em termos de c: α = e²/(4πε₀ℏc)
-ALPHA_HC = ALPHA * H_BAR * C_LIGHT  # ≈ 2.31e-30 J⋅m
-
-# Escalas normalizadas para compatibilidade com zeros de Riemann
-C_SCALED = C_LIGHT / 1e8           # ≈ 3.0 (velocidade normalizada)
-C2_SCALED = C_LIGHT**2 / 1e16      # ≈ 9.0 (c² normalizada)
-HC_SCALED = H_PLANCK * C_LIGHT / 1e26  # ≈ 2.0 (ℏc normalizada)
-MC2_E_SCALED = E_ELECTRON_REST * 1e13  # ≈ 8.19 (energia elétron)
-MC2_P_SCALED = E_PROTON_REST * 1e10    # ≈ 15.0 (energia próton)
-
-# Fatores relativísticos característicos
-GAMMA_1_5 = 1 / math.sqrt(1 - 0.5**2)      # γ para v = 0.5c ≈ 1.15
-GAMMA_0_9 = 1 / math.sqrt(1 - 0.9**2)      # γ para v = 0.9c ≈ 2.29
-GAMMA_0_99 = 1 / math.sqrt(1 - 0.99**2)    # γ para v = 0.99c ≈ 7.09
-
-# Escalas de tempo relativísticas
-TIME_LIGHT_METER = 1 / C_LIGHT * 1e9       # Tempo para luz viajar 1m (ns) ≈ 3.34
-TIME_LIGHT_KM = 1000 / C_LIGHT * 1e6       # Tempo para luz viajar 1km (μs) ≈ 3.34
-
-# Constante principal para análise
-LIGHT_SPEED_CONSTANT = C_SCALED  # ≈ 3.0
-
-TOLERANCE_LEVELS = [1e-6, 1e-7, 1e-8, 1e-9, 1e-10, 1e-11]  # Tolerâncias relativas
 DEFAULT_TOLERANCE = 1e-8
 INCREMENT = 1000  # Batch size for processing
 
-# Constantes de controle para validação estatística
-CONTROL_CONSTANTS = {
-    'light_speed': C_SCALED,              # ≈ 3.0
-    'light_squared': C2_SCALED,           # ≈ 9.0
-    'planck_light': HC_SCALED,            # ≈ 2.0
-    'electron_energy': MC2_E_SCALED,      # ≈ 8.19
-    'proton_energy': MC2_P_SCALED,        # ≈ 15.0
-    'gamma_half_c': GAMMA_1_5,            # ≈ 1.15
-    'gamma_0_9c': GAMMA_0_9,              # ≈ 2.29
-    'gamma_0_99c': GAMMA_0_99,            # ≈ 7.09
-    'time_meter_ns': TIME_LIGHT_METER,    # ≈ 3.34
-    'alpha_scaled': ALPHA * 1000,         # ≈ 7.30
-    'random_1': 2.8,
-    'random_2': 3.2,
-    'random_3': 8.5,
-    'random_4': 15.7,
-}
-
 MAX_WORKERS = os.cpu_count()
 CACHE_FILE = "zeta_zeros_cache.pkl"
+STORE_FILE = store_path_for(CACHE_FILE)  # Store colunar preferido ao pickle
 STATS_FILE = "zvt_light_speed_stats.txt"
+CHECKPOINT_FILE = checkpoint_path_for(STATS_FILE)  # Progresso da varredura para --resume
 RESULTS_DIR = "zvt_light_speed_results"
 ZEROS_FILE = os.path.expanduser("~/Downloads/zero.txt")  # Path to the zeros file
 
@@ -118,21 +61,10 @@ def signal_handler(signum, frame):
     shutdown_requested = True
 
 def load_zeros_from_file(filename):
-    zeros = []
     try:
         print(f"📂 Carregando zeros do arquivo: {filename}")
-        with open(filename, 'r') as f:
-            for line_num, line in enumerate(f, start=1):
-                if shutdown_requested:
-                    break
-                line = line.strip()
-                if line:
-                    try:
-                        zero = float(line)
-                        zeros.append((line_num, zero))  # Format: (index, value)
-                    except ValueError:
-                        print(f"⚠️ Linha inválida {line_num}: '{line}'")
-                        continue
+        # Leitura única em blocos, progresso pelo offset em bytes
+        zeros = read_zero_file(filename, should_stop=lambda: shutdown_requested)
         print(f"✅ {len(zeros):,} zeros carregados")
         return zeros
     except Exception as e:
@@ -141,97 +73,48 @@ def load_zeros_from_file(filename):
 
 def save_enhanced_cache(zeros, backup=True):
     try:
-        if backup and os.path.exists(CACHE_FILE):
-            backup_file = f"{CACHE_FILE}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            os.rename(CACHE_FILE, backup_file)
+        if backup and os.path.exists(STORE_FILE):
+            backup_file = f"{STORE_FILE}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            os.rename(STORE_FILE, backup_file)
             print(f"📦 Backup do cache criado: {backup_file}")
-        with open(CACHE_FILE, 'wb') as f:
-            pickle.dump(zeros, f, protocol=pickle.HIGHEST_PROTOCOL)
+        indices, gammas = zeros_as_arrays(zeros)
+        write_zero_store(STORE_FILE, indices, gammas, getattr(zeros, 'source_bytes', 0))
         print(f"💾 Cache salvo: {len(zeros)} zeros")
     except Exception as e:
         print(f"❌ Erro ao salvar cache: {e}")
 
 def load_enhanced_cache():
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, 'rb') as f:
-                data = pickle.load(f)
-                if isinstance(data, list) and len(data) > 0:
-                    print(f"✅ Cache válido: {len(data):,} zeros carregados")
-                    return data
-        except:
-            print("⚠️ Cache inválido, carregando do arquivo...")
+    try:
+        data = load_zero_store(CACHE_FILE)
+    except Exception as e:
+        print(f"⚠️ Cache inválido ({e}), carregando do arquivo...")
+        data = None
+    if data is not None and len(data) > 0:
+        print(f"✅ Cache válido: {len(data):,} zeros mapeados")
+        return data
     zeros = load_zeros_from_file(ZEROS_FILE)
     if zeros:
         save_enhanced_cache(zeros)
         return zeros[:FRESH_START_ZEROS] if FRESH_START_ZEROS > 0 else zeros
     return []
 
-def find_multi_tolerance_resonances(zeros, constants_dict=None):
-    if constants_dict is None:
-        constants_dict = {'light_speed': LIGHT_SPEED_CONSTANT}
-    all_results = {}
-    for const_name, const_value in constants_dict.items():
-        all_results[const_name] = {}
-        for tolerance in TOLERANCE_LEVELS:
-            resonances = []
-            for n, gamma in zeros:
-                mod_val = gamma % const_value
-                min_distance = min(mod_val, const_value - mod_val)
-                relative_error = min_distance / const_value  # Erro relativo
-                if relative_error < tolerance:
-                    resonances.append((n, gamma, min_distance, tolerance, relative_error))
-            all_results[const_name][tolerance] = resonances
-    return all_results
+# Ressonâncias do lote de todas as constantes da família, num único passe do motor unificado
+def find_multi_tolerance_resonances(zeros, engine):
+    indices, gammas = zeros_as_arrays(zeros)
+    return engine.process_block(indices, gammas, collect=True)[CONSTANT_FAMILY.name]
 
 def enhanced_statistical_analysis(zeros, resonances, constant_value, tolerance):
     if len(zeros) == 0 or len(resonances) == 0:
         return None
     total_zeros = len(zeros)
     resonant_count = len(resonances)
-    expected_random = total_zeros * (2 * tolerance)  # Tolerância relativa
-    results = {
-        'basic_stats': {
-            'total_zeros': total_zeros,
-            'resonant_count': resonant_count,
-            'expected_random': expected_random,
-            'resonance_rate': resonant_count / total_zeros,
-            'significance_factor': resonant_count / expected_random if expected_random > 0 else float('inf')
-        }
-    }
-    if expected_random >= 5:
-        chi2_stat = (resonant_count - expected_random)**2 / expected_random
-        chi2_pvalue = 1 - stats.chi2.cdf(chi2_stat, df=1)
-        results['chi2_test'] = {
-            'statistic': chi2_stat,
-            'p_value': chi2_pvalue,
-            'critical_value_05': 3.841,
-            'significant': chi2_stat > 3.841
-        }
-    p_expected = 2 * tolerance  # Tolerância já é relativa
-    try:
-        binom_result = stats.binomtest(resonant_count, total_zeros, p_expected, alternative='two-sided')
-        binom_pvalue = binom_result.pvalue
-    except AttributeError:
-        try:
-            binom_pvalue = stats.binom_test(resonant_count, total_zeros, p_expected, alternative='two-sided')
-        except AttributeError:
-            from scipy.stats import binom
-            binom_pvalue = 2 * min(binom.cdf(resonant_count, total_zeros, p_expected),
-                                  1 - binom.cdf(resonant_count - 1, total_zeros, p_expected))
-    results['binomial_test'] = {
-        'p_value': binom_pvalue,
-        'significant': binom_pvalue < 0.05
-    }
-    poisson_pvalue = 1 - stats.poisson.cdf(resonant_count - 1, expected_random)
-    results['poisson_test'] = {
-        'p_value': poisson_pvalue,
-        'significant': poisson_pvalue < 0.05
-    }
+    p_expected = 2 * tolerance  # Tolerância relativa
+    # Qui-quadrado, binomial e Poisson numa única chamada vetorizada
+    results = significance_record(batch_significance(resonant_count, total_zeros, p_expected), 0)
     return results
 
-def comparative_constant_analysis(zeros, tolerance=DEFAULT_TOLERANCE):
-    multi_results = find_multi_tolerance_resonances(zeros, CONTROL_CONSTANTS)
+def comparative_constant_analysis(zeros, family_results, tolerance=DEFAULT_TOLERANCE):
+    multi_results = {const_name: family_results[const_name] for const_name in CONTROL_CONSTANTS}
     comparative_stats = {}
     for const_name, const_results in multi_results.items():
         if tolerance in const_results:
@@ -246,11 +129,11 @@ def comparative_constant_analysis(zeros, tolerance=DEFAULT_TOLERANCE):
             }
     return comparative_stats
 
-def analyze_batch_enhanced(zeros, batch_num):
+def analyze_batch_enhanced(zeros, batch_num, family_results):
     print(f"\n🔬 LOTE #{batch_num}: {len(zeros):,} zeros")
     if len(zeros) < MINIMUM_FOR_STATS:
         print(f"   📊 Necessário {MINIMUM_FOR_STATS - len(zeros):,} mais zeros para estatísticas")
-        light_results = find_multi_tolerance_resonances(zeros, {'light_speed': LIGHT_SPEED_CONSTANT})['light_speed']
+        light_results = family_results['light_speed']
         tolerance_summary = {}
         for tolerance in TOLERANCE_LEVELS[:3]:
             if tolerance in light_results:
@@ -273,7 +156,7 @@ def analyze_batch_enhanced(zeros, batch_num):
                 print(f"| {tolerance:8.0e} | {data['count']:8d} | {data['rate']:8.3f} |")
         return tolerance_summary, {}, None
     
-    light_results = find_multi_tolerance_resonances(zeros, {'light_speed': LIGHT_SPEED_CONSTANT})['light_speed']
+    light_results = family_results['light_speed']
     print(f"\n📊 RESSONÂNCIAS VELOCIDADE DA LUZ POR TOLERÂNCIA (c/10⁸ = {LIGHT_SPEED_CONSTANT:.3f}):")
     print("| Tolerância | Contagem | Taxa (%) | Melhor Qualidade | Significância |")
     print("|------------|----------|----------|------------------|---------------|")
@@ -304,7 +187,7 @@ def analyze_batch_enhanced(zeros, batch_num):
                 print(f"| {tolerance:8.0e} | {count:8d} | {rate:8.3f} |      N/A     |     N/A    |")
     
     print(f"\n🎛️ COMPARAÇÃO DE PARÂMETROS RELATIVÍSTICOS (Tolerância: {DEFAULT_TOLERANCE}):")
-    comparative_results = comparative_constant_analysis(zeros, DEFAULT_TOLERANCE)
+    comparative_results = comparative_constant_analysis(zeros, family_results, DEFAULT_TOLERANCE)
     print("| Parâmetro     | Valor          | Contagem | Taxa (%) | Significância |")
     print("|---------------|----------------|----------|----------|---------------|")
     for const_name, results in comparative_results.items():
@@ -340,10 +223,13 @@ def analyze_batch_enhanced(zeros, batch_num):
     
     return tolerance_summary, comparative_results, best_overall
 
-def generate_comprehensive_report(zeros, session_results, final_batch):
+def generate_comprehensive_report(zeros, session_results, final_batch, engine):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report_file = os.path.join(RESULTS_DIR, f"Relatorio_Light_Speed_{timestamp}.txt")
-    final_tolerance_analysis, final_comparative, final_best = analyze_batch_enhanced(zeros, final_batch)
+    # Estado acumulado pelo motor durante a varredura: os zeros não são reprocessados
+    final_tolerance_analysis = session_tolerance_summary(engine, CONSTANT_FAMILY, 'light_speed')
+    final_comparative = session_comparison(engine, CONSTANT_FAMILY, CONTROL_CONSTANTS, DEFAULT_TOLERANCE)
+    final_best = session_best_resonance(engine, CONSTANT_FAMILY, 'light_speed', DEFAULT_TOLERANCE)
     
     with open(report_file, 'w', encoding='utf-8') as f:
         f.write("="*80 + "\n")
@@ -432,7 +318,7 @@ def infinite_hunter_light_speed():
     print(f"🔬 Parâmetro Principal = {LIGHT_SPEED_CONSTANT:.3f}")
     print(f"📁 Arquivo: {ZEROS_FILE}")
     print(f"📊 Tolerâncias: {TOLERANCE_LEVELS}")
-    print("🛑 Ctrl+C para parar")
+    print("🛑 Ctrl+C para parar (continue depois com --resume)")
     print("=" * 80)
     
     all_zeros = load_enhanced_cache()
@@ -442,11 +328,22 @@ def infinite_hunter_light_speed():
         return [], [], None
     
     print(f"📊 Zeros disponíveis: {current_count:,}")
-    session_results = []
-    best_overall = None
-    batch_num = 1
+    # Retomar do último lote concluído de uma execução interrompida
+    checkpointer = BatchCheckpointer(CHECKPOINT_FILE, checkpoint_fingerprint(ZEROS_FILE, INCREMENT))
+    state = checkpointer.resume() if '--resume' in sys.argv[1:] else None
+    session_results = state['session_results'] if state else []
+    best_overall = state['best_overall'] if state else None
+    batch_num = state['batch_num'] if state else 1
+    # Motor unificado só com a família deste hunter; o estado acumulado alimenta o relatório final
+    engine = UnifiedResonanceEngine(load_constant_families([CONSTANT_FAMILY.name]))
+    if state and 'engine' in state:
+        engine.restore(state['engine'])
+    checkpoint_state = lambda: {'batch_num': batch_num,
+                                'next_zero': session_results[-1]['zeros_analyzed'] if session_results else 0,
+                                'best_overall': best_overall, 'session_results': session_results,
+                                'engine': engine.state()}
     
-    for i in range(0, current_count, INCREMENT):
+    for i in range(state['next_zero'] if state else 0, current_count, INCREMENT):
         if shutdown_requested:
             break
         batch_start = i
@@ -454,7 +351,8 @@ def infinite_hunter_light_speed():
         batch = all_zeros[batch_start:batch_end]
         print(f"\n🔬 LOTE #{batch_num}: Zeros {batch_start:,} a {batch_end:,}")
         start_time = time.time()
-        tolerance_analysis, comparative_analysis, batch_best = analyze_batch_enhanced(batch, batch_num)
+        family_results = find_multi_tolerance_resonances(batch, engine)
+        tolerance_analysis, comparative_analysis, batch_best = analyze_batch_enhanced(batch, batch_num, family_results)
         if batch_best and (not best_overall or batch_best[4] < best_overall[4]):  # Comparar por erro relativo
             best_overall = batch_best
             print(f"    🎯 NOVO MELHOR GLOBAL VELOCIDADE DA LUZ!")
@@ -469,9 +367,16 @@ def infinite_hunter_light_speed():
             'best_resonance': batch_best
         })
         batch_num += 1
+        checkpointer.update(checkpoint_state())
+    
+    if shutdown_requested:
+        checkpointer.save(checkpoint_state())
+        print(f"💡 Continue com: python3 {sys.argv[0]} --resume")
+    else:
+        checkpointer.finish()  # Varredura completa: a próxima execução começa do início
     
     print(f"\n📊 Gerando relatório final Velocidade da Luz...")
-    generate_comprehensive_report(all_zeros, session_results, batch_num-1)
+    generate_comprehensive_report(all_zeros, session_results, batch_num-1, engine)
     return all_zeros, session_results, best_overall
 
 def main():
@@ -485,7 +390,7 @@ def main():
         if zeros and len(zeros) > 0:
             print(f"\n🎯 Análise Velocidade da Luz Concluída!")
             print(f"📁 Resultados em: {RESULTS_DIR}/")
-            print(f"💾 Cache: {CACHE_FILE}")
+            print(f"💾 Cache: {STORE_FILE}")
             print(f"📊 Estatísticas: {STATS_FILE}")
             
             if best:
@@ -10,139 +10,38 @@ import numpy as np
 from mpmath import mp
 import time
 from concurrent.futures import ProcessPoolExecutor
-import pickle
 import os
 import signal
 import sys
 from datetime import datetime
-from scipy import stats
 from scipy.stats import kstest, anderson
 import warnings
 import math
+from zvt_kernels import zeros_as_arrays
+from zvt_zero_store import store_path_for, load_zero_store, write_zero_store, read_zero_file
+from zvt_checkpoint import BatchCheckpointer, checkpoint_path_for, checkpoint_fingerprint
+from zvt_engine import (UnifiedResonanceEngine, load_constant_families, session_tolerance_summary,
+                        session_comparison, session_best_resonance)
+from zvt_families import (ALPHA_STRONG, FERMI_CONSTANT, QCD_SCALE, HUBBLE_CONSTANT, CMB_TEMPERATURE,
+                          COSMIC_LAMBDA, CRITICAL_DENSITY, HIGGS_MASS, WEINBERG_ANGLE, W_BOSON_MASS,
+                          Z_BOSON_MASS, NUCLEAR_COSMIC_CONSTANT, RELATIVE_TOLERANCE_LEVELS as TOLERANCE_LEVELS,
+                          NUCLEAR_COSMIC_CONTROL_CONSTANTS as CONTROL_CONSTANTS,
+                          NUCLEAR_COSMIC_FAMILY as CONSTANT_FAMILY)
+from zvt_statistics import batch_significance, significance_record
 
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
 # Configuration
 mp.dps = 50  # High precision
 
-# Constantes das Forças Nucleares e Cosmologia
-# Forças Nucleares
-ALPHA_STRONG = 0.118                    # Constante de acoplamento forte (adimensional)
-FERMI_CONSTANT = 1.1663787e-5          # GeV^-2 (força nuclear fraca)
-QCD_SCALE = 0.217                      # GeV (escala QCD - Lambda_QCD)
-
-# Constantes Cosmológicas  
-HUBBLE_CONSTANT = 2.268e-18            # s^-1 (H₀ em unidades SI)
-CMB_TEMPERATURE = 2.72548               # K (temperatura radiação cósmica)
-COSMIC_LAMBDA = 1.1e-52                # m^-2 (constante cosmológica)
-CRITICAL_DENSITY = 9.47e-27             # kg/m^3 (densidade crítica)
-
-# Constantes do Modelo Padrão
-HIGGS_MASS = 125.1                      # GeV (massa do bóson de Higgs)
-WEINBERG_ANGLE = 0.23122                # ângulo de mistura eletrofraca (sin²θ_W)
-W_BOSON_MASS = 80.379                   # GeV (massa do bóson W)
-Z_BOSON_MASS = 91.1876                  # GeV (massa do bóson Z)
-TOP_QUARK_MASS = 173.1                  # GeV (massa do quark top)
-
-# Densidades cosmológicas (frações da densidade crítica)
-OMEGA_MATTER = 0.315                    # fração de matéria
-OMEGA_LAMBDA = 0.685                    # fração de energia escura
-OMEGA_BARYON = 0.0493                   # fração de matéria bariônica
-OMEGA_RADIATION = 9.2e-5                # fração de radiação
-
-# Constantes já descobertas (para referência)
-C_LIGHT = 299792458                     # m/s
-H_PLANCK = 6.62607015e-34              # J⋅s
-G_GRAVITY = 6.67430e-11                # m³⋅kg⁻¹⋅s⁻²
-ALPHA = 7.2973525693e-3                # Estrutura fina
-K_BOLTZMANN = 1.380649e-23             # J/K
-EPSILON_0 = 8.8541878128e-12           # F/m
-
-# Escalas de energia características
-GEV_TO_JOULE = 1.602176634e-10         # Conversão GeV → J
-PLANCK_MASS_GEV = 1.22e19              # GeV (massa de Planck)
-ELECTROWEAK_SCALE = 246                 # GeV (vev do Higgs)
-
-# Normalizações para escala dos zeros (~1-100)
-
-# Grupo 1: Forças Nucleares
-STRONG_SCALED = ALPHA_STRONG * 100      # ≈ 11.8 (força forte)
-FERMI_SCALED = FERMI_CONSTANT * 1e5     # ≈ 1.17 (força fraca)
-QCD_SCALED = QCD_SCALE * 10             # ≈ 2.17 (escala QCD)
-WEINBERG_SCALED = WEINBERG_ANGLE * 100  # ≈ 23.1 (ângulo de Weinberg)
-
-# Grupo 2: Massas do Modelo Padrão  
-HIGGS_SCALED = HIGGS_MASS / 10          # ≈ 12.51 (Higgs)
-W_MASS_SCALED = W_BOSON_MASS / 10       # ≈ 8.04 (W boson)
-Z_MASS_SCALED = Z_BOSON_MASS / 10       # ≈ 9.12 (Z boson)
-TOP_SCALED = TOP_QUARK_MASS / 10        # ≈ 17.31 (top quark)
-ELECTROWEAK_SCALED = ELECTROWEAK_SCALE / 10  # ≈ 24.6 (escala eletrofraca)
-
-# Grupo 3: Constantes Cosmológicas
-HUBBLE_SCALED = HUBBLE_CONSTANT * 1e18  # ≈ 2.27 (Hubble)
-CMB_SCALED = CMB_TEMPERATURE            # ≈ 2.73 (temperatura CMB)
-LAMBDA_SCALED = COSMIC_LAMBDA * 1e52    # ≈ 1.1 (constante cosmológica)
-CRITICAL_DENS_SCALED = CRITICAL_DENSITY * 1e27  # ≈ 9.47 (densidade crítica)
-
-# Grupo 4: Densidades Cosmológicas
-MATTER_SCALED = OMEGA_MATTER * 10       # ≈ 3.15 (fração matéria)
-DARK_ENERGY_SCALED = OMEGA_LAMBDA * 10  # ≈ 6.85 (energia escura)
-BARYON_SCALED = OMEGA_BARYON * 100      # ≈ 4.93 (matéria bariônica)
-RADIATION_SCALED = OMEGA_RADIATION * 1e5 # ≈ 9.2 (radiação)
-
-# Grupo 5: Relações Fundamentais
-PLANCK_MASS_SCALED = PLANCK_MASS_GEV / 1e19  # ≈ 1.22 (massa Planck)
-STRONG_WEAK_RATIO = ALPHA_STRONG / ALPHA  # ≈ 16.2 (razão forte/EM)
-HIGGS_PLANCK_RATIO = HIGGS_MASS / PLANCK_MASS_GEV * 1e19  # ≈ 1.02e-17 → normalizar
-COSMIC_TIME = 1 / HUBBLE_CONSTANT / (365.25 * 24 * 3600) / 1e9  # ≈ 14 Gyr → ≈ 14
-
-# Constante principal para análise
-NUCLEAR_COSMIC_CONSTANT = STRONG_SCALED  # Começando com força forte
-
-TOLERANCE_LEVELS = [1e-6, 1e-7, 1e-8, 1e-9, 1e-10, 1e-11]  # Tolerâncias relativas
 DEFAULT_TOLERANCE = 1e-8
 INCREMENT = 1000  # Batch size for processing
 
-# Constantes de controle para validação estatística
-CONTROL_CONSTANTS = {
-    # Grupo Forças Nucleares
-    'strong_force': STRONG_SCALED,           # ≈ 11.8
-    'weak_force': FERMI_SCALED,              # ≈ 1.17
-    'qcd_scale': QCD_SCALED,                 # ≈ 2.17
-    'weinberg_angle': WEINBERG_SCALED,       # ≈ 23.1
-    'strong_em_ratio': STRONG_WEAK_RATIO,    # ≈ 16.2
-    
-    # Grupo Modelo Padrão
-    'higgs_mass': HIGGS_SCALED,              # ≈ 12.51
-    'w_boson': W_MASS_SCALED,                # ≈ 8.04
-    'z_boson': Z_MASS_SCALED,                # ≈ 9.12
-    'top_quark': TOP_SCALED,                 # ≈ 17.31
-    'electroweak': ELECTROWEAK_SCALED,       # ≈ 24.6
-    
-    # Grupo Cosmologia
-    'hubble_const': HUBBLE_SCALED,           # ≈ 2.27
-    'cmb_temp': CMB_SCALED,                  # ≈ 2.73
-    'lambda_cosmo': LAMBDA_SCALED,           # ≈ 1.1
-    'critical_dens': CRITICAL_DENS_SCALED,   # ≈ 9.47
-    'cosmic_age': COSMIC_TIME,               # ≈ 14
-    
-    # Grupo Densidades
-    'dark_matter': MATTER_SCALED,            # ≈ 3.15
-    'dark_energy': DARK_ENERGY_SCALED,       # ≈ 6.85
-    'baryons': BARYON_SCALED,                # ≈ 4.93
-    'radiation': RADIATION_SCALED,           # ≈ 9.2
-    'planck_mass': PLANCK_MASS_SCALED,       # ≈ 1.22
-    
-    # Controles aleatórios
-    'random_1': 11.5,
-    'random_2': 2.5,
-    'random_3': 24.8,
-    'random_4': 14.2,
-}
-
 MAX_WORKERS = os.cpu_count()
 CACHE_FILE = "zeta_zeros_cache.pkl"
+STORE_FILE = store_path_for(CACHE_FILE)  # Store colunar preferido ao pickle
 STATS_FILE = "zvt_nuclear_cosmic_stats.txt"
+CHECKPOINT_FILE = checkpoint_path_for(STATS_FILE)  # Progresso da varredura para --resume
 RESULTS_DIR = "zvt_nuclear_cosmic_results"
 ZEROS_FILE = os.path.expanduser("~/Downloads/zero.txt")  # Path to the zeros file
 
@@ -163,21 +62,10 @@ def signal_handler(signum, frame):
     shutdown_requested = True
 
 def load_zeros_from_file(filename):
-    zeros = []
     try:
         print(f"📂 Carregando zeros do arquivo: {filename}")
-        with open(filename, 'r') as f:
-            for line_num, line in enumerate(f, start=1):
-                if shutdown_requested:
-                    break
-                line = line.strip()
-                if line:
-                    try:
-                        zero = float(line)
-                        zeros.append((line_num, zero))  # Format: (index, value)
-                    except ValueError:
-                        print(f"⚠️ Linha inválida {line_num}: '{line}'")
-                        continue
+        # Leitura única em blocos, progresso pelo offset em bytes
+        zeros = read_zero_file(filename, should_stop=lambda: shutdown_requested)
         print(f"✅ {len(zeros):,} zeros carregados")
         return zeros
     except Exception as e:
@@ -186,97 +74,48 @@ def load_zeros_from_file(filename):
 
 def save_enhanced_cache(zeros, backup=True):
     try:
-        if backup and os.path.exists(CACHE_FILE):
-            backup_file = f"{CACHE_FILE}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            os.rename(CACHE_FILE, backup_file)
+        if backup and os.path.exists(STORE_FILE):
+            backup_file = f"{STORE_FILE}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            os.rename(STORE_FILE, backup_file)
             print(f"📦 Backup do cache criado: {backup_file}")
-        with open(CACHE_FILE, 'wb') as f:
-            pickle.dump(zeros, f, protocol=pickle.HIGHEST_PROTOCOL)
+        indices, gammas = zeros_as_arrays(zeros)
+        write_zero_store(STORE_FILE, indices, gammas, getattr(zeros, 'source_bytes', 0))
         print(f"💾 Cache salvo: {len(zeros)} zeros")
     except Exception as e:
         print(f"❌ Erro ao salvar cache: {e}")
 
 def load_enhanced_cache():
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, 'rb') as f:
-                data = pickle.load(f)
-                if isinstance(data, list) and len(data) > 0:
-                    print(f"✅ Cache válido: {len(data):,} zeros carregados")
-                    return data
-        except:
-            print("⚠️ Cache inválido, carregando do arquivo...")
+    try:
+        data = load_zero_store(CACHE_FILE)
+    except Exception as e:
+        print(f"⚠️ Cache inválido ({e}), carregando do arquivo...")
+        data = None
+    if data is not None and len(data) > 0:
+        print(f"✅ Cache válido: {len(data):,} zeros mapeados")
+        return data
     zeros = load_zeros_from_file(ZEROS_FILE)
     if zeros:
         save_enhanced_cache(zeros)
         return zeros[:FRESH_START_ZEROS] if FRESH_START_ZEROS > 0 else zeros
     return []
 
-def find_multi_tolerance_resonances(zeros, constants_dict=None):
-    if constants_dict is None:
-        constants_dict = {'strong_force': NUCLEAR_COSMIC_CONSTANT}
-    all_results = {}
-    for const_name, const_value in constants_dict.items():
-        all_results[const_name] = {}
-        for tolerance in TOLERANCE_LEVELS:
-            resonances = []
-            for n, gamma in zeros:
-                mod_val = gamma % const_value
-                min_distance = min(mod_val, const_value - mod_val)
-                relative_error = min_distance / const_value  # Erro relativo
-                if relative_error < tolerance:
-                    resonances.append((n, gamma, min_distance, tolerance, relative_error))
-            all_results[const_name][tolerance] = resonances
-    return all_results
+# Ressonâncias do lote de todas as constantes da família, num único passe do motor unificado
+def find_multi_tolerance_resonances(zeros, engine):
+    indices, gammas = zeros_as_arrays(zeros)
+    return engine.process_block(indices, gammas, collect=True)[CONSTANT_FAMILY.name]
 
 def enhanced_statistical_analysis(zeros, resonances, constant_value, tolerance):
     if len(zeros) == 0 or len(resonances) == 0:
         return None
     total_zeros = len(zeros)
     resonant_count = len(resonances)
-    expected_random = total_zeros * (2 * tolerance)  # Tolerância relativa
-    results = {
-        'basic_stats': {
-            'total_zeros': total_zeros,
-            'resonant_count': resonant_count,
-            'expected_random': expected_random,
-            'resonance_rate': resonant_count / total_zeros,
-            'significance_factor': resonant_count / expected_random if expected_random > 0 else float('inf')
-        }
-    }
-    if expected_random >= 5:
-        chi2_stat = (resonant_count - expected_random)**2 / expected_random
-        chi2_pvalue = 1 - stats.chi2.cdf(chi2_stat, df=1)
-        results['chi2_test'] = {
-            'statistic': chi2_stat,
-            'p_value': chi2_pvalue,
-            'critical_value_05': 3.841,
-            'significant': chi2_stat > 3.841
-        }
-    p_expected = 2 * tolerance  # Tolerância já é relativa
-    try:
-        binom_result = stats.binomtest(resonant_count, total_zeros, p_expected, alternative='two-sided')
-        binom_pvalue = binom_result.pvalue
-    except AttributeError:
-        try:
-            binom_pvalue = stats.binom_test(resonant_count, total_zeros, p_expected, alternative='two-sided')
-        except AttributeError:
-            from scipy.stats import binom
-            binom_pvalue = 2 * min(binom.cdf(resonant_count, total_zeros, p_expected),
-                                  1 - binom.cdf(resonant_count - 1, total_zeros, p_expected))
-    results['binomial_test'] = {
-        'p_value': binom_pvalue,
-        'significant': binom_pvalue < 0.05
-    }
-    poisson_pvalue = 1 - stats.poisson.cdf(resonant_count - 1, expected_random)
-    results['poisson_test'] = {
-        'p_value': poisson_pvalue,
-        'significant': poisson_pvalue < 0.05
-    }
+    p_expected = 2 * tolerance  # Tolerância relativa
+    # Qui-quadrado, binomial e Poisson numa única chamada vetorizada
+    results = significance_record(batch_significance(resonant_count, total_zeros, p_expected), 0)
     return results
 
-def comparative_constant_analysis(zeros, tolerance=DEFAULT_TOLERANCE):
-    multi_results = find_multi_tolerance_resonances(zeros, CONTROL_CONSTANTS)
+def comparative_constant_analysis(zeros, family_results, tolerance=DEFAULT_TOLERANCE):
+    multi_results = {const_name: family_results[const_name] for const_name in CONTROL_CONSTANTS}
     comparative_stats = {}
     for const_name, const_results in multi_results.items():
         if tolerance in const_results:
@@ -291,11 +130,11 @@ def comparative_constant_analysis(zeros, tolerance=DEFAULT_TOLERANCE):
             }
     return comparative_stats
 
-def analyze_batch_enhanced(zeros, batch_num):
+def analyze_batch_enhanced(zeros, batch_num, family_results):
     print(f"\n🔬 LOTE #{batch_num}: {len(zeros):,} zeros")
     if len(zeros) < MINIMUM_FOR_STATS:
         print(f"   📊 Necessário {MINIMUM_FOR_STATS - len(zeros):,} mais zeros para estatísticas")
-        nuclear_results = find_multi_tolerance_resonances(zeros, {'strong_force': NUCLEAR_COSMIC_CONSTANT})['strong_force']
+        nuclear_results = family_results['strong_force']
         tolerance_summary = {}
         for tolerance in TOLERANCE_LEVELS[:3]:
             if tolerance in nuclear_results:
@@ -318,7 +157,7 @@ def analyze_batch_enhanced(zeros, batch_num):
                 print(f"| {tolerance:8.0e} | {data['count']:8d} | {data['rate']:8.3f} |")
         return tolerance_summary, {}, None
     
-    nuclear_results = find_multi_tolerance_resonances(zeros, {'strong_force': NUCLEAR_COSMIC_CONSTANT})['strong_force']
+    nuclear_results = family_results['strong_force']
     print(f"\n📊 RESSONÂNCIAS FORÇAS NUCLEARES & COSMOLOGIA POR TOLERÂNCIA (α_s×100 = {NUCLEAR_COSMIC_CONSTANT:.3f}):")
     print("| Tolerância | Contagem | Taxa (%) | Melhor Qualidade | Significância |")
     print("|------------|----------|----------|------------------|---------------|")
@@ -349,7 +188,7 @@ def analyze_batch_enhanced(zeros, batch_num):
                 print(f"| {tolerance:8.0e} | {count:8d} | {rate:8.3f} |      N/A     |     N/A    |")
     
     print(f"\n🎛️ COMPARAÇÃO FORÇAS NUCLEARES & COSMOLOGIA (Tolerância: {DEFAULT_TOLERANCE}):")
-    comparative_results = comparative_constant_analysis(zeros, DEFAULT_TOLERANCE)
+    comparative_results = comparative_constant_analysis(zeros, family_results, DEFAULT_TOLERANCE)
     print("| Constante         | Valor          | Contagem | Taxa (%) | Significância |")
     print("|-------------------|----------------|----------|----------|---------------|")
     for const_name, results in comparative_results.items():
@@ -384,10 +223,13 @@ def analyze_batch_enhanced(zeros, batch_num):
     
     return tolerance_summary, comparative_results, best_overall
 
-def generate_comprehensive_report(zeros, session_results, final_batch):
+def generate_comprehensive_report(zeros, session_results, final_batch, engine):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report_file = os.path.join(RESULTS_DIR, f"Relatorio_Nuclear_Cosmic_{timestamp}.txt")
-    final_tolerance_analysis, final_comparative, final_best = analyze_batch_enhanced(zeros, final_batch)
+    # Estado acumulado pelo motor durante a varredura: os zeros não são reprocessados
+    final_tolerance_analysis = session_tolerance_summary(engine, CONSTANT_FAMILY, 'strong_force')
+    final_comparative = session_comparison(engine, CONSTANT_FAMILY, CONTROL_CONSTANTS, DEFAULT_TOLERANCE)
+    final_best = session_best_resonance(engine, CONSTANT_FAMILY, 'strong_force', DEFAULT_TOLERANCE)
     
     with open(report_file, 'w', encoding='utf-8') as f:
         f.write("="*80 + "\n")
@@ -483,7 +325,7 @@ def infinite_hunter_nuclear_cosmic():
     print(f"🎯 Parâmetro Principal = {NUCLEAR_COSMIC_CONSTANT:.3f}")
     print(f"📁 Arquivo: {ZEROS_FILE}")
     print(f"📊 Tolerâncias: {TOLERANCE_LEVELS}")
-    print("🛑 Ctrl+C para parar")
+    print("🛑 Ctrl+C para parar (continue depois com --resume)")
     print("=" * 80)
     
     all_zeros = load_enhanced_cache()
@@ -493,11 +335,22 @@ def infinite_hunter_nuclear_cosmic():
         return [], [], None
     
     print(f"📊 Zeros disponíveis: {current_count:,}")
-    session_results = []
-    best_overall = None
-    batch_num = 1
+    # Retomar do último lote concluído de uma execução interrompida
+    checkpointer = BatchCheckpointer(CHECKPOINT_FILE, checkpoint_fingerprint(ZEROS_FILE, INCREMENT))
+    state = checkpointer.resume() if '--resume' in sys.argv[1:] else None
+    session_results = state['session_results'] if state else []
+    best_overall = state['best_overall'] if state else None
+    batch_num = state['batch_num'] if state else 1
+    # Motor unificado só com a família deste hunter; o estado acumulado alimenta o relatório final
+    engine = UnifiedResonanceEngine(load_constant_families([CONSTANT_FAMILY.name]))
+    if state and 'engine' in state:
+        engine.restore(state['engine'])
+    checkpoint_state = lambda: {'batch_num': batch_num,
+                                'next_zero': session_results[-1]['zeros_analyzed'] if session_results else 0,
+                                'best_overall': best_overall, 'session_results': session_results,
+                                'engine': engine.state()}
     
-    for i in range(0, current_count, INCREMENT):
+    for i in range(state['next_zero'] if state else 0, current_count, INCREMENT):
         if shutdown_requested:
             break
         batch_start = i
@@ -505,7 +358,8 @@ def infinite_hunter_nuclear_cosmic():
         batch = all_zeros[batch_start:batch_end]
         print(f"\n🔬 LOTE #{batch_num}: Zeros {batch_start:,} a {batch_end:,}")
         start_time = time.time()
-        tolerance_analysis, comparative_analysis, batch_best = analyze_batch_enhanced(batch, batch_num)
+        family_results = find_multi_tolerance_resonances(batch, engine)
+        tolerance_analysis, comparative_analysis, batch_best = analyze_batch_enhanced(batch, batch_num, family_results)
         if batch_best and (not best_overall or batch_best[4] < best_overall[4]):  # Comparar por erro relativo
             best_overall = batch_best
             print(f"    🎯 NOVO MELHOR GLOBAL NUCLEAR/CÓSMICO!")
@@ -520,9 +374,16 @@ def infinite_hunter_nuclear_cosmic():
             'best_resonance': batch_best
         })
         batch_num += 1
+        checkpointer.update(checkpoint_state())
+    
+    if shutdown_requested:
+        checkpointer.save(checkpoint_state())
+        print(f"💡 Continue com: python3 {sys.argv[0]} --resume")
+    else:
+        checkpointer.finish()  # Varredura completa: a próxima execução começa do início
     
     print(f"\n📊 Gerando relatório final Nuclear & Cósmico...")
-    generate_comprehensive_report(all_zeros, session_results, batch_num-1)
+    generate_comprehensive_report(all_zeros, session_results, batch_num-1, engine)
     return all_zeros, session_results, best_overall
 
 def main():
@@ -536,7 +397,7 @@ def main():
         if zeros and len(zeros) > 0:
             print(f"\n🎯 Análise Nuclear & Cósmica Concluída!")
             print(f"📁 Resultados em: {RESULTS_DIR}/")
-            print(f"💾 Cache: {CACHE_FILE}")
+            print(f"💾 Cache: {STORE_FILE}")
             print(f"📊 Estatísticas: {STATS_FILE}")
             
             if best:
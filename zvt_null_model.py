@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZVT_NULL_MODEL.py - Distribuição nula analítica da melhor ressonância
+Author: Jefferson M. Okushigue
+Date: 2025-08-12
+Sob a hipótese nula já usada em enhanced_statistical_analysis (resíduo dobrado
+uniforme em [0, c/2], p = 2·tol/c), a melhor qualidade sobre N zeros segue a lei
+da estatística de ordem mínima: P(melhor ≤ q) = 1 − (1 − 2q/c)^N. Este módulo dá
+os p-values exatos e assintóticos, a correção de look-elsewhere sobre as
+constantes testadas e a nula fechada do Monte Carlo de montecarlo.py
+(constantes log-uniformes), para validar o MC em vez de rodá-lo sempre.
+"""
+
+import numpy as np
+from scipy import special, stats
+
+EULER_GAMMA = np.euler_gamma
+LN10 = np.log(10.0)
+
+
+def residual_probability(quality, constant_value):
+    """P(resíduo dobrado ≤ q) para um zero: 2q/c, limitado a 1"""
+    return np.minimum(1.0, 2.0 * np.asarray(quality, dtype=np.float64) / constant_value)
+
+
+def best_quality_p_value(quality, constant_value, n_zeros, exact=True):
+    """P(melhor qualidade sobre n_zeros ≤ q) para uma constante c
+
+    exact=True usa 1 − (1 − p)^N (via log1p/expm1, estável para p minúsculo);
+    exact=False usa a forma assintótica de Poisson 1 − exp(−N·p).
+    """
+    p = residual_probability(quality, constant_value)
+    if exact:
+        with np.errstate(divide='ignore'):
+            return -np.expm1(n_zeros * np.log1p(-p))
+    return -np.expm1(-n_zeros * p)
+
+
+def best_error_p_value(error_percent, n_zeros, n_constants=1):
+    """P(menor erro relativo ≤ e% entre n_constants constantes); não depende de c"""
+    p = np.minimum(1.0, 2.0 * np.asarray(error_percent, dtype=np.float64) / 100)
+    with np.errstate(divide='ignore'):
+        return -np.expm1(n_zeros * n_constants * np.log1p(-p))
+
+
+def look_elsewhere(p_values, n_tests, method='sidak'):
+    """P-value global após n_tests buscas independentes (ex.: as constantes testadas)
+
+    'sidak': 1 − (1 − p)^K (exato para testes independentes); 'bonferroni': min(1, K·p).
+    """
+    p = np.asarray(p_values, dtype=np.float64)
+    if method == 'bonferroni':
+        return np.minimum(1.0, n_tests * p)
+    with np.errstate(divide='ignore'):
+        return -np.expm1(n_tests * np.log1p(-np.minimum(p, 1.0)))
+
+
+def _ein(z):
+    """Ein(z) = ∫₀^z (1 − e^−t)/t dt = E1(z) + ln z + γ (Ein(0) = 0)"""
+    z = np.asarray(z, dtype=np.float64)
+    out = np.zeros_like(z)
+    small = (z > 0) & (z < 1e-8)
+    out[small] = z[small]  # Série: Ein(z) ≈ z − z²/4
+    large = z >= 1e-8
+    out[large] = special.exp1(z[large]) + np.log(z[large]) + EULER_GAMMA
+    return out
+
+
+def log_uniform_quality_cdf(quality, n_zeros, log_min, log_max):
+    """P(melhor qualidade ≤ q) para c log-uniforme em [10^log_min, 10^log_max]
+
+    Integra 1 − exp(−N·2q/c) em u = log10 c: para c ≤ 2q a probabilidade é 1, e o
+    resto vale [Ein(N·x(u₁)) − Ein(N·x(log_max))]/ln 10, com x(u) = 2q·10^−u.
+    """
+    q = np.asarray(quality, dtype=np.float64)
+    with np.errstate(divide='ignore'):
+        u_switch = np.clip(np.log10(2 * q), log_min, log_max)
+    x_switch = np.minimum(1.0, 2 * q * 10.0 ** -u_switch)
+    x_end = 2 * q * 10.0 ** -log_max
+    covered = (u_switch - log_min) + (_ein(n_zeros * x_switch) - _ein(n_zeros * x_end)) / LN10
+    return np.clip(covered / (log_max - log_min), 0.0, 1.0)
+
+
+def monte_carlo_quality_cdf(quality, n_zeros, n_constants, log_min, log_max):
+    """Nula fechada do Monte Carlo: melhor qualidade entre n_constants constantes log-uniformes"""
+    single = log_uniform_quality_cdf(quality, n_zeros, log_min, log_max)
+    return -np.expm1(n_constants * np.log1p(-np.minimum(single, 1.0)))
+
+
+def cross_validate(mc_qualities, mc_errors, n_zeros, n_constants, log_min, log_max):
+    """KS das distribuições do Monte Carlo contra as nulas analíticas
+
+    Devolve {'quality': (D, p), 'error': (D, p)}; p alto indica que o MC e a
+    fórmula fechada descrevem a mesma distribuição. A amostra deve vir de
+    constantes avaliadas sobre os zeros, nunca sorteadas da própria nula: com
+    n_constants=1 e log_min no limite de resolução, cada constante avaliada é
+    uma amostra da nula de uma constante log-uniforme nessa faixa.
+    """
+    quality_cdf = lambda q: monte_carlo_quality_cdf(q, n_zeros, n_constants, log_min, log_max)
+    error_cdf = lambda e: best_error_p_value(e, n_zeros, n_constants)
+    quality_ks = stats.kstest(np.asarray(mc_qualities), quality_cdf)
+    error_ks = stats.kstest(np.asarray(mc_errors), error_cdf)
+    return {
+        'quality': (float(quality_ks.statistic), float(quality_ks.pvalue)),
+        'error': (float(error_ks.statistic), float(error_ks.pvalue))
+    }
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZVT_PRECISION.py - Confirmação em alta precisão (mpmath) das ressonâncias ZVT
+Author: Jefferson M. Okushigue
+Date: 2025-08-12
+O kernel float64 erra o resíduo em até ~γ·2⁻⁵² (≈1e-10 em γ≈1e6), a mesma escala
+das tolerâncias mais finas. O float64 vira um pré-filtro com margem de segurança:
+só os zeros na faixa de incerteza de cada tolerância e os poucos melhores
+candidatos são recalculados com mpmath a 50 dígitos, com memória por (índice do
+zero, constante).
+"""
+
+import math
+import numpy as np
+from mpmath import mp
+from zvt_kernels import folded_residuals, is_resolved, resonances_from_residuals
+
+MP_DIGITS = 50  # Dígitos mínimos da confirmação (mais os dígitos do quociente γ/c)
+PREFILTER_SAFETY = 4.0  # Margem em ulps de γ: arredondamento de γ e de c mais o fold
+CONFIRM_BEST = 16  # Melhores candidatos de cada constante sempre confirmados (qualidade reportada)
+PARALLEL_THRESHOLD = 2048  # Candidatos a partir dos quais a confirmação usa processos
+MAX_MEMO_ENTRIES = 1_000_000
+
+_residual_memo = {}  # (índice do zero, constante) → resíduo dobrado confirmado
+
+
+def float64_margin(gammas):
+    """Erro máximo do resíduo float64 de cada zero (em unidades de γ)"""
+    return PREFILTER_SAFETY * np.spacing(np.abs(gammas))
+
+
+def mp_folded_residual(gamma, constant_value):
+    """Resíduo dobrado em mpmath; repr() recupera o decimal do arquivo/literal original"""
+    quotient_digits = max(0, int(math.ceil(math.log10(abs(float(gamma)) / float(constant_value) + 1))))
+    with mp.workdps(MP_DIGITS + quotient_digits):
+        g = mp.mpf(repr(float(gamma)))
+        c = mp.mpf(repr(float(constant_value)))
+        mod_val = mp.fmod(g, c)
+        if mod_val < 0:
+            mod_val += c
+        return float(min(mod_val, c - mod_val))
+
+
+def _mp_residual_chunk(args):
+    """Worker: resíduos mpmath de um bloco de gammas"""
+    gammas, constant_value = args
+    return [mp_folded_residual(gamma, constant_value) for gamma in gammas]
+
+
+def confirm_residuals(indices, gammas, constant_value, executor=None, workers=1):
+    """Resíduos em alta precisão para os candidatos, reaproveitando a memória
+
+    Com executor, os blocos são divididos entre workers processos (o tamanho do
+    pool é informado pelo chamador).
+    """
+    keys = [(int(n), float(constant_value)) for n in indices]
+    missing = [i for i, key in enumerate(keys) if key not in _residual_memo]
+    if missing:
+        pending = [float(gammas[i]) for i in missing]
+        if executor is not None and len(pending) >= PARALLEL_THRESHOLD:
+            chunk = max(1, len(pending) // (4 * max(1, workers)))
+            tasks = [(pending[i:i + chunk], constant_value) for i in range(0, len(pending), chunk)]
+            computed = [value for part in executor.map(_mp_residual_chunk, tasks) for value in part]
+        else:
+            computed = _mp_residual_chunk((pending, constant_value))
+        if len(_residual_memo) + len(computed) > MAX_MEMO_ENTRIES:
+            _residual_memo.clear()
+        for i, value in zip(missing, computed):
+            _residual_memo[keys[i]] = value
+    return np.array([_residual_memo[key] for key in keys], dtype=np.float64)
+
+
+def uncertain_positions(residuals, margin, constant_value, tolerances, relative=False, n_best=CONFIRM_BEST):
+    """Zeros cuja classificação ou qualidade não é garantida pelo float64
+
+    A faixa |resíduo − tol| < margem de cada tolerância decide quem entra em cada
+    nível; além dela, só os n_best menores resíduos (e os empatados com o melhor
+    dentro da margem) têm a qualidade confirmada. Zeros bem abaixo da tolerância
+    ficam com o valor float64.
+    """
+    scale = constant_value if relative else 1.0
+    compared = residuals / scale
+    margin = margin / scale
+    uncertain = np.zeros(len(residuals), dtype=bool)
+    for tolerance in tolerances:
+        uncertain |= np.abs(compared - tolerance) < margin
+    if len(compared) > 0 and n_best > 0:
+        best = np.argpartition(compared, min(n_best, len(compared)) - 1)[:n_best]
+        uncertain[best] = True
+        uncertain |= compared <= compared[best].min() + margin
+    return np.flatnonzero(uncertain)
+
+
+def confirm_uncertain(indices, gammas, residuals, constant_value, tolerances, relative=False, margin=None,
+                      executor=None, workers=1):
+    """Resíduos float64 com os zeros incertos substituídos pelo valor mpmath
+
+    Constantes não resolvidas pelos decimais dos gammas (resíduos NaN) não são
+    confirmadas: o mpmath só reproduziria o artefato da grade decimal.
+    """
+    if not is_resolved(gammas, constant_value):
+        return residuals
+    if margin is None:
+        margin = float64_margin(gammas)
+    positions = uncertain_positions(residuals, margin, constant_value, tolerances, relative)
+    if len(positions) == 0:
+        return residuals
+    residuals = residuals.copy()
+    residuals[positions] = confirm_residuals(indices[positions], gammas[positions], constant_value,
+                                             executor, workers)
+    return residuals
+
+
+def precise_multi_tolerance_resonances(indices, gammas, constant_value, tolerances, relative=False,
+                                       executor=None, workers=1):
+    """multi_tolerance_resonances com pré-filtro float64 e confirmação mpmath dos incertos"""
+    residuals = confirm_uncertain(indices, gammas, folded_residuals(gammas, constant_value),
+                                  constant_value, tolerances, relative, executor=executor, workers=workers)
+    return resonances_from_residuals(indices, gammas, residuals, constant_value, tolerances, relative)
+
+
+def precise_best_position(indices, gammas, residuals, constant_value):
+    """(posição, qualidade) do melhor zero, confirmando em mpmath os empatados dentro da margem
+
+    (None, NaN) se nenhum resíduo é finito (constante não resolvida).
+    """
+    if len(residuals) == 0:
+        return None, np.inf
+    if not np.isfinite(residuals).any():
+        return None, np.nan
+    best = float(np.min(residuals))
+    near = np.flatnonzero(residuals <= best + np.max(float64_margin(gammas)))
+    confirmed = confirm_residuals(indices[near], gammas[near], constant_value)
+    choice = int(np.argmin(confirmed))  # Empates mantêm o primeiro zero
+    return int(near[choice]), float(confirmed[choice])
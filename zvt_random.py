@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZVT_RANDOM.py - Streams aleatórios independentes e reprodutíveis para as simulações ZVT
+Author: Jefferson M. Okushigue
+Date: 2025-08-12
+Uma SeedSequence raiz gera, por spawn_key, um filho para cada bloco de tarefas;
+cada bloco tem seu próprio Generator, de modo que workers criados por fork nunca
+herdam o estado global do np.random nem repetem simulações. Com a entropia raiz
+gravada no relatório, qualquer simulação é refeita a partir de (entropia, id).
+"""
+
+import sys
+import numpy as np
+
+
+def root_seed_sequence(seed=None):
+    """SeedSequence raiz da execução (entropia do sistema se seed for None)"""
+    return np.random.SeedSequence(seed)
+
+
+def stream_seed_sequence(entropy, *key):
+    """Filho da raiz identificado por key; igual a SeedSequence(entropy).spawn(n)[key[0]] para um índice"""
+    return np.random.SeedSequence(entropy, spawn_key=tuple(int(k) for k in key))
+
+
+def stream_generator(entropy, *key):
+    """Generator dedicado a um bloco de tarefas"""
+    return np.random.default_rng(stream_seed_sequence(entropy, *key))
+
+
+def simulation_blocks(n_simulations, block_size):
+    """(índice do bloco, primeiro id, tamanho) de cada bloco de simulações"""
+    return [(block_index, start, min(block_size, n_simulations - start))
+            for block_index, start in enumerate(range(0, n_simulations, block_size))]
+
+
+def locate_simulation(simulation_id, block_size):
+    """(índice do bloco, linha dentro do bloco) de uma simulação"""
+    return divmod(int(simulation_id), block_size)
+
+
+def int_option(flag, argv=None):
+    """Valor inteiro de uma opção 'flag N' na linha de comando, ou None"""
+    argv = sys.argv[1:] if argv is None else argv
+    if flag in argv and argv.index(flag) + 1 < len(argv):
+        return int(argv[argv.index(flag) + 1])
+    return None
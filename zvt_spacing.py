@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZVT_SPACING.py - Distribuição de espaçamentos entre vizinhos contra o GUE
+Author: Jefferson M. Okushigue
+Date: 2025-08-12
+Percorre os zeros desdobrados (x = N̄(γ), espaçamento médio 1) em blocos e
+acumula, por janela de altura, um histograma de bins fixos e os momentos dos
+gaps s = x_{i+1} − x_i. A memória é O(janelas × bins), independente do número
+de zeros, então o mesmo acumulador lê o store ou o arquivo texto original. As
+distâncias KS/χ² são contra a distribuição exata de Gaudin (GUE, β = 2), obtida
+do determinante de Fredholm do núcleo seno; a conjectura de Wigner e a
+exponencial (Poisson) entram como referências.
+"""
+
+import os
+import sys
+import numpy as np
+from scipy import stats
+from scipy.interpolate import CubicSpline
+from zvt_pair_correlation import smooth_zero_count, iter_unfolded_chunks, PAIR_CHUNK
+from zvt_statistics import CHI2_MIN_EXPECTED
+from zvt_zero_store import load_zero_store, iter_zero_file_chunks
+
+SPACING_MAX = 4.0        # Último bin regular; gaps maiores vão para o bin de estouro
+SPACING_BIN_WIDTH = 0.01
+# Janelas de altura em γ: meias décadas de 10² a 10⁷, mais as pontas abertas
+SPACING_WINDOW_EDGES = np.concatenate([[0.0], np.logspace(2, 7, 11), [np.inf]])
+
+GAUDIN_NODES = 30        # Nós de Gauss–Legendre do determinante (precisão de máquina até s = 4)
+GAUDIN_STEP = 0.001      # Passo da tabela de E(s)
+GUE_SPACING_VARIANCE = 0.17999  # Variância da distribuição de Gaudin (média 1)
+
+_gaudin_table = None
+
+
+def gaudin_gap_probability(s, nodes=GAUDIN_NODES):
+    """E(s) = det(I − K_s): probabilidade de nenhum autovalor num intervalo de comprimento s
+
+    Quadratura de Bornemann (2010) do núcleo seno sin π(x−y)/π(x−y) em [0, s],
+    vetorizada sobre s com um determinante em lote.
+    """
+    s = np.atleast_1d(np.asarray(s, dtype=np.float64))
+    points, weights = np.polynomial.legendre.leggauss(nodes)
+    x = (points[None, :] + 1) / 2 * s[:, None]
+    root_w = np.sqrt(weights[None, :] / 2 * s[:, None])
+    kernel = np.sinc(x[:, :, None] - x[:, None, :]) * root_w[:, :, None] * root_w[:, None, :]
+    return np.linalg.det(np.eye(nodes)[None, :, :] - kernel)
+
+
+def gaudin_cdf(s):
+    """F(s) = 1 + E'(s), a CDF do espaçamento entre vizinhos do GUE (p(s) = E''(s))"""
+    global _gaudin_table
+    if _gaudin_table is None:
+        grid = np.arange(0.0, SPACING_MAX + 1.0 + GAUDIN_STEP / 2, GAUDIN_STEP)
+        _gaudin_table = (grid[-1], CubicSpline(grid, gaudin_gap_probability(grid)).derivative())
+    s_max, derivative = _gaudin_table
+    s = np.asarray(s, dtype=np.float64)
+    return np.where(s >= s_max, 1.0, np.clip(1.0 + derivative(np.clip(s, 0.0, s_max)), 0.0, 1.0))
+
+
+def wigner_cdf(s):
+    """CDF da conjectura de Wigner para o GUE, p(s) = (32/π²)s²·exp(−4s²/π)"""
+    s = np.maximum(np.asarray(s, dtype=np.float64), 0.0)
+    a = 2 * s / np.sqrt(np.pi)
+    return stats.gamma.cdf(a ** 2, 1.5)  # ∫ p = P(3/2, 4s²/π)
+
+
+def poisson_cdf(s):
+    """Espaçamentos de níveis sem correlação: exponencial de média 1"""
+    return -np.expm1(-np.maximum(np.asarray(s, dtype=np.float64), 0.0))
+
+
+class SpacingAccumulator:
+    """Histogramas e momentos dos gaps desdobrados por janela de altura, em memória fixa
+
+    O gap (γ_i, γ_{i+1}) entra na janela de γ_i; o último zero de cada bloco é
+    guardado para fechar o gap com o primeiro zero do bloco seguinte.
+    """
+
+    def __init__(self, window_edges=SPACING_WINDOW_EDGES, bin_width=SPACING_BIN_WIDTH, s_max=SPACING_MAX):
+        self.window_edges = np.asarray(window_edges, dtype=np.float64)
+        self.n_windows = len(self.window_edges) - 1
+        self.n_bins = int(round(s_max / bin_width))
+        self.edges = np.arange(self.n_bins + 1) * bin_width
+        # Último bin de cada janela: estouro s ≥ s_max
+        self.counts = np.zeros((self.n_windows, self.n_bins + 1), dtype=np.int64)
+        self.sums = np.zeros((self.n_windows, 3))  # Σs, Σs², Σs³ por janela
+        self.last = None  # (γ, x) do último zero visto
+
+    def update(self, gammas, unfolded=None):
+        """Incorpora um bloco ordenado de zeros (x desdobrados calculados se omitidos)"""
+        gammas = np.asarray(gammas, dtype=np.float64)
+        if len(gammas) == 0:
+            return
+        x = smooth_zero_count(gammas) if unfolded is None else unfolded
+        if self.last is not None:
+            gammas = np.concatenate([[self.last[0]], gammas])
+            x = np.concatenate([[self.last[1]], x])
+        self.last = (gammas[-1], x[-1])
+        if len(x) < 2:
+            return
+        gaps = np.diff(x)
+        windows = np.searchsorted(self.window_edges, gammas[:-1], side='right') - 1
+        inside = (windows >= 0) & (windows < self.n_windows)
+        windows, gaps = windows[inside], gaps[inside]
+        bins = np.minimum((gaps / (self.edges[1] - self.edges[0])).astype(np.int64), self.n_bins)
+        self.counts += np.bincount(windows * (self.n_bins + 1) + bins,
+                                   minlength=self.counts.size).reshape(self.counts.shape)
+        for power in range(3):
+            self.sums[:, power] += np.bincount(windows, weights=gaps ** (power + 1), minlength=self.n_windows)
+
+    def summary(self, counts, sums):
+        """Momentos e distâncias KS/χ² de um histograma contra Gaudin, Wigner e Poisson
+
+        O KS é avaliado nas bordas dos bins (erro ≤ uma largura de bin na CDF
+        empírica) e, como gaps vizinhos são correlacionados, os p-values são
+        indicativos e não testes exatos.
+        """
+        n = int(counts.sum())
+        result = {'n_gaps': n, 'counts': counts, 'edges': self.edges}
+        if n < 2:
+            return result
+        mean = sums[0] / n
+        variance = max(sums[1] / n - mean ** 2, 0.0)
+        skewness = (sums[2] / n - 3 * mean * variance - mean ** 3) / variance ** 1.5 if variance > 0 else 0.0
+        empirical = np.cumsum(counts[:-1]) / n  # F̂ na borda direita de cada bin regular
+
+        gaudin_edges = gaudin_cdf(self.edges)
+        expected = n * np.append(np.diff(gaudin_edges), 1.0 - gaudin_edges[-1])
+        valid = expected >= CHI2_MIN_EXPECTED
+        chi2 = float(np.sum((counts[valid] - expected[valid]) ** 2 / expected[valid]))
+        dof = max(int(np.count_nonzero(valid)) - 1, 1)
+
+        ks = {}
+        for name, cdf in (('gaudin', gaudin_cdf), ('wigner', wigner_cdf), ('poisson', poisson_cdf)):
+            distance = float(np.max(np.abs(empirical - cdf(self.edges[1:]))))
+            ks[name] = (distance, float(stats.kstwobign.sf(distance * np.sqrt(n))))
+
+        result.update({
+            'mean': float(mean),
+            'variance': float(variance),
+            'skewness': float(skewness),
+            'overflow': int(counts[-1]),
+            'ks': ks,
+            'chi2': chi2,
+            'dof': dof,
+            'chi2_p_value': float(stats.chi2.sf(chi2, dof))
+        })
+        return result
+
+    def results(self):
+        """{'all': resumo global, 'windows': [resumo por janela com gaps]}"""
+        windows = []
+        for w in range(self.n_windows):
+            if self.counts[w].sum() == 0:
+                continue
+            summary = self.summary(self.counts[w], self.sums[w])
+            summary['low'], summary['high'] = self.window_edges[w], self.window_edges[w + 1]
+            windows.append(summary)
+        overall = self.summary(self.counts.sum(axis=0), self.sums.sum(axis=0))
+        overall['low'], overall['high'] = self.window_edges[0], self.window_edges[-1]
+        return {'all': overall, 'windows': windows}
+
+
+def spacing_statistics(gammas, window_edges=SPACING_WINDOW_EDGES, chunk=PAIR_CHUNK):
+    """Estatística de espaçamentos de um array ordenado de gammas (ou store mapeado)"""
+    accumulator = SpacingAccumulator(window_edges)
+    for block_gammas, block_x in iter_unfolded_chunks(gammas, chunk):
+        accumulator.update(block_gammas, block_x)
+    return accumulator.results()
+
+
+def spacing_statistics_from_file(filename, window_edges=SPACING_WINDOW_EDGES):
+    """Mesma estatística lida direto do arquivo texto, sem carregar os zeros"""
+    accumulator = SpacingAccumulator(window_edges)
+    for _, gammas, _, _ in iter_zero_file_chunks(filename):
+        accumulator.update(gammas)
+    return accumulator.results()
+
+
+def print_spacing_summary(results):
+    """Tabela resumida por janela de altura"""
+    print(f"{'Janela γ':>22} {'Gaps':>10} {'Média':>7} {'Var':>7} {'KS Gaudin':>10} {'KS Wigner':>10} {'KS Poisson':>11}")
+    for summary in results['windows'] + [dict(results['all'], low=None)]:
+        if summary['n_gaps'] < 2:
+            continue
+        label = "todas" if summary['low'] is None else f"{summary['low']:.1e}-{summary['high']:.1e}"
+        ks = summary['ks']
+        print(f"{label:>22} {summary['n_gaps']:>10,} {summary['mean']:>7.4f} {summary['variance']:>7.4f} "
+              f"{ks['gaudin'][0]:>10.5f} {ks['wigner'][0]:>10.5f} {ks['poisson'][0]:>11.5f}")
+    print(f"(variância GUE esperada: {GUE_SPACING_VARIANCE:.4f})")
+
+
+def main():
+    """Uso: python3 zvt_spacing.py [arquivo de zeros .txt | cache .pkl]"""
+    source = sys.argv[1] if len(sys.argv) > 1 else "zeta_zeros_cache.pkl"
+    if source.endswith('.txt') and os.path.exists(source):
+        print(f"📂 Lendo {source} em blocos...")
+        results = spacing_statistics_from_file(source)
+    else:
+        zeros = load_zero_store(source)
+        if zeros is None:
+            print(f"❌ Zeros não encontrados: {source}")
+            return
+        print(f"📂 {len(zeros):,} zeros do store colunar")
+        results = spacing_statistics(zeros.gammas)
+    print_spacing_summary(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZVT_SPECTRUM.py - Espectro de ressonância: varredura contínua de constantes candidatas
+Author: Jefferson M. Okushigue
+Date: 2025-08-12
+Em vez de testar uma lista fixa de constantes, avalia S(c) = Σ exp(2πiγ/c) sobre
+todos os zeros numa grade densa de frequências f = 1/c, via NUFFT tipo 1
+(espalhamento gaussiano + FFT, ou finufft quando instalado). O custo é
+O(N·w + M log M) em vez de O(N·M), e as constantes físicas de todas as famílias
+são comparadas com suas vizinhas no espaço de c.
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+import numpy as np
+import matplotlib.pyplot as plt
+from zvt_zero_store import load_zero_store
+from zvt_engine import load_constant_families
+
+try:
+    import finufft
+    FINUFFT_AVAILABLE = True
+except ImportError:
+    FINUFFT_AVAILABLE = False
+
+CACHE_FILE = "zeta_zeros_cache.pkl"
+RESULTS_DIR = "zvt_spectrum_results"
+
+# Faixa padrão de constantes candidatas e resolução da grade
+SPECTRUM_C_MIN = 0.5
+SPECTRUM_C_MAX = 20.0
+SPECTRUM_OVERSAMPLING = 2  # Pontos da grade por largura de pico (1/γ_max em frequência)
+MAX_SPECTRUM_POINTS = 1 << 23
+SPECTRUM_BLOCK = 262144  # Zeros espalhados por vez na grade
+
+# NUFFT por espalhamento gaussiano (Greengard & Lee 2004): erro relativo ~1e-12
+NUFFT_UPSAMPLING = 2
+NUFFT_SPREAD = 12
+NUFFT_EPS = 1e-12
+
+NEIGHBOUR_WINDOW = 0.05  # Vizinhança de ±5% em c para comparar cada constante física
+TOP_PEAKS = 20
+LANDAU_MAX_PRIME = 1000  # Picos conhecidos em c = 2π/(k·log p) (fórmula de Landau)
+
+
+class ResonanceSpectrum:
+    """S(f) = Σ exp(2πiγf) numa grade uniforme f_k = f_lo + kΔf, acumulado por blocos
+
+    S é linear nos zeros: cada bloco é espalhado na mesma grade sobreamostrada e
+    uma única FFT no final dá o espectro completo, com memória independente de N.
+    """
+
+    def __init__(self, c_min, c_max, n_points):
+        self.f_lo = 1.0 / c_max
+        self.f_hi = 1.0 / c_min
+        self.n_points = int(n_points) + int(n_points) % 2  # M par: modos −M/2 .. M/2−1
+        self.delta_f = (self.f_hi - self.f_lo) / (self.n_points - 1)
+        self.f_mid = self.f_lo + (self.n_points // 2) * self.delta_f
+        self.grid_size = NUFFT_UPSAMPLING * self.n_points
+        self.tau = np.pi * NUFFT_SPREAD / (self.n_points ** 2 * NUFFT_UPSAMPLING * (NUFFT_UPSAMPLING - 0.5))
+        self.grid = np.zeros(self.grid_size, dtype=np.complex128)
+        self.finufft_modes = np.zeros(self.n_points, dtype=np.complex128) if FINUFFT_AVAILABLE else None
+        self.zero_count = 0
+
+    @property
+    def frequencies(self):
+        return self.f_lo + np.arange(self.n_points) * self.delta_f
+
+    @property
+    def constants(self):
+        return 1.0 / self.frequencies
+
+    def add(self, gammas):
+        """Incorpora um bloco de zeros ao espectro"""
+        if len(gammas) == 0:
+            return
+        # exp(2πiγf_k) = exp(2πiγf_mid) · exp(i·k'·x), com x = 2πΔfγ mod 2π e k' = k − M/2
+        weights = np.exp(2j * np.pi * np.mod(gammas * self.f_mid, 1.0))
+        x = 2 * np.pi * np.mod(gammas * self.delta_f, 1.0)
+        if self.finufft_modes is not None:
+            self.finufft_modes += finufft.nufft1d1(x, weights, self.n_points, isign=1, eps=NUFFT_EPS)
+        else:
+            self._spread(x, weights)
+        self.zero_count += len(gammas)
+
+    def _spread(self, x, weights):
+        """Espalha Σ w_j δ(x − x_j) com o núcleo gaussiano na grade sobreamostrada"""
+        h = 2 * np.pi / self.grid_size
+        offsets = np.arange(-NUFFT_SPREAD + 1, NUFFT_SPREAD + 1)
+        for start in range(0, len(x), SPECTRUM_BLOCK // NUFFT_SPREAD):
+            xs = x[start:start + SPECTRUM_BLOCK // NUFFT_SPREAD]
+            base = np.floor(xs / h).astype(np.int64)
+            distance = (xs - base * h)[:, None] - offsets[None, :] * h
+            kernel = np.exp(-distance ** 2 / (4 * self.tau))
+            cells = np.mod(base[:, None] + offsets[None, :], self.grid_size).ravel()
+            values = (kernel * weights[start:start + len(xs), None]).ravel()
+            self.grid += np.bincount(cells, weights=values.real, minlength=self.grid_size)
+            self.grid += 1j * np.bincount(cells, weights=values.imag, minlength=self.grid_size)
+
+    def sums(self):
+        """S(f_k) para toda a grade (uma FFT sobre a grade acumulada)"""
+        if self.finufft_modes is not None:
+            return self.finufft_modes.copy()
+        modes = np.arange(-(self.n_points // 2), self.n_points // 2)
+        transformed = np.fft.ifft(self.grid)[np.mod(modes, self.grid_size)]
+        # ifft já divide pelo tamanho da grade; desfaz a convolução gaussiana
+        return transformed * np.sqrt(np.pi / self.tau) * np.exp(modes ** 2 * self.tau)
+
+    def power(self):
+        """|S|²/N: ≈ 1 (exponencial) para fases aleatórias, grande onde γ mod c se concentra"""
+        return np.abs(self.sums()) ** 2 / max(self.zero_count, 1)
+
+
+def direct_sum(gammas, constant_value):
+    """S(1/c) por soma direta, para conferir constantes individuais"""
+    return np.sum(np.exp(2j * np.pi * np.mod(gammas, constant_value) / constant_value))
+
+
+def spectrum_points_for(c_min, c_max, gamma_max):
+    """Pontos de grade para resolver picos de largura 1/γ_max em frequência"""
+    needed = int(np.ceil((1.0 / c_min - 1.0 / c_max) * gamma_max * SPECTRUM_OVERSAMPLING)) + 1
+    return min(needed, MAX_SPECTRUM_POINTS)
+
+
+def landau_label(constant_value, tolerance):
+    """'k·log p' se c ≈ 2π/(k·log p): estrutura conhecida dos zeros, não ressonância nova"""
+    target = 2 * np.pi / constant_value
+    sieve = np.ones(LANDAU_MAX_PRIME + 1, dtype=bool)
+    sieve[:2] = False
+    for p in range(2, int(LANDAU_MAX_PRIME ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = False
+    for p in np.flatnonzero(sieve):
+        k = int(round(target / np.log(p)))
+        if k >= 1 and abs(2 * np.pi / (k * np.log(p)) - constant_value) <= tolerance:
+            return f"{k}·log {p}" if k > 1 else f"log {p}"
+    return ""
+
+
+def neighbour_comparison(spectrum_c, spectrum_power, constant_value, power):
+    """(percentil, z-score robusto) da potência de uma constante entre suas vizinhas em c"""
+    window = (spectrum_c > constant_value * (1 - NEIGHBOUR_WINDOW)) & \
+             (spectrum_c < constant_value * (1 + NEIGHBOUR_WINDOW))
+    neighbours = spectrum_power[window]
+    if len(neighbours) == 0:
+        return None, None
+    percentile = float(np.mean(neighbours < power) * 100)
+    median = np.median(neighbours)
+    mad = np.median(np.abs(neighbours - median)) * 1.4826
+    return percentile, float((power - median) / mad) if mad > 0 else None
+
+
+def physical_constants_in_range(c_min, c_max):
+    """Constantes de todas as famílias dos hunters dentro da faixa do espectro"""
+    constants = {}
+    for family in load_constant_families():
+        for const_name, const_value in family.constants.items():
+            if c_min <= const_value <= c_max:
+                constants[f"{family.name}/{const_name}"] = const_value
+    return constants
+
+
+def generate_spectrum_report(spectrum, spectrum_power, constants_rows, gamma_max):
+    """Relatório texto + gráfico do espectro com as constantes físicas marcadas"""
+    if not os.path.exists(RESULTS_DIR):
+        os.makedirs(RESULTS_DIR)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    report_file = os.path.join(RESULTS_DIR, f"Espectro_Ressonancia_{timestamp}.txt")
+    spectrum_c = spectrum.constants
+    peak_width = 1.0 / gamma_max
+
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write("=" * 80 + "\n")
+        f.write("ZVT ESPECTRO DE RESSONÂNCIA\n")
+        f.write("=" * 80 + "\n\n")
+        f.write(f"Data: {datetime.now().isoformat()}\n")
+        f.write(f"Zeros: {spectrum.zero_count:,} (γ_max = {gamma_max:,.3f})\n")
+        f.write(f"Faixa: c ∈ [{spectrum_c[-1]:.6f}, {spectrum_c[0]:.6f}] | {spectrum.n_points:,} pontos\n")
+        f.write(f"Estatística: |Σ exp(2πiγ/c)|²/N (≈ 1 para fases aleatórias; p ≈ exp(−potência))\n")
+        f.write(f"Potência média: {np.mean(spectrum_power):.4f} | máxima: {np.max(spectrum_power):.2f}\n\n")
+
+        f.write(f"TOP {TOP_PEAKS} PICOS DO ESPECTRO:\n")
+        f.write("| Constante c     | Potência     | Estrutura conhecida |\n")
+        f.write("|-----------------|--------------|---------------------|\n")
+        for k in np.argsort(spectrum_power)[::-1][:TOP_PEAKS]:
+            c = spectrum_c[k]
+            label = landau_label(c, c * c * peak_width * 2)
+            f.write(f"| {c:15.9f} | {spectrum_power[k]:12.2f} | {label:19s} |\n")
+
+        f.write(f"\nCONSTANTES FÍSICAS VS VIZINHAS (±{NEIGHBOUR_WINDOW * 100:.0f}% em c):\n")
+        f.write("| Constante                              | Valor          | Potência  | p (Rayleigh) | Percentil | z robusto |\n")
+        f.write("|----------------------------------------|----------------|-----------|--------------|-----------|-----------|\n")
+        for name, value, power, percentile, z_score in sorted(constants_rows, key=lambda row: -row[2]):
+            percentile_str = f"{percentile:8.2f}%" if percentile is not None else "      N/A"
+            z_str = f"{z_score:9.2f}" if z_score is not None else "      N/A"
+            f.write(f"| {name:38s} | {value:.8e} | {power:9.3f} | {np.exp(-power):.4e}   | {percentile_str} | {z_str} |\n")
+
+    plt.figure(figsize=(14, 6))
+    plt.plot(spectrum_c, spectrum_power, color='blue', linewidth=0.3)
+    for name, value, power, _, _ in constants_rows:
+        plt.axvline(value, color='red', alpha=0.3, linewidth=0.5)
+    plt.xscale('log')
+    plt.xlabel('Constante candidata c')
+    plt.ylabel('|S(c)|² / N')
+    plt.title('Espectro de Ressonância dos Zeros (constantes físicas em vermelho)')
+    plt.tight_layout()
+    plt.savefig(os.path.join(RESULTS_DIR, f"Espectro_Ressonancia_{timestamp}.png"), dpi=150)
+    plt.close()
+
+    print(f"📊 Relatório salvo: {report_file}")
+    return report_file
+
+
+def run_resonance_spectrum(c_min=SPECTRUM_C_MIN, c_max=SPECTRUM_C_MAX, n_points=None):
+    """Calcula o espectro sobre todo o store de zeros e compara as constantes físicas"""
+    print(f"🌈 ZVT ESPECTRO DE RESSONÂNCIA")
+    print("=" * 80)
+
+    zeros = load_zero_store(CACHE_FILE)
+    if zeros is None or len(zeros) == 0:
+        print(f"❌ Store de zeros não encontrado. Execute um hunter ou zvt_zero_store.py primeiro.")
+        return None
+    zero_count = len(zeros)
+    gamma_max = float(np.max(np.abs(zeros.gammas)))
+
+    needed = spectrum_points_for(c_min, c_max, gamma_max)
+    if n_points is None:
+        n_points = needed
+    if n_points < needed:
+        print(f"⚠️ Grade de {n_points:,} pontos é mais grossa que a largura dos picos ({needed:,} recomendados)")
+    spectrum = ResonanceSpectrum(c_min, c_max, n_points)
+    backend = "finufft" if FINUFFT_AVAILABLE else "espalhamento gaussiano + FFT"
+    print(f"📦 {zero_count:,} zeros | c ∈ [{c_min}, {c_max}] | {spectrum.n_points:,} pontos | NUFFT: {backend}")
+
+    start_time = time.time()
+    for block_start in range(0, zero_count, SPECTRUM_BLOCK):
+        spectrum.add(zeros[block_start:block_start + SPECTRUM_BLOCK].gammas)
+        print(f"🔬 Zeros {block_start:,} a {min(block_start + SPECTRUM_BLOCK, zero_count):,} "
+              f"- {time.time() - start_time:.1f}s")
+    spectrum_power = spectrum.power()
+    print(f"⏱️ Espectro calculado em {time.time() - start_time:.1f}s")
+
+    # Constantes físicas: soma direta exata e comparação com as vizinhas
+    spectrum_c = spectrum.constants
+    constants_rows = []
+    for name, value in physical_constants_in_range(c_min, c_max).items():
+        power = abs(direct_sum(zeros.gammas, value)) ** 2 / zero_count
+        percentile, z_score = neighbour_comparison(spectrum_c, spectrum_power, value, power)
+        constants_rows.append((name, value, power, percentile, z_score))
+
+    generate_spectrum_report(spectrum, spectrum_power, constants_rows, gamma_max)
+
+    standouts = [row for row in constants_rows if row[3] is not None and row[3] >= 99.9]
+    if standouts:
+        print(f"\n🚨 CONSTANTES ACIMA DE 99.9% DAS VIZINHAS:")
+        for name, value, power, percentile, z_score in standouts:
+            print(f"   {name} ({value:.6e}): potência {power:.2f}, percentil {percentile:.2f}%")
+    else:
+        print(f"\n📊 Nenhuma constante física se destaca das vizinhas no espaço de c")
+    return spectrum
+
+
+if __name__ == "__main__":
+    # Uso: python3 zvt_spectrum.py [c_min c_max [pontos]]
+    args = [float(a) for a in sys.argv[1:4]]
+    if len(args) >= 2:
+        run_resonance_spectrum(args[0], args[1], int(args[2]) if len(args) > 2 else None)
+    else:
+        run_resonance_spectrum()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZVT_STATISTICS.py - Estatísticas acumuladas entre lotes para os hunters ZVT
+Author: Jefferson M. Okushigue
+Date: 2025-08-12
+Guarda, por constante, as contagens de ressonâncias em cada tolerância e um
+histograma dos resíduos dobrados; cada lote é incorporado em O(lote), e os testes
+qui-quadrado/binomial/Poisson/KS saem das contagens acumuladas sem reler os zeros.
+Os p-values de todas as constantes × tolerâncias são calculados em uma única
+chamada vetorizada (batch_significance); distribuições nulas de Monte Carlo ficam
+ordenadas (EmpiricalNull) e respondem p-values por busca binária.
+"""
+
+import numpy as np
+from scipy import stats
+from zvt_kernels import folded_residuals, resolvable_tolerances
+
+KS_BINS = 8192  # Resolução do histograma de resíduos (erro do KS ≤ 1/KS_BINS)
+CHI2_MIN_EXPECTED = 5  # Qui-quadrado só é válido com esperado >= 5
+SIGNIFICANCE_LEVEL = 0.05
+CHI2_CRITICAL_05 = 3.841
+BINOM_RERR = 1 + 1e-7  # Tolerância relativa de binomtest ao comparar probabilidades
+CONFIDENCE_LEVEL = 0.95  # Intervalos de Clopper-Pearson dos p-values empíricos
+
+# Distribuições vetorizadas resolvidas uma vez: binom.pmf/cdf/sf existem em qualquer versão
+# do scipy, ao contrário de binomtest/binom_test, que além disso só aceitam escalares
+_chi2_sf = stats.chi2.sf
+_binom_pmf = stats.binom.pmf
+_binom_cdf = stats.binom.cdf
+_binom_sf = stats.binom.sf
+_poisson_sf = stats.poisson.sf
+_beta_ppf = stats.beta.ppf
+
+
+def binomial_two_sided(counts, totals, probabilities):
+    """P-value bicaudal de binomtest (soma dos resultados tão ou menos prováveis que k)
+
+    Reproduz a busca binária de scipy.stats.binomtest pelo ponto da cauda oposta,
+    mas para arrays inteiros de uma vez: cada iteração avalia a pmf de todas as
+    linhas ainda ativas, O(log n) iterações no total.
+    """
+    k, n, p = counts, totals, probabilities
+    d = _binom_pmf(k, n, p) * BINOM_RERR
+    below = k < p * n
+    # Abaixo da média a cauda oposta fica em [⌈pn⌉, n], onde a pmf decresce (busca em −pmf)
+    sign = np.where(below, -1.0, 1.0)
+    target = sign * d
+    lo = np.where(below, np.ceil(p * n), 0.0)
+    hi = np.where(below, n, np.floor(p * n))
+    found = np.full(np.shape(k), np.nan)
+    active = lo < hi
+    while active.any():
+        mid = lo + np.floor((hi - lo) / 2)
+        mid_value = sign * _binom_pmf(mid, n, p)
+        less = active & (mid_value < target)
+        more = active & (mid_value > target)
+        equal = active & ~less & ~more
+        found[equal] = mid[equal]
+        lo = np.where(less, mid + 1, lo)
+        hi = np.where(more, mid - 1, hi)
+        active &= ~equal & (lo < hi)
+    edge = np.where(sign * _binom_pmf(lo, n, p) <= target, lo, lo - 1)
+    ix = np.where(np.isnan(found), edge, found)
+    y_below = n - ix + (d == _binom_pmf(ix, n, p))
+    p_below = _binom_cdf(k, n, p) + _binom_sf(n - y_below, n, p)
+    p_above = _binom_cdf(ix, n, p) + _binom_sf(k - 1, n, p)
+    pvalue = np.where(below, p_below, p_above)
+    return np.minimum(np.where(k == p * n, 1.0, pvalue), 1.0)
+
+
+def batch_significance(counts, totals, probabilities):
+    """P-values de qui-quadrado, binomial bicaudal e Poisson para arrays de (k, n, p)
+
+    Recebe escalares ou arrays compatíveis por broadcasting e devolve um dict de
+    arrays do mesmo formato. O binomial bicaudal segue binomtest (ver
+    binomial_two_sided); probabilidades fora de [0, 1] recebem p-value neutro.
+    """
+    counts, totals, probabilities = np.broadcast_arrays(
+        np.asarray(counts, dtype=np.float64), np.asarray(totals, dtype=np.float64),
+        np.asarray(probabilities, dtype=np.float64))
+    expected = totals * probabilities
+    positive = expected > 0
+    safe_expected = np.where(positive, expected, 1.0)
+    
+    chi2_valid = expected >= CHI2_MIN_EXPECTED
+    chi2_stat = np.where(positive, (counts - expected) ** 2 / safe_expected, np.inf)
+    chi2_pvalue = np.where(chi2_valid, _chi2_sf(chi2_stat, 1), 1.0)
+    
+    binomial_valid = (probabilities >= 0) & (probabilities <= 1)
+    p_clipped = np.clip(probabilities, 0.0, 1.0)
+    binomial_pvalue = np.where(binomial_valid, binomial_two_sided(counts, totals, p_clipped), 1.0)
+    
+    poisson_pvalue = np.where(positive, _poisson_sf(counts - 1, safe_expected), 1.0)
+    
+    return {
+        'total_zeros': totals,
+        'resonant_count': counts,
+        'expected_random': expected,
+        'resonance_rate': np.where(totals > 0, counts / np.where(totals > 0, totals, 1.0), 0.0),
+        'significance_factor': np.where(positive, counts / safe_expected, np.inf),
+        'chi2_statistic': chi2_stat,
+        'chi2_p_value': chi2_pvalue,
+        'chi2_valid': chi2_valid,
+        'binomial_p_value': binomial_pvalue,
+        'binomial_valid': binomial_valid,
+        'poisson_p_value': poisson_pvalue,
+        'poisson_valid': positive,
+    }
+
+
+def significance_record(significance, row):
+    """Dict no formato de enhanced_statistical_analysis para uma linha do lote"""
+    take = lambda key: significance[key].flat[row].item()
+    results = {
+        'basic_stats': {
+            'total_zeros': int(take('total_zeros')),
+            'resonant_count': int(take('resonant_count')),
+            'expected_random': take('expected_random'),
+            'resonance_rate': take('resonance_rate'),
+            'significance_factor': take('significance_factor')
+        }
+    }
+    if take('chi2_valid'):
+        results['chi2_test'] = {
+            'statistic': take('chi2_statistic'),
+            'p_value': take('chi2_p_value'),
+            'critical_value_05': CHI2_CRITICAL_05,
+            'significant': take('chi2_statistic') > CHI2_CRITICAL_05
+        }
+    results['binomial_test'] = {
+        'p_value': take('binomial_p_value'),
+        'significant': take('binomial_p_value') < SIGNIFICANCE_LEVEL
+    }
+    if not take('binomial_valid'):
+        results['binomial_test']['invalid_probability'] = True
+    if take('poisson_valid'):
+        results['poisson_test'] = {
+            'p_value': take('poisson_p_value'),
+            'significant': take('poisson_p_value') < SIGNIFICANCE_LEVEL
+        }
+    return results
+
+
+class ResonanceAccumulator:
+    """Estatísticas suficientes de uma constante em todas as suas tolerâncias
+
+    Mantém o total de zeros vistos, a contagem de ressonâncias por tolerância e
+    um histograma de 2·resíduo/c em [0, 1] (o resíduo dobrado vai até c/2). Com relative=True as tolerâncias se
+    aplicam ao erro relativo resíduo/c. Acumuladores de lotes ou processos
+    diferentes podem ser somados com merge(). Resíduos NaN (constante abaixo do limite
+    de resolução dos gammas) não entram em nenhuma contagem.
+    """
+
+    def __init__(self, constant_value, tolerances, bins=KS_BINS, relative=False):
+        self.constant_value = constant_value
+        self.tolerances = list(tolerances)
+        self.relative = relative
+        self.total_zeros = 0
+        self.counts = dict.fromkeys(self.tolerances, 0)
+        self.histogram = np.zeros(bins, dtype=np.int64)
+
+    def update(self, gammas, resonance_counts=None):
+        """Incorpora um lote de gammas; as contagens podem vir prontas dos workers"""
+        if len(gammas) == 0:
+            return
+        self.resolve_tolerances(gammas)
+        self.add_residuals(folded_residuals(gammas, self.constant_value), resonance_counts)
+
+    def resolve_tolerances(self, gammas):
+        """Mantém só as tolerâncias que os decimais destes gammas resolvem (resolvable_tolerances)"""
+        self.tolerances = resolvable_tolerances(gammas, self.constant_value, self.tolerances, self.relative)
+        self.counts = {tolerance: self.counts.get(tolerance, 0) for tolerance in self.tolerances}
+
+    def add_residuals(self, residuals, resonance_counts=None):
+        """Incorpora resíduos dobrados já calculados (ex.: compartilhados entre famílias)"""
+        residuals = residuals[np.isfinite(residuals)]
+        scaled = residuals / self.constant_value
+        if resonance_counts is None:
+            compared = scaled if self.relative else residuals
+            resonance_counts = {tol: int(np.count_nonzero(compared < tol)) for tol in self.tolerances}
+        bins = len(self.histogram)
+        positions = np.minimum((2 * scaled * bins).astype(np.int64), bins - 1)
+        self.histogram += np.bincount(positions, minlength=bins)
+        self.total_zeros += len(residuals)
+        for tolerance, count in resonance_counts.items():
+            self.counts[tolerance] = self.counts.get(tolerance, 0) + count
+
+    def merge(self, other):
+        """Soma outro acumulador da mesma constante a este
+
+        Ficam só as tolerâncias resolvidas pelos dois (ver resolve_tolerances).
+        """
+        if self.total_zeros == 0:
+            self.tolerances = list(other.tolerances)
+        else:
+            self.tolerances = [tolerance for tolerance in self.tolerances if tolerance in other.counts]
+        self.counts = {tolerance: self.counts.get(tolerance, 0) + other.counts[tolerance]
+                       for tolerance in self.tolerances}
+        self.histogram += other.histogram
+        self.total_zeros += other.total_zeros
+        return self
+
+    def probability(self, tolerance):
+        """Probabilidade de um zero aleatório cair dentro da tolerância"""
+        return 2 * tolerance if self.relative else 2 * tolerance / self.constant_value
+
+    def ks_test(self):
+        """KS contra uniforme(0, c/2) calculado a partir do histograma acumulado
+
+        O histograma já está em 2·resíduo/c, então a referência é a uniforme
+        em [0, 1] e a estatística é avaliada nas bordas dos bins.
+        """
+        if self.total_zeros == 0:
+            return None
+        bins = len(self.histogram)
+        ecdf = np.concatenate(([0.0], np.cumsum(self.histogram) / self.total_zeros))
+        edges = np.arange(bins + 1) / bins
+        ks_stat = float(np.max(np.abs(ecdf - edges)))
+        ks_pvalue = float(stats.kstwo.sf(ks_stat, self.total_zeros))
+        return ks_stat, ks_pvalue
+
+
+class SignificanceTable:
+    """P-values acumulados de todas as constantes × tolerâncias de uma sessão
+
+    Monta os arrays (contagem, zeros vistos, probabilidade esperada) a partir
+    dos acumuladores e chama batch_significance uma única vez por lote.
+    """
+
+    def __init__(self, accumulators, min_for_ks=0):
+        self.accumulators = accumulators
+        self.min_for_ks = min_for_ks
+        self.rows = {}
+        counts, totals, probabilities = [], [], []
+        for name, accumulator in accumulators.items():
+            for tolerance, count in accumulator.counts.items():
+                self.rows[(name, tolerance)] = len(counts)
+                counts.append(count)
+                totals.append(accumulator.total_zeros)
+                probabilities.append(accumulator.probability(tolerance))
+        self.arrays = batch_significance(counts, totals, probabilities)
+        self._ks = {}
+
+    def row(self, name, tolerance):
+        """Linha da tabela para (constante, tolerância), ou None se não acumulada"""
+        return self.rows.get((name, tolerance))
+
+    def ks_test(self, name):
+        """KS da constante, calculado uma vez por tabela"""
+        if name not in self._ks:
+            accumulator = self.accumulators[name]
+            self._ks[name] = accumulator.ks_test() if accumulator.total_zeros > self.min_for_ks else None
+        return self._ks[name]
+
+    def result(self, name, tolerance):
+        """Dict de estatísticas (como enhanced_statistical_analysis) ou None sem ressonâncias"""
+        row = self.row(name, tolerance)
+        if row is None or self.arrays['resonant_count'][row] == 0 or self.arrays['total_zeros'][row] == 0:
+            return None
+        results = significance_record(self.arrays, row)
+        ks = self.ks_test(name)
+        if ks is not None:
+            results['ks_test'] = {
+                'statistic': ks[0],
+                'p_value': ks[1],
+                'significant': ks[1] < SIGNIFICANCE_LEVEL
+            }
+        return results
+
+
+def clopper_pearson(successes, trials, confidence=CONFIDENCE_LEVEL):
+    """Intervalo exato de Clopper-Pearson (inferior, superior) para proporções k/n"""
+    k = np.asarray(successes, dtype=np.float64)
+    n = np.asarray(trials, dtype=np.float64)
+    alpha = 1 - confidence
+    with np.errstate(invalid='ignore', divide='ignore'):
+        lower = np.where(k > 0, _beta_ppf(alpha / 2, k, n - k + 1), 0.0)
+        upper = np.where(k < n, _beta_ppf(1 - alpha / 2, k + 1, n - k), 1.0)
+    return lower, upper
+
+
+class EmpiricalNull:
+    """Distribuição nula de Monte Carlo ordenada uma única vez
+
+    P-values (proporção de simulações <= valor observado) e percentis saem do
+    mesmo array ordenado por busca binária, para qualquer número de valores.
+    """
+
+    def __init__(self, samples):
+        samples = np.asarray(samples, dtype=np.float64)
+        self.sorted = np.sort(samples[np.isfinite(samples)])
+
+    def __len__(self):
+        return len(self.sorted)
+
+    def count_at_most(self, values):
+        """Número de simulações com valor <= cada valor observado"""
+        return np.searchsorted(self.sorted, values, side='right')
+
+    def p_values(self, values, confidence=CONFIDENCE_LEVEL):
+        """(p-value, limite inferior, limite superior) de Clopper-Pearson para cada valor"""
+        counts = self.count_at_most(np.asarray(values, dtype=np.float64))
+        n = len(self.sorted)
+        lower, upper = clopper_pearson(counts, n, confidence)
+        return counts / max(n, 1), lower, upper
+
+    def percentiles(self, percents):
+        """Percentis com interpolação linear (como np.percentile) direto do array ordenado"""
+        positions = np.asarray(percents, dtype=np.float64) / 100 * (len(self.sorted) - 1)
+        return np.interp(positions, np.arange(len(self.sorted)), self.sorted)
+
+
+def interval_clear_of(lower, upper, thresholds):
+    """True onde o intervalo [lower, upper] não contém nenhum limiar (veredito decidido)"""
+    lower = np.asarray(lower, dtype=np.float64)
+    upper = np.asarray(upper, dtype=np.float64)
+    clear = np.ones(np.broadcast(lower, upper).shape, dtype=bool)
+    for threshold in thresholds:
+        clear &= (upper < threshold) | (lower >= threshold)
+    return clear
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZVT_TAIL_SAMPLING.py - P-values de cauda do Monte Carlo por amostragem por importância
+Author: Jefferson M. Okushigue
+Date: 2025-08-12
+Quando nenhuma simulação supera um resultado real, o p-value empírico é 0 e
+resolver p≈1e-6 exigiria milhões de simulações. As M constantes de uma simulação
+são independentes, então p = 1 − (1 − π)^M, com π = P(melhor de uma constante ≤
+limiar). π é estimado sorteando constantes perto de γ_n/k (onde o resíduo de
+algum zero é pequeno) e repesando cada sorteio pela razão f/g entre a densidade
+log-uniforme do Monte Carlo e a da proposta. Se nenhuma constante resolve o
+limiar, o p-value vem da nula fechada e é rotulado como analítico.
+"""
+
+import numpy as np
+from scipy import stats
+from zvt_kernels import decimal_step, FLOAT64_QUOTIENT_LIMIT
+from zvt_statistics import CONFIDENCE_LEVEL
+from zvt_null_model import monte_carlo_quality_cdf, best_error_p_value
+
+TAIL_DRAWS = 2000  # Sorteios por limiar (uma fração das simulações do MC)
+TAIL_DEFENSIVE = 0.1  # Fração sorteada da própria log-uniforme: pesos ≤ 1/0.1
+RESOLUTION_SAFETY = 64.0  # O float64 resolve a largura τ se (γ/c)·2⁻⁵²·64 ≤ τ
+TAIL_TILE = 1 << 22  # Elementos (constantes × zeros) por bloco ≈ 32 MB em float64
+TAIL_STREAM = 0xFFFFFFFF  # spawn_key reservada à cauda (os blocos do MC usam 0, 1, 2, ...)
+LN10 = np.log(10.0)
+
+
+def relative_width(statistic, threshold, constants):
+    """Largura τ = limiar/c do resíduo relativo: qualidade ≤ q ⇔ resíduo/c ≤ q/c"""
+    constants = np.asarray(constants, dtype=np.float64)
+    if statistic == 'quality':
+        return threshold / constants
+    return np.full(constants.shape, threshold / 100)  # 'error_percent'
+
+
+def resolved_log_min(gamma_max, statistic, threshold, log_min, log_max, decimal_step=0.0):
+    """log10 da menor constante cujo resíduo float64 resolve o limiar
+
+    Abaixo dela (constantes abaixo do passo decimal dos gammas, quociente γ/c
+    grande demais ou limiar abaixo do erro float64) os resíduos são
+    equidistribuídos na escala de τ, como na nula de zvt_null_model. log_max
+    indica que nenhuma constante resolve o limiar.
+    """
+    lowest = max(gamma_max / FLOAT64_QUOTIENT_LIMIT, decimal_step)
+    if statistic == 'quality':
+        if threshold < RESOLUTION_SAFETY * np.finfo(np.float64).eps * gamma_max:
+            return float(log_max)
+    else:
+        lowest = max(lowest, RESOLUTION_SAFETY * np.finfo(np.float64).eps * gamma_max / (threshold / 100))
+    return float(np.clip(np.log10(lowest), log_min, log_max))
+
+
+def snap_widths(gammas, k, statistic, threshold):
+    """Meia-largura em γ/c do encaixe em torno de γ_n/k (no máximo a célula inteira)"""
+    return np.minimum(0.5, relative_width(statistic, threshold, gammas / k))
+
+
+def tail_terms(gammas, constants, statistic, threshold, u_resolved, log_min, log_max,
+               sorted_gammas=None, tile_elements=TAIL_TILE):
+    """(densidade da proposta, P(melhor ≤ limiar | c)) de um lote de constantes
+
+    A densidade (em u = log10 c) da proposta de encaixe é a média sobre n do
+    termo sem encaixe e do termo da célula k = round(γ_n/c), cuja massa em u vale
+    log10((k+½)/(k−½)). Um sorteio escolhe n e c0 log-uniforme; se c0 está na
+    faixa resolvida e k = round(γ_n/c0) ≥ 1, devolve c = γ_n/(k + s) com s
+    uniforme em ±w_k, senão c0. A probabilidade é o indicador exato nos zeros
+    onde resolvido e 1 − (1 − 2τ)^N fora.
+
+    Blocos constantes × zeros de até tile_elements calculam γ/c uma vez; só os
+    pares com |γ/c − k| ≤ min(½, 2τ) (células de encaixe e candidatos a resíduo ≤
+    limiar) seguem adiante, então densidade e indicador saem do mesmo passe.
+    """
+    constants = np.asarray(constants, dtype=np.float64)
+    n_zeros = len(gammas)
+    if sorted_gammas is None:
+        sorted_gammas = np.sort(gammas)
+    tau = relative_width(statistic, threshold, constants)
+    resolved = np.log10(constants) >= u_resolved
+    with np.errstate(divide='ignore'):
+        hits = -np.expm1(n_zeros * np.log1p(-np.minimum(1.0, 2 * tau)))
+    # Termo sem encaixe: k = 0 (γ < c/2) na faixa resolvida, todos os zeros fora dela
+    unsnapped = np.where(resolved, np.searchsorted(sorted_gammas, constants / 2), n_zeros).astype(np.float64)
+    snapped = np.zeros(len(constants))
+    # A célula k ≥ 1 que contém c vai no máximo até 3c: abaixo de 10^u_resolved/3 não há massa encaixada
+    active = np.flatnonzero(3 * constants >= 10.0 ** u_resolved)
+    block = max(1, tile_elements // max(n_zeros, 1))
+    for start in range(0, len(active), block):
+        chunk = active[start:start + block]
+        values = constants[chunk, None]
+        quotients = gammas[None, :] / values
+        k = np.rint(quotients)
+        distance = quotients - k
+        np.abs(distance, out=distance)
+        rows, cols = np.nonzero(distance <= np.minimum(0.5, 2 * tau[chunk, None]))
+        del distance
+        q, k = quotients[rows, cols], k[rows, cols]
+        gamma, c = gammas[cols], values[rows, 0]
+
+        # Células de encaixe que contêm c (k ≥ 1), com massa cortada a [u_resolved, log_max]
+        widths = snap_widths(gamma, np.maximum(k, 1), statistic, threshold)
+        inside = (k >= 1) & (np.abs(q - k) <= widths)
+        log_gammas = np.log10(gamma[inside])
+        k_in = k[inside]
+        cell_low = log_gammas - np.log10(k_in + 0.5)
+        cell_high = log_gammas - np.log10(k_in - 0.5)
+        interior = (cell_low >= u_resolved) & (cell_high <= log_max)
+        # Células estreitas: log1p evita o cancelamento de cell_high − cell_low
+        masses = np.where(interior, np.log1p(1 / (k_in - 0.5)) / LN10,
+                          np.maximum(0.0, np.minimum(cell_high, log_max) - np.maximum(cell_low, u_resolved)))
+        snapped[chunk] += np.bincount(rows[inside], weights=masses * q[inside] * LN10 / (2 * widths[inside]),
+                                      minlength=len(values))
+
+        # Indicador exato: resíduo dobrado (np.mod, como best_resonances) só dos candidatos
+        residuals = np.mod(gamma, c)
+        residuals = np.minimum(residuals, c - residuals)
+        compared = residuals if statistic == 'quality' else residuals / c * 100
+        block_hits = np.bincount(rows[compared <= threshold], minlength=len(values)) > 0
+        block_resolved = resolved[chunk]
+        hits[chunk[block_resolved]] = block_hits[block_resolved]
+    return (unsnapped + snapped) / ((log_max - log_min) * n_zeros), hits
+
+
+def draw_tail_constants(rng, gammas, n_draws, statistic, threshold, u_resolved, log_min, log_max):
+    """Constantes da mistura defensiva: TAIL_DEFENSIVE da log-uniforme, o resto encaixado"""
+    constants = 10.0 ** rng.uniform(log_min, log_max, n_draws)
+    zero_choice = rng.integers(len(gammas), size=n_draws)
+    shifts = rng.uniform(-1.0, 1.0, n_draws)
+    proposal = (rng.random(n_draws) >= TAIL_DEFENSIVE) & (np.log10(constants) >= u_resolved)
+    gamma = gammas[zero_choice[proposal]]
+    k = np.rint(gamma / constants[proposal])
+    snap = k >= 1
+    widths = snap_widths(gamma[snap], k[snap], statistic, threshold)
+    snapped = constants[proposal]
+    snapped[snap] = gamma[snap] / (k[snap] + shifts[proposal][snap] * widths)
+    constants[proposal] = snapped
+    return constants
+
+
+def tail_p_value(gammas, statistic, threshold, n_constants, rng, log_min, log_max,
+                 n_draws=TAIL_DRAWS, confidence=CONFIDENCE_LEVEL):
+    """P-value de cauda do melhor entre n_constants constantes log-uniformes
+
+    statistic é 'quality' ou 'error_percent'. Devolve p, IC normal transportado de π
+    para p, erro padrão de π, tamanho efetivo da amostra (ESS) dos pesos e
+    'method': 'importance', ou 'analytic' quando nenhuma constante resolve o
+    limiar (ex.: qualidade abaixo de 64·eps·γ_max): aí os zeros não entram e o
+    p-value é a nula fechada de zvt_null_model, sem sorteios.
+    """
+    gammas = np.asarray(gammas, dtype=np.float64)
+    u_resolved = resolved_log_min(float(np.max(gammas)), statistic, threshold, log_min, log_max,
+                                  decimal_step(gammas))
+    if u_resolved >= log_max:
+        if statistic == 'quality':
+            p_value = float(monte_carlo_quality_cdf(threshold, len(gammas), n_constants, log_min, log_max))
+        else:
+            p_value = float(best_error_p_value(threshold, len(gammas), n_constants))
+        return {'p_value': p_value, 'ci': (p_value, p_value), 'pi': np.nan, 'std_error': 0.0,
+                'draws': 0, 'ess': np.nan, 'method': 'analytic'}
+    constants = draw_tail_constants(rng, gammas, n_draws, statistic, threshold, u_resolved, log_min, log_max)
+    u = np.log10(constants)
+    in_range = (u >= log_min) & (u <= log_max)
+
+    # Densidades da proposta e indicadores de todos os sorteios em blocos vetorizados
+    proposal = np.zeros(n_draws)
+    hits = np.zeros(n_draws)
+    proposal[in_range], hits[in_range] = tail_terms(gammas, constants[in_range], statistic, threshold,
+                                                    u_resolved, log_min, log_max)
+    target = in_range / (log_max - log_min)
+    weights = np.zeros(n_draws)
+    weights[in_range] = target[in_range] / (TAIL_DEFENSIVE * target[in_range] + (1 - TAIL_DEFENSIVE) * proposal[in_range])
+
+    terms = weights * hits
+    pi = float(np.mean(terms))
+    std_error = float(np.std(terms, ddof=1) / np.sqrt(n_draws))
+    z = stats.norm.ppf(0.5 + confidence / 2)
+    pi_bounds = np.clip([pi - z * std_error, pi + z * std_error], 0.0, 1.0)
+    to_p = lambda x: float(-np.expm1(n_constants * np.log1p(-min(x, 1.0)))) if x < 1 else 1.0
+    return {
+        'p_value': to_p(pi),
+        'ci': (to_p(pi_bounds[0]), to_p(pi_bounds[1])),
+        'pi': pi,
+        'std_error': std_error,
+        'draws': n_draws,
+        'ess': float(np.sum(weights) ** 2 / max(np.sum(weights ** 2), 1e-300)),
+        'method': 'importance'
+    }
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ZVT_ZERO_STORE.py - Store colunar binário dos zeros da função zeta
+Author: Jefferson M. Okushigue
+Date: 2025-08-12
+Substitui o pickle de tuplas (índice, gamma) por um arquivo little-endian com
+cabeçalho de 64 bytes, coluna int64 de índices e coluna float64 de gammas.
+Os consumidores mapeiam o arquivo em memória (zero-copy) em vez de despicklar,
+e um ZeroStore mapeado viaja para os workers só como (caminho, offset, tamanho).
+O arquivo texto original é lido em blocos de bytes com parsing vetorizado,
+em uma única passada e com progresso calculado pelo offset em bytes.
+
+Conversão única do cache antigo:
+    python3 zvt_zero_store.py [zeta_zeros_cache.pkl]
+"""
+
+import numpy as np
+import pickle
+import struct
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from zvt_kernels import zeros_as_arrays
+
+STORE_MAGIC = b'ZVTZERO1'
+STORE_VERSION = 1
+HEADER_SIZE = 64  # Mantém as colunas alinhadas em 8 bytes
+HEADER_FORMAT = '<8sIIQQ'  # magic, versão, reservado, número de zeros, bytes do arquivo de origem
+INDEX_DTYPE = np.dtype('<i8')
+GAMMA_DTYPE = np.dtype('<f8')
+ITER_CHUNK = 65536
+CHUNK_BYTES = 8 * 1024 * 1024  # Bloco de leitura do arquivo texto
+WHITESPACE_BYTES = np.frombuffer(b' \t\r\n\x0b\x0c', dtype=np.uint8)
+MAX_ATTACHED_STORES = 4  # Stores mantidos abertos por processo worker
+
+# Stores já mapeados neste processo, por (caminho, inode, mtime)
+_attached_stores = {}
+
+
+class ZeroStore:
+    """Visão colunar dos zeros que se comporta como a antiga lista de tuplas"""
+
+    def __init__(self, indices, gammas, source_bytes=0, path=None, offset=0):
+        self.indices = indices
+        self.gammas = gammas
+        self.source_bytes = source_bytes  # Bytes do arquivo texto cobertos (0 = desconhecido)
+        self.path = path  # Arquivo do store quando mapeado em memória
+        self.offset = offset  # Posição desta visão dentro do store
+
+    def __len__(self):
+        return len(self.gammas)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, _, step = key.indices(len(self))
+            path = self.path if step == 1 else None
+            return ZeroStore(self.indices[key], self.gammas[key], path=path, offset=self.offset + start)
+        return int(self.indices[key]), float(self.gammas[key])
+
+    def __reduce__(self):
+        # Mapeado de arquivo: o pickle leva só o descritor, o worker remapeia o store
+        if self.path is not None:
+            return attach_zero_store, (self.path, self.offset, len(self))
+        return ZeroStore, (np.asarray(self.indices), np.asarray(self.gammas), self.source_bytes)
+
+    def __iter__(self):
+        # Itera em blocos para não materializar 2M tuplas de uma vez
+        for start in range(0, len(self), ITER_CHUNK):
+            stop = start + ITER_CHUNK
+            yield from zip(self.indices[start:stop].tolist(), self.gammas[start:stop].tolist())
+
+
+def store_path_for(cache_file):
+    """Caminho do store colunar correspondente a um cache pickle"""
+    return os.path.splitext(cache_file)[0] + '.zvt'
+
+
+def write_zero_store(store_file, indices, gammas, source_bytes=0):
+    """Grava o store de forma atômica (arquivo temporário + rename)"""
+    indices = np.ascontiguousarray(indices, dtype=INDEX_DTYPE)
+    gammas = np.ascontiguousarray(gammas, dtype=GAMMA_DTYPE)
+    if len(indices) != len(gammas):
+        raise ValueError(f"Colunas com tamanhos diferentes: {len(indices)} vs {len(gammas)}")
+    header = struct.pack(HEADER_FORMAT, STORE_MAGIC, STORE_VERSION, 0, len(gammas), source_bytes)
+    tmp_file = f"{store_file}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(header.ljust(HEADER_SIZE, b'\0'))
+        f.write(indices.tobytes())
+        f.write(gammas.tobytes())
+    os.replace(tmp_file, store_file)
+
+
+def open_zero_store(store_file):
+    """Abre o store mapeado em memória, sem copiar os dados"""
+    with open(store_file, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE:
+        raise ValueError(f"Store truncado: {store_file}")
+    magic, version, _, count, source_bytes = struct.unpack_from(HEADER_FORMAT, header)
+    if magic != STORE_MAGIC or version != STORE_VERSION:
+        raise ValueError(f"Store com formato desconhecido: {store_file}")
+    expected_size = HEADER_SIZE + count * (INDEX_DTYPE.itemsize + GAMMA_DTYPE.itemsize)
+    if os.path.getsize(store_file) != expected_size:
+        raise ValueError(f"Store com tamanho inconsistente: {store_file}")
+    if count == 0:
+        return ZeroStore(np.empty(0, dtype=INDEX_DTYPE), np.empty(0, dtype=GAMMA_DTYPE), source_bytes)
+    indices = np.memmap(store_file, dtype=INDEX_DTYPE, mode='r',
+                        offset=HEADER_SIZE, shape=(count,))
+    gammas = np.memmap(store_file, dtype=GAMMA_DTYPE, mode='r',
+                       offset=HEADER_SIZE + count * INDEX_DTYPE.itemsize, shape=(count,))
+    return ZeroStore(indices, gammas, source_bytes, path=os.path.abspath(store_file))
+
+
+def attach_zero_store(store_file, offset, count):
+    """Fatia de um store mapeado, abrindo o arquivo uma única vez por processo"""
+    stat = os.stat(store_file)
+    key = (store_file, stat.st_ino, stat.st_mtime_ns)
+    store = _attached_stores.get(key)
+    if store is None:
+        if len(_attached_stores) >= MAX_ATTACHED_STORES:
+            _attached_stores.pop(next(iter(_attached_stores)))
+        store = open_zero_store(store_file)
+        _attached_stores[key] = store
+    return store[offset:offset + count]
+
+
+@contextmanager
+def shared_zeros(zeros):
+    """Garante uma visão mapeada de arquivo dos zeros para enviar a workers
+
+    Stores já mapeados são usados como estão; listas e arrays em memória são
+    gravados em um store temporário, removido ao sair do bloco.
+    """
+    if getattr(zeros, 'path', None) is not None:
+        yield zeros
+        return
+    indices, gammas = zeros_as_arrays(zeros)
+    fd, tmp_file = tempfile.mkstemp(prefix='zvt_shared_', suffix='.zvt')
+    os.close(fd)
+    try:
+        write_zero_store(tmp_file, indices, gammas)
+        yield open_zero_store(tmp_file)
+    finally:
+        os.remove(tmp_file)
+
+
+def _parse_lines_slow(buffer, first_line):
+    """Parsing linha a linha de um bloco com linhas inválidas (avisa cada uma)"""
+    indices, gammas = [], []
+    for line_num, line in enumerate(buffer.split(b'\n'), start=first_line + 1):
+        line = line.strip()
+        if line:
+            try:
+                gammas.append(float(line))
+                indices.append(line_num)
+            except ValueError:
+                print(f"⚠️ Linha inválida {line_num}: '{line.decode(errors='replace')}'")
+    return np.array(indices, dtype=INDEX_DTYPE), np.array(gammas, dtype=GAMMA_DTYPE)
+
+
+def _parse_lines(buffer, first_line):
+    """Converte um bloco de linhas completas em arrays (índice de linha, gamma)"""
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    newlines = np.flatnonzero(data == ord('\n'))
+    line_ends = newlines if buffer.endswith(b'\n') else np.append(newlines, len(data))
+    n_lines = len(line_ends)
+    line_starts = np.concatenate(([0], newlines + 1))[:n_lines]
+    # Caracteres não-brancos acumulados: linhas com contagem zero são vazias
+    content = np.concatenate(([0], np.cumsum(~np.isin(data, WHITESPACE_BYTES))))
+    filled = np.flatnonzero(content[line_ends] - content[line_starts] > 0)
+    tokens = buffer.split()
+    try:
+        if len(tokens) != len(filled):  # Alguma linha com mais de um campo
+            raise ValueError
+        gammas = np.array(tokens).astype(GAMMA_DTYPE)
+    except ValueError:
+        indices, gammas = _parse_lines_slow(buffer, first_line)
+        return indices, gammas, n_lines
+    return (first_line + 1 + filled).astype(INDEX_DTYPE), gammas, n_lines
+
+
+def iter_zero_file_chunks(filename, chunk_bytes=CHUNK_BYTES):
+    """Lê o arquivo texto em blocos: yield (índices, gammas, bytes lidos, tamanho do arquivo)
+
+    Os índices são os números de linha (base 1), como no formato (índice, valor)
+    dos caches antigos; linhas vazias contam mas não geram zeros.
+    """
+    file_size = os.path.getsize(filename)
+    line_offset = 0
+    remainder = b''
+    with open(filename, 'rb') as f:
+        while True:
+            block = f.read(chunk_bytes)
+            at_eof = not block
+            buffer = remainder + block
+            remainder = b''
+            if not at_eof:
+                # Só processa linhas completas; o resto vai para o próximo bloco
+                cut = buffer.rfind(b'\n') + 1
+                if cut == 0:
+                    remainder = buffer
+                    continue
+                buffer, remainder = buffer[:cut], buffer[cut:]
+            if buffer:
+                indices, gammas, n_lines = _parse_lines(buffer, line_offset)
+                line_offset += n_lines
+                bytes_read = f.tell() - len(remainder)
+                yield indices, gammas, bytes_read, file_size
+            if at_eof:
+                break
+
+
+def iter_zero_file_batches(filename, batch_size, chunk_bytes=CHUNK_BYTES):
+    """Reagrupa os blocos do arquivo em lotes de batch_size zeros: yield (lote, bytes lidos, tamanho)
+
+    Permite que a análise comece antes do arquivo terminar de ser lido.
+    """
+    pending_indices, pending_gammas = [], []
+    pending = 0
+    previous_bytes = 0
+    file_size = os.path.getsize(filename)
+    for indices, gammas, bytes_read, file_size in iter_zero_file_chunks(filename, chunk_bytes):
+        carried = pending
+        pending_indices.append(indices)
+        pending_gammas.append(gammas)
+        pending += len(gammas)
+        if pending >= batch_size:
+            all_indices = np.concatenate(pending_indices)
+            all_gammas = np.concatenate(pending_gammas)
+            n_full = (pending // batch_size) * batch_size
+            for start in range(0, n_full, batch_size):
+                stop = start + batch_size
+                # Offset interpolado dentro do bloco atual, para progresso contínuo
+                consumed = (stop - carried) / len(gammas)
+                batch_bytes = int(previous_bytes + (bytes_read - previous_bytes) * consumed)
+                yield ZeroStore(all_indices[start:stop], all_gammas[start:stop]), batch_bytes, file_size
+            pending_indices, pending_gammas = [all_indices[n_full:]], [all_gammas[n_full:]]
+            pending = len(all_gammas) - n_full
+        previous_bytes = bytes_read
+    if pending > 0:
+        yield (ZeroStore(np.concatenate(pending_indices), np.concatenate(pending_gammas)),
+               file_size, file_size)
+
+
+def read_zero_file(filename, should_stop=None, chunk_bytes=CHUNK_BYTES):
+    """Lê o arquivo texto inteiro em um ZeroStore, com progresso por offset em bytes"""
+    index_chunks, gamma_chunks = [], []
+    loaded = 0
+    source_bytes = 0
+    for indices, gammas, bytes_read, file_size in iter_zero_file_chunks(filename, chunk_bytes):
+        if should_stop is not None and should_stop():
+            break
+        index_chunks.append(indices)
+        gamma_chunks.append(gammas)
+        loaded += len(gammas)
+        source_bytes = bytes_read
+        percent = (bytes_read / file_size) * 100 if file_size > 0 else 100.0
+        print(f"📈 Carregados {loaded:,} zeros ({percent:.1f}%)")
+    if not gamma_chunks:
+        return ZeroStore(np.empty(0, dtype=INDEX_DTYPE), np.empty(0, dtype=GAMMA_DTYPE))
+    return ZeroStore(np.concatenate(index_chunks), np.concatenate(gamma_chunks), source_bytes)
+
+
+def convert_pickle_cache(cache_file, store_file=None):
+    """Conversão única do cache pickle (lista de tuplas) para o store colunar"""
+    if store_file is None:
+        store_file = store_path_for(cache_file)
+    with open(cache_file, 'rb') as f:
+        zeros = pickle.load(f)
+    table = np.asarray(zeros, dtype=np.float64).reshape(-1, 2)
+    write_zero_store(store_file, table[:, 0].astype(INDEX_DTYPE), table[:, 1])
+    return store_file
+
+
+def load_zero_store(cache_file):
+    """Carrega o store colunar, convertendo o pickle uma única vez se necessário
+
+    Devolve None só quando não há store nem pickle; um store truncado ou um
+    pickle corrompido levanta a exceção, para o chamador reconstruir a partir
+    do arquivo texto.
+    """
+    store_file = store_path_for(cache_file)
+    if not os.path.exists(store_file):
+        if not os.path.exists(cache_file):
+            return None
+        print(f"🔄 Convertendo {cache_file} para store colunar...")
+        convert_pickle_cache(cache_file, store_file)
+        print(f"💾 Store colunar criado: {store_file}")
+    return open_zero_store(store_file)
+
+
+def main():
+    """Converte o cache pickle indicado (ou o padrão) para o store colunar"""
+    cache_file = sys.argv[1] if len(sys.argv) > 1 else "zeta_zeros_cache.pkl"
+    if not os.path.exists(cache_file):
+        print(f"❌ Cache não encontrado: {cache_file}")
+        return
+    store_file = convert_pickle_cache(cache_file)
+    store = open_zero_store(store_file)
+    print(f"✅ {len(store):,} zeros gravados em {store_file}")
+
+
+if __name__ == "__main__":
+    main()